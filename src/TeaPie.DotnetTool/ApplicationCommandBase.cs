@@ -5,7 +5,10 @@ namespace TeaPie.DotnetTool;
 internal abstract class ApplicationCommandBase<TSettings> : AsyncCommand<TSettings> where TSettings : LoggingSettings
 {
     public override async Task<int> ExecuteAsync(CommandContext context, TSettings settings)
-        => await BuildApplication(settings).Run(new CancellationToken());
+    {
+        await using var application = BuildApplication(settings);
+        return await application.Run(new CancellationToken());
+    }
 
     protected Application BuildApplication(TSettings settings)
         => ConfigureApplication(settings).Build();
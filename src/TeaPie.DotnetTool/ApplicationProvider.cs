@@ -24,6 +24,7 @@ internal static class ApplicationProvider
     {
         AddInitCommand(config);
         AddTestCommand(config);
+        AddBenchCommand(config);
         AddGenerateCommand(config);
         AddExploreCommand(config);
         AddScriptCompilationCommand(config);
@@ -58,6 +59,15 @@ internal static class ApplicationProvider
             .WithExample("test", "\"path\\to\\collection\"")
             .WithExample("t", "\"path\\to\\collection\"");
 
+    private static void AddBenchCommand(IConfigurator config)
+        => config.AddCommand<BenchCommand>("bench")
+            .WithAlias("b")
+            .WithDescription("Runs the collection (or test case) at the specified path repeatedly and reports " +
+            "throughput and latency of each request. If no path is provided, the current directory is used.")
+            .WithExample("bench", "[pathToCollection]")
+            .WithExample("bench", "\"path\\to\\collection\"", "--iterations", "100", "--concurrency", "10")
+            .WithExample("b", "\"path\\to\\collection\"", "--duration", "60", "-r", "\"bench.json\"");
+
     private static void AddInitCommand(IConfigurator config)
         => config.AddCommand<InitCommand>("init")
             .WithAlias("i")
@@ -0,0 +1,116 @@
+﻿using Spectre.Console.Cli;
+using System.ComponentModel;
+using TeaPie.StructureExploration.Paths;
+
+namespace TeaPie.DotnetTool;
+
+internal sealed class BenchCommand : ApplicationCommandBase<BenchCommand.Settings>
+{
+    protected override ApplicationBuilder ConfigureApplication(Settings settings)
+    {
+        var pathToLogFile = settings.LogFile ?? string.Empty;
+        var logLevel = Helper.ResolveLogLevel(settings);
+        var path = PathResolver.Resolve(settings.Path, Directory.GetCurrentDirectory());
+        var pathToRequestsLogFile = settings.RequestsLogFile ?? string.Empty;
+
+        var appBuilder = ApplicationBuilder.Create(path.IsCollectionPath());
+
+        appBuilder
+            .WithPath(path)
+            .WithTemporaryPath(settings.TemporaryPath ?? string.Empty)
+            .WithLogging(logLevel, pathToLogFile, settings.LogFileLogLevel, pathToRequestsLogFile, settings.UseTreeLogging)
+            .WithEnvironment(settings.Environment ?? string.Empty)
+            .WithEnvironmentFile(PathResolver.Resolve(settings.EnvironmentFilePath, string.Empty))
+            .WithInitializationScript(PathResolver.Resolve(settings.InitializationScriptPath, string.Empty))
+            .WithVariablesCaching(!settings.NoVariablesCaching)
+            .WithNuGetPackagesResolution(settings.Offline, PathResolver.Resolve(settings.NuGetFeedPath, string.Empty))
+            .WithTracing(PathResolver.Resolve(settings.TraceFilePath, string.Empty), settings.DisplayTimings)
+            .WithBenchmarkPipeline(
+                settings.Iterations ?? (settings.Duration is null ? Settings.DefaultIterations : 0),
+                TimeSpan.FromSeconds(settings.Duration ?? 0),
+                settings.Concurrency,
+                PathResolver.Resolve(settings.ReportFilePath, string.Empty));
+
+        return appBuilder;
+    }
+
+    public sealed class Settings : LoggingSettings
+    {
+        public const int DefaultIterations = 10;
+
+        [CommandArgument(0, "[path]")]
+        [Description("Path to the collection, test case (.http) or single-file test case (.tp) which will be " +
+            "benchmarked. Defaults to the current directory.")]
+        public string? Path { get; init; }
+
+        [CommandOption("-n|--iterations")]
+        [Description("Number of times the whole collection (or test case) is executed. " +
+            "Defaults to 10, if neither iterations nor duration is provided.")]
+        public int? Iterations { get; init; }
+
+        [CommandOption("--duration")]
+        [Description("Duration of the benchmark in seconds. No new iteration is started after the duration elapses. " +
+            "If combined with iterations, the benchmark ends when the first of the limits is reached.")]
+        public int? Duration { get; init; }
+
+        [CommandOption("-c|--concurrency")]
+        [DefaultValue(1)]
+        [Description("Maximal number of test cases, which are executed at the same time. " +
+            "Test cases executed concurrently have their own test-case variables, so they should not depend " +
+            "on each other.")]
+        public int Concurrency { get; init; }
+
+        [CommandOption("--temp-path")]
+        [Description("Temporary path for the application. Defaults to the system's temporary folder with a TeaPie sub-folder " +
+            "if no path is provided.")]
+        public string? TemporaryPath { get; init; }
+
+        [CommandOption("-e|--env|--environment")]
+        [Description("Name of the environment on which application will be run.")]
+        public string? Environment { get; init; }
+
+        [CommandOption("--env-file|--environment-file")]
+        [Description("Path to file, which contains definitions of available environments. If not provided, " +
+            "the tool will use the first matching 'env.json' file found in '.teapie' folder or the collection " +
+            "(respectively parent folder of test case).")]
+        public string? EnvironmentFilePath { get; init; }
+
+        [CommandOption("-r|--report-file")]
+        [Description("Path to file, which will be used for benchmark report generation. Files with '.json' " +
+            "extension get JSON report, all others get JUnit XML report. If this option is not used, " +
+            "no report to file is generated.")]
+        public string? ReportFilePath { get; init; }
+
+        [CommandOption("-i|--init-script|--initialization-script")]
+        [Description("Path to script, which will be used for initialization before the first iteration. " +
+            "If not provided, the tool will use the first matching 'init.csx' file found in '.teapie' folder or the collection" +
+            " (respectively parent folder of test case).")]
+        public string? InitializationScriptPath { get; init; }
+
+        [CommandOption("--no-cache-vars|--no-cache-variables")]
+        [DefaultValue(false)]
+        [Description("Disables loading variables from file and caching them to file.")]
+        public bool NoVariablesCaching { get; init; }
+
+        [CommandOption("--trace-file")]
+        [Description("Path to file, to which the trace of the run (every pipeline step and every phase of HTTP " +
+            "requests) is exported in Chrome trace event format. It can be opened in 'chrome://tracing', Perfetto " +
+            "or speedscope.")]
+        public string? TraceFilePath { get; init; }
+
+        [CommandOption("--timings")]
+        [DefaultValue(false)]
+        [Description("Displays table of the slowest pipeline steps after the test results.")]
+        public bool DisplayTimings { get; init; }
+
+        [CommandOption("--offline")]
+        [DefaultValue(false)]
+        [Description("NuGet packages are never downloaded from nuget.org. They are restored from the lock file in " +
+            "the cache or from the local feed. Run fails if a package is not available.")]
+        public bool Offline { get; init; }
+
+        [CommandOption("--nuget-feed")]
+        [Description("Path to folder with NuGet packages (.nupkg), which is searched before nuget.org.")]
+        public string? NuGetFeedPath { get; init; }
+    }
+}
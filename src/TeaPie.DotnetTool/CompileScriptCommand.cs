@@ -1,4 +1,4 @@
-using Spectre.Console;
+﻿using Spectre.Console;
 using Spectre.Console.Cli;
 using System.ComponentModel;
 using TeaPie.Reporting;
@@ -21,6 +21,7 @@ internal class CompileScriptCommand : ApplicationCommandBase<CompileScriptComman
             .WithPath(path)
             .WithTemporaryPath(string.Empty)
             .WithScriptCompilationPipeline(path)
+            .WithNuGetPackagesResolution(settings.Offline, PathResolver.Resolve(settings.NuGetFeedPath, string.Empty))
             .WithLogging(logLevel, pathToLogFile, settings.LogFileLogLevel);
 
         return appBuilder;
@@ -32,7 +33,8 @@ internal class CompileScriptCommand : ApplicationCommandBase<CompileScriptComman
 
         if (!path.IsTpFile())
         {
-            var result = await BuildApplication(settings).Run(CancellationToken.None);
+            await using var application = BuildApplication(settings);
+            var result = await application.Run(CancellationToken.None);
             InterpretResult(result);
             return result;
         }
@@ -90,11 +92,12 @@ internal class CompileScriptCommand : ApplicationCommandBase<CompileScriptComman
         AnsiConsole.Markup($"  [grey]Compiling section:[/] [white]{label.EscapeMarkup()}[/] ... ");
 
         var logLevel = Helper.ResolveLogLevel(settings);
-        var app = ApplicationBuilder.Create(false)
+        await using var app = ApplicationBuilder.Create(false)
             .WithPath(tpPath)
             .WithTemporaryPath(string.Empty)
             .WithScriptCompilationPipeline(tpPath)
             .WithScriptContent(scriptContent)
+            .WithNuGetPackagesResolution(settings.Offline, PathResolver.Resolve(settings.NuGetFeedPath, string.Empty))
             .WithLogging(logLevel, settings.LogFile ?? string.Empty, settings.LogFileLogLevel)
             .Build();
 
@@ -139,5 +142,15 @@ internal class CompileScriptCommand : ApplicationCommandBase<CompileScriptComman
         [CommandArgument(0, "<path>")]
         [Description("Path to script (.csx) or test case file (.tp) which should be compiled.")]
         public string? Path { get; init; }
+
+        [CommandOption("--offline")]
+        [DefaultValue(false)]
+        [Description("NuGet packages are never downloaded from nuget.org. They are restored from the lock file in " +
+            "the cache or from the local feed. Run fails if a package is not available.")]
+        public bool Offline { get; init; }
+
+        [CommandOption("--nuget-feed")]
+        [Description("Path to folder with NuGet packages (.nupkg), which is searched before nuget.org.")]
+        public string? NuGetFeedPath { get; init; }
     }
 }
@@ -1,11 +1,40 @@
 ﻿using Spectre.Console.Cli;
 using System.ComponentModel;
 using TeaPie.StructureExploration.Paths;
+using TeaPie.Watching;
 
 namespace TeaPie.DotnetTool;
 
 internal sealed class TestCommand : ApplicationCommandBase<TestCommand.Settings>
 {
+    public override async Task<int> ExecuteAsync(CommandContext context, Settings settings)
+    {
+        if (!settings.Watch)
+        {
+            return await base.ExecuteAsync(context, settings);
+        }
+
+        using var cancellationTokenSource = new CancellationTokenSource();
+        void OnCancelKeyPress(object? sender, ConsoleCancelEventArgs e)
+        {
+            e.Cancel = true;
+            cancellationTokenSource.Cancel();
+        }
+
+        Console.CancelKeyPress += OnCancelKeyPress;
+        try
+        {
+            var runner = new WatchModeRunner(
+                testCasesFiles => ConfigureApplication(settings).WithTestCasesFilter(testCasesFiles).Build());
+
+            return await runner.Run(cancellationTokenSource.Token);
+        }
+        finally
+        {
+            Console.CancelKeyPress -= OnCancelKeyPress;
+        }
+    }
+
     protected override ApplicationBuilder ConfigureApplication(Settings settings)
     {
         var pathToLogFile = settings.LogFile ?? string.Empty;
@@ -24,6 +53,9 @@ internal sealed class TestCommand : ApplicationCommandBase<TestCommand.Settings>
             .WithReportFile(PathResolver.Resolve(settings.ReportFilePath, string.Empty))
             .WithInitializationScript(PathResolver.Resolve(settings.InitializationScriptPath, string.Empty))
             .WithVariablesCaching(!settings.NoVariablesCaching)
+            .WithParallelExecution(settings.MaxDegreeOfParallelism)
+            .WithNuGetPackagesResolution(settings.Offline, PathResolver.Resolve(settings.NuGetFeedPath, string.Empty))
+            .WithTracing(PathResolver.Resolve(settings.TraceFilePath, string.Empty), settings.DisplayTimings)
             .WithDefaultPipeline();
 
         return appBuilder;
@@ -65,5 +97,40 @@ internal sealed class TestCommand : ApplicationCommandBase<TestCommand.Settings>
         [DefaultValue(false)]
         [Description("Disables loading variables from file and caching them to file.")]
         public bool NoVariablesCaching { get; init; }
+
+        [CommandOption("--parallel")]
+        [DefaultValue(1)]
+        [Description("Maximal number of test cases within the same collection, which are executed at the same time. " +
+            "Test cases executed in parallel have their own test-case variables, so they should not depend on each other.")]
+        public int MaxDegreeOfParallelism { get; init; }
+
+        [CommandOption("--trace-file")]
+        [Description("Path to file, to which the trace of the run (every pipeline step and every phase of HTTP " +
+            "requests) is exported in Chrome trace event format. It can be opened in 'chrome://tracing', Perfetto " +
+            "or speedscope.")]
+        public string? TraceFilePath { get; init; }
+
+        [CommandOption("--timings")]
+        [DefaultValue(false)]
+        [Description("Displays table of the slowest pipeline steps after the test results.")]
+        public bool DisplayTimings { get; init; }
+
+        [CommandOption("--offline")]
+        [DefaultValue(false)]
+        [Description("NuGet packages are never downloaded from nuget.org. They are restored from the lock file in " +
+            "the cache or from the local feed. Run fails if a package is not available.")]
+        public bool Offline { get; init; }
+
+        [CommandOption("--nuget-feed")]
+        [Description("Path to folder with NuGet packages (.nupkg), which is searched before nuget.org.")]
+        public string? NuGetFeedPath { get; init; }
+
+        [CommandOption("-w|--watch")]
+        [DefaultValue(false)]
+        [Description("After the run, the tool keeps watching files of the collection (or test case). Whenever " +
+            "'.http', '.tp' or '.csx' file changes, only test cases affected by the change (including changes of " +
+            "scripts referenced by '#load' directives) are executed again. Change of the environment file or " +
+            "initialization script executes all test cases.")]
+        public bool Watch { get; init; }
     }
 }
@@ -1,16 +1,34 @@
-﻿namespace TeaPie;
+﻿using Microsoft.Extensions.DependencyInjection;
+using Serilog;
 
-public sealed class Application
+namespace TeaPie;
+
+/// <summary>
+/// Application owns the service provider it was built with, so disposing it releases all its services (e.g. open
+/// log files or listeners of activities).
+/// </summary>
+public sealed class Application : IAsyncDisposable
 {
     private readonly ApplicationPipeline _pipeline;
     private readonly ApplicationContext _appContext;
+    private readonly ServiceProvider _serviceProvider;
 
-    internal Application(ApplicationPipeline pipeline, ApplicationContext applicationContext)
+    internal Application(
+        ApplicationPipeline pipeline, ApplicationContext applicationContext, ServiceProvider serviceProvider)
     {
         _pipeline = pipeline;
         _appContext = applicationContext;
+        _serviceProvider = serviceProvider;
     }
 
+    internal ApplicationContext Context => _appContext;
+
     public async Task<int> Run(CancellationToken cancellationToken = default)
         => await _pipeline.Run(_appContext, cancellationToken);
+
+    public async ValueTask DisposeAsync()
+    {
+        await _serviceProvider.DisposeAsync();
+        await Log.CloseAndFlushAsync();
+    }
 }
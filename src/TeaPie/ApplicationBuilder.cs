@@ -1,5 +1,6 @@
-using Microsoft.Extensions.DependencyInjection;
+﻿using Microsoft.Extensions.DependencyInjection;
 using Microsoft.Extensions.Logging;
+using TeaPie.Benchmarking;
 using TeaPie.Functions;
 using TeaPie.Http.Auth;
 using TeaPie.Http.Retrying;
@@ -9,6 +10,7 @@ using TeaPie.Reporting;
 using TeaPie.Scripts;
 using TeaPie.TestCases;
 using TeaPie.Testing;
+using TeaPie.Tracing;
 using TeaPie.Variables;
 
 namespace TeaPie;
@@ -35,6 +37,12 @@ public sealed class ApplicationBuilder
     private string _pathToRequestsLogFile = string.Empty;
 
     private bool _variablesCaching = true;
+    private int _maxDegreeOfParallelism = 1;
+    private BenchmarkOptions? _benchmark;
+    private string _traceFilePath = string.Empty;
+    private bool _displaySlowestSteps;
+    private NuGetOptions? _nuGet;
+    private IReadOnlyCollection<string> _testCasesFilter = [];
     private bool _useTreeLogging = false;
 
     private Func<IServiceProvider, IPipelineStep[]> _pipelineBuildFunction = ApplicationStepsFactory.CreateDefaultPipelineSteps;
@@ -86,6 +94,30 @@ public sealed class ApplicationBuilder
         return this;
     }
 
+    /// <summary>
+    /// Whole collection (or test case) is executed repeatedly - until <paramref name="iterations"/> are finished or
+    /// <paramref name="duration"/> elapses (whichever limit is set and reached first), while at most
+    /// <paramref name="concurrency"/> test cases run at the same time. Latencies of all requests are measured and
+    /// reported at the end of the run.
+    /// </summary>
+    /// <param name="reportFilePath">Path to the benchmark report. If it has '.json' extension, JSON report is written,
+    /// otherwise JUnit XML report is written. If empty, results are reported only to the console.</param>
+    public ApplicationBuilder WithBenchmarkPipeline(
+        int iterations,
+        TimeSpan duration,
+        int concurrency = 1,
+        string reportFilePath = "")
+    {
+        if (iterations <= 0 && duration <= TimeSpan.Zero)
+        {
+            iterations = 1;
+        }
+
+        _benchmark = new BenchmarkOptions(iterations, duration, concurrency, reportFilePath);
+        _pipelineBuildFunction = ApplicationStepsFactory.CreateBenchmarkPipelineSteps;
+        return this;
+    }
+
     public ApplicationBuilder WithScriptCompilationPipeline(string scriptPath)
     {
         _scriptPath = scriptPath;
@@ -129,18 +161,70 @@ public sealed class ApplicationBuilder
         return this;
     }
 
+    /// <summary>
+    /// Test cases within the same collection are executed by at most <paramref name="maxDegreeOfParallelism"/> workers
+    /// at the same time, while collections are still executed one after another.
+    /// </summary>
+    public ApplicationBuilder WithParallelExecution(int maxDegreeOfParallelism)
+    {
+        _maxDegreeOfParallelism = maxDegreeOfParallelism;
+        return this;
+    }
+
+    /// <summary>
+    /// Every pipeline step (grouped by test cases and requests) and every phase of HTTP requests is traced.
+    /// </summary>
+    /// <param name="traceFilePath">Path to the file, to which the trace is exported in Chrome trace event format
+    /// (viewable in 'chrome://tracing', Perfetto or speedscope). If empty, no trace file is written.</param>
+    /// <param name="displaySlowestSteps">Whether table of the slowest steps is displayed after test results.</param>
+    public ApplicationBuilder WithTracing(string traceFilePath = "", bool displaySlowestSteps = false)
+    {
+        _traceFilePath = traceFilePath;
+        _displaySlowestSteps = displaySlowestSteps;
+        return this;
+    }
+
+    /// <summary>
+    /// Configures how NuGet packages (default ones and those from <c>#nuget</c> directives) are resolved. Resolved
+    /// dependency graphs are always locked in the cache, so that following runs don't need any feed.
+    /// </summary>
+    /// <param name="offline">If <c>true</c>, packages are never downloaded from nuget.org. Run fails, if package is
+    /// neither locked in the cache nor available in <paramref name="localFeedPath"/>.</param>
+    /// <param name="localFeedPath">Folder with <c>.nupkg</c> files, which is searched before nuget.org.</param>
+    public ApplicationBuilder WithNuGetPackagesResolution(bool offline, string localFeedPath = "")
+    {
+        _nuGet = new NuGetOptions(offline, localFeedPath);
+        return this;
+    }
+
+    /// <summary>
+    /// Only test cases defined in given files (<c>.http</c> or <c>.tp</c>) are explored and executed. Other files of
+    /// the collection (environment file, initialization script) are still used.
+    /// </summary>
+    /// <param name="testCasesPaths">Paths to files with test cases. If empty, all test cases are executed.</param>
+    public ApplicationBuilder WithTestCasesFilter(IEnumerable<string> testCasesPaths)
+    {
+        _testCasesFilter = [.. testCasesPaths];
+        return this;
+    }
+
     public Application Build()
     {
         ConfigureServices();
         var provider = _services.BuildServiceProvider();
 
+        if (!string.IsNullOrEmpty(_traceFilePath))
+        {
+            provider.GetRequiredService<IActivityRecorder>().Start();
+        }
+
         var applicationContext = GetApplicationContext(provider);
 
         CreateUserContext(provider, applicationContext);
 
         var pipeline = BuildPipeline(provider);
 
-        return new Application(pipeline, applicationContext);
+        return new Application(pipeline, applicationContext, provider);
     }
 
     private ApplicationContext GetApplicationContext(IServiceProvider provider)
@@ -152,6 +236,11 @@ public sealed class ApplicationBuilder
             .SetReportFilePath(_reportFilePath)
             .SetInitializationScriptPath(_initializationScriptPath)
             .SetVariablesCaching(_variablesCaching)
+            .SetMaxDegreeOfParallelism(_maxDegreeOfParallelism)
+            .SetBenchmark(_benchmark)
+            .SetTracing(_traceFilePath, _displaySlowestSteps)
+            .SetNuGet(_nuGet)
+            .SetTestCasesFilter(_testCasesFilter)
             .Build();
 
         return new ApplicationContext(
@@ -1,5 +1,8 @@
 ﻿using Microsoft.Extensions.Logging;
+using TeaPie.Benchmarking;
+using TeaPie.Pipelines;
 using TeaPie.Reporting;
+using TeaPie.Scripts;
 using TeaPie.StructureExploration;
 using TeaPie.StructureExploration.Paths;
 using TeaPie.TestCases;
@@ -27,6 +30,18 @@ internal class ApplicationContext(
 
     public bool CacheVariables = options.CacheVariables;
 
+    public readonly int MaxDegreeOfParallelism = options.MaxDegreeOfParallelism;
+
+    public readonly BenchmarkOptions? Benchmark = options.Benchmark;
+
+    public readonly string TraceFilePath = options.TraceFilePath;
+
+    public readonly bool DisplaySlowestSteps = options.DisplaySlowestSteps;
+
+    public readonly NuGetOptions NuGet = options.NuGet;
+
+    public readonly IReadOnlyCollection<string> TestCasesFilter = options.TestCasesFilter;
+
     public string StructureName => System.IO.Path.GetFileNameWithoutExtension(Path).TrimSuffix(Constants.RequestSuffix);
 
     public string TeaPieFolderPath { get; internal set; } = string.Empty;
@@ -34,9 +49,9 @@ internal class ApplicationContext(
     public IReadOnlyCollectionStructure CollectionStructure { get; set; } = new CollectionStructure();
     public IReadOnlyCollection<TestCase> TestCases => CollectionStructure.TestCases;
 
-    private readonly Dictionary<string, Script> _userDefinedScripts = [];
-    public IReadOnlyDictionary<string, Script> UserDefinedScripts => _userDefinedScripts;
-    public void RegisterUserDefinedScript(string path, Script script) => _userDefinedScripts.Add(path, script);
+    private readonly BranchLocal<Dictionary<string, Script>> _userDefinedScripts = new(() => []);
+    public IReadOnlyDictionary<string, Script> UserDefinedScripts => _userDefinedScripts.Value;
+    public void RegisterUserDefinedScript(string path, Script script) => _userDefinedScripts.Value.Add(path, script);
 
     public ILogger Logger { get; set; } = logger;
 
@@ -1,4 +1,7 @@
-﻿namespace TeaPie;
+﻿using TeaPie.Benchmarking;
+using TeaPie.Scripts;
+
+namespace TeaPie;
 
 internal class ApplicationContextOptions(
     string? tempPath = null,
@@ -6,7 +9,13 @@ internal class ApplicationContextOptions(
     string? environmentFilePath = null,
     string? reportFilePath = null,
     string? initializationScriptPath = null,
-    bool cacheVariables = true)
+    bool cacheVariables = true,
+    int maxDegreeOfParallelism = 1,
+    BenchmarkOptions? benchmark = null,
+    string? traceFilePath = null,
+    bool displaySlowestSteps = false,
+    NuGetOptions? nuGet = null,
+    IReadOnlyCollection<string>? testCasesFilter = null)
 {
     public string TempFolderPath { get; set; } = tempPath ?? string.Empty;
     public string Environment { get; set; } = environment ?? string.Empty;
@@ -14,4 +23,10 @@ internal class ApplicationContextOptions(
     public string ReportFilePath { get; set; } = reportFilePath ?? string.Empty;
     public string InitializationScriptPath { get; set; } = initializationScriptPath ?? string.Empty;
     public bool CacheVariables { get; set; } = cacheVariables;
+    public int MaxDegreeOfParallelism { get; set; } = maxDegreeOfParallelism;
+    public BenchmarkOptions? Benchmark { get; set; } = benchmark;
+    public string TraceFilePath { get; set; } = traceFilePath ?? string.Empty;
+    public bool DisplaySlowestSteps { get; set; } = displaySlowestSteps;
+    public NuGetOptions NuGet { get; set; } = nuGet ?? new();
+    public IReadOnlyCollection<string> TestCasesFilter { get; set; } = testCasesFilter ?? [];
 }
@@ -1,4 +1,7 @@
-﻿namespace TeaPie;
+﻿using TeaPie.Benchmarking;
+using TeaPie.Scripts;
+
+namespace TeaPie;
 
 internal class ApplicationContextOptionsBuilder
 {
@@ -8,6 +11,12 @@ internal class ApplicationContextOptionsBuilder
     private string _reportFilePath = string.Empty;
     private string _initializationScriptPath = string.Empty;
     private bool _variablesCaching = true;
+    private int _maxDegreeOfParallelism = 1;
+    private BenchmarkOptions? _benchmark;
+    private string _traceFilePath = string.Empty;
+    private bool _displaySlowestSteps;
+    private NuGetOptions _nuGet = new();
+    private IReadOnlyCollection<string> _testCasesFilter = [];
 
     public ApplicationContextOptionsBuilder SetTempFolderPath(string? tempPath)
     {
@@ -45,6 +54,37 @@ internal class ApplicationContextOptionsBuilder
         return this;
     }
 
+    public ApplicationContextOptionsBuilder SetMaxDegreeOfParallelism(int maxDegreeOfParallelism)
+    {
+        _maxDegreeOfParallelism = Math.Max(1, maxDegreeOfParallelism);
+        return this;
+    }
+
+    public ApplicationContextOptionsBuilder SetBenchmark(BenchmarkOptions? benchmark)
+    {
+        _benchmark = benchmark;
+        return this;
+    }
+
+    public ApplicationContextOptionsBuilder SetTracing(string? traceFilePath, bool displaySlowestSteps)
+    {
+        _traceFilePath = traceFilePath ?? string.Empty;
+        _displaySlowestSteps = displaySlowestSteps;
+        return this;
+    }
+
+    public ApplicationContextOptionsBuilder SetNuGet(NuGetOptions? nuGet)
+    {
+        _nuGet = nuGet ?? new();
+        return this;
+    }
+
+    public ApplicationContextOptionsBuilder SetTestCasesFilter(IEnumerable<string>? testCasesPaths)
+    {
+        _testCasesFilter = [.. testCasesPaths ?? []];
+        return this;
+    }
+
     public ApplicationContextOptions Build()
     {
         return new ApplicationContextOptions(
@@ -53,7 +93,13 @@ internal class ApplicationContextOptionsBuilder
             _environmentFilePath,
             _reportFilePath,
             _initializationScriptPath,
-            _variablesCaching
+            _variablesCaching,
+            _maxDegreeOfParallelism,
+            _benchmark,
+            _traceFilePath,
+            _displaySlowestSteps,
+            _nuGet,
+            _testCasesFilter
         );
     }
 }
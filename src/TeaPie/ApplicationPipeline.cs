@@ -2,17 +2,40 @@
 using Spectre.Console;
 using TeaPie.Logging;
 using TeaPie.Pipelines;
+using TeaPie.Tracing;
 
 namespace TeaPie;
 
-internal class ApplicationPipeline : IPipeline
+internal class ApplicationPipeline(IStepsTracer tracer) : IPipeline
 {
+    private readonly IStepsTracer _tracer = tracer;
     private readonly StepsCollection _pipelineSteps = [];
     private IPipelineStep? _currentStep;
 
+    private IPipelineStep? CurrentStep
+    {
+        get => PipelineBranch.Current is { } branch ? branch.CurrentStep : _currentStep;
+        set
+        {
+            if (PipelineBranch.Current is { } branch)
+            {
+                branch.CurrentStep = value;
+            }
+            else
+            {
+                _currentStep = value;
+            }
+        }
+    }
+
+    private StepsCollection CurrentSteps => PipelineBranch.Current?.Steps ?? _pipelineSteps;
+
+    public ApplicationPipeline() : this(new StepsTracer()) { }
+
     public async Task<int> Run(ApplicationContext context, CancellationToken cancellationToken = default)
     {
         var enumerator = _pipelineSteps.GetEnumerator();
+        using var scope = _tracer.BeginScope("Run", context.StructureName);
         return await Logging.Timer.Execute(
             async () => await Run(context, enumerator, cancellationToken),
             elapsedTime => LogEndOfRun(context, elapsedTime));
@@ -25,6 +48,40 @@ internal class ApplicationPipeline : IPipeline
     {
         LogStartOfRun(context);
 
+        await ExecuteSteps(context, enumerator, cancellationToken);
+
+        return ResolveExitCode(context);
+    }
+
+    public async Task RunInParallel(
+        ApplicationContext context,
+        IEnumerable<IPipelineStep[]> branches,
+        int maxDegreeOfParallelism,
+        CancellationToken cancellationToken = default)
+    {
+        var options = new ParallelOptions()
+        {
+            MaxDegreeOfParallelism = maxDegreeOfParallelism,
+            CancellationToken = cancellationToken
+        };
+
+        await Parallel.ForEachAsync(branches, options, async (steps, token) => await RunBranch(context, steps, token));
+    }
+
+    private async Task RunBranch(ApplicationContext context, IPipelineStep[] steps, CancellationToken cancellationToken)
+    {
+        var branch = new PipelineBranch();
+        branch.Steps.AddRange(steps);
+        branch.Enter();
+
+        await ExecuteSteps(context, branch.Steps.GetEnumerator(), cancellationToken);
+    }
+
+    private async Task ExecuteSteps(
+        ApplicationContext context,
+        IEnumerator<IPipelineStep> enumerator,
+        CancellationToken cancellationToken)
+    {
         IPipelineStep step;
         while (enumerator.MoveNext())
         {
@@ -32,12 +89,10 @@ internal class ApplicationPipeline : IPipeline
 
             if (step.ShouldExecute(context))
             {
-                _currentStep = step;
+                CurrentStep = step;
                 await ExecuteStep(step, context, cancellationToken);
             }
         }
-
-        return ResolveExitCode(context);
     }
 
     private void LogStartOfRun(ApplicationContext context)
@@ -85,17 +140,18 @@ internal class ApplicationPipeline : IPipeline
             termination.Details);
     }
 
-    private static async Task ExecuteStep(IPipelineStep step, ApplicationContext context, CancellationToken cancellationToken)
-    {
-        try
+    private async Task ExecuteStep(IPipelineStep step, ApplicationContext context, CancellationToken cancellationToken)
+        => await _tracer.Trace(step, async () =>
         {
-            await step.Execute(context, cancellationToken);
-        }
-        catch (Exception ex)
-        {
-            ErrorHandler.Handle(context, ex, step.GetType(), context.Logger);
-        }
-    }
+            try
+            {
+                await step.Execute(context, cancellationToken);
+            }
+            catch (Exception ex)
+            {
+                ErrorHandler.Handle(context, ex, step.GetType(), context.Logger);
+            }
+        });
 
     public void AddSteps(params IPipelineStep[] steps)
         => _pipelineSteps.AddRange(steps);
@@ -113,7 +169,7 @@ internal class ApplicationPipeline : IPipeline
 
     private IPipelineStep InsertStepsWithValidation(IPipelineStep? predecessor, IEnumerable<IPipelineStep> steps)
     {
-        predecessor ??= _currentStep;
+        predecessor ??= CurrentStep;
 
         if (predecessor is null)
         {
@@ -121,7 +177,7 @@ internal class ApplicationPipeline : IPipeline
                 "This may occur, when currently executed step is not set to an instance of object.");
         }
 
-        _pipelineSteps.InsertRange(predecessor, steps);
+        CurrentSteps.InsertRange(predecessor, steps);
         return predecessor;
     }
 }
@@ -1,10 +1,12 @@
-﻿using TeaPie.Environments;
+﻿using TeaPie.Benchmarking;
+using TeaPie.Environments;
 using TeaPie.Logging.Tree;
 using TeaPie.Pipelines;
 using TeaPie.Reporting;
 using TeaPie.Scripts;
 using TeaPie.StructureExploration;
 using TeaPie.TestCases;
+using TeaPie.Tracing;
 using TeaPie.Variables;
 
 namespace TeaPie;
@@ -12,6 +14,19 @@ namespace TeaPie;
 internal static class ApplicationStepsFactory
 {
     public static IPipelineStep[] CreateDefaultPipelineSteps(IServiceProvider provider)
+        => CreatePipelineSteps(
+            provider,
+            provider.GetStep<GenerateStepsForTestCasesStep>(),
+            provider.GetStep<ReportTestResultsSummaryStep>());
+
+    public static IPipelineStep[] CreateBenchmarkPipelineSteps(IServiceProvider provider)
+        => CreatePipelineSteps(
+            provider,
+            provider.GetStep<RunBenchmarkStep>(),
+            provider.GetStep<ReportTestResultsSummaryStep>(),
+            provider.GetStep<ReportBenchmarkResultsStep>());
+
+    private static IPipelineStep[] CreatePipelineSteps(IServiceProvider provider, params IPipelineStep[] executionSteps)
     {
         IDisposable? initScope = null;
 
@@ -32,9 +47,9 @@ internal static class ApplicationStepsFactory
                 initScope = null;
                 return Task.CompletedTask;
             }),
-            provider.GetStep<GenerateStepsForTestCasesStep>(),
-            provider.GetStep<ReportTestResultsSummaryStep>(),
-            provider.GetStep<SaveVariablesStep>()
+            .. executionSteps,
+            provider.GetStep<SaveVariablesStep>(),
+            provider.GetStep<ExportTraceStep>()
         ];
     }
 
@@ -0,0 +1,23 @@
+﻿namespace TeaPie.Benchmarking;
+
+internal class BenchmarkOptions(int iterations, TimeSpan duration, int concurrency, string? reportFilePath = null)
+{
+    /// <summary>
+    /// Number of times the whole collection (or test case) is executed. Zero means that the number of iterations is
+    /// limited only by <see cref="Duration"/>.
+    /// </summary>
+    public int Iterations { get; } = Math.Max(0, iterations);
+
+    /// <summary>
+    /// Time after which no further iteration is started. <see cref="TimeSpan.Zero"/> means that the run is limited
+    /// only by <see cref="Iterations"/>.
+    /// </summary>
+    public TimeSpan Duration { get; } = duration > TimeSpan.Zero ? duration : TimeSpan.Zero;
+
+    public int Concurrency { get; } = Math.Max(1, concurrency);
+
+    public string ReportFilePath { get; } = reportFilePath ?? string.Empty;
+
+    public bool ShouldStartIteration(int iteration, TimeSpan elapsed)
+        => (Iterations == 0 || iteration < Iterations) && (Duration == TimeSpan.Zero || elapsed < Duration);
+}
@@ -0,0 +1,111 @@
+﻿using System.Collections.Concurrent;
+using System.Diagnostics;
+
+namespace TeaPie.Benchmarking;
+
+internal interface IBenchmarkRecorder
+{
+    bool IsRecording { get; }
+
+    void Start(BenchmarkOptions options);
+
+    void RegisterIteration();
+
+    /// <summary>
+    /// Records single attempt of sending the request. If recording wasn't started, the call is ignored.
+    /// </summary>
+    /// <param name="testCasePath">Relative path to the file in which the request is defined.</param>
+    /// <param name="requestName">Name of the request (or its position within the file, if it has no name).</param>
+    /// <param name="latency">Time between sending the request and receiving the whole response.</param>
+    /// <param name="succeeded">Whether the response was received (no matter its status code).</param>
+    void Record(string testCasePath, string requestName, TimeSpan latency, bool succeeded);
+
+    void Stop();
+
+    BenchmarkSummary GetSummary(string name);
+}
+
+internal class BenchmarkRecorder : IBenchmarkRecorder
+{
+    private readonly ConcurrentDictionary<(string TestCasePath, string RequestName), RequestStatistics> _statistics =
+        new();
+    private readonly Stopwatch _stopwatch = new();
+
+    private BenchmarkOptions? _options;
+    private DateTime _timestamp;
+    private int _iterations;
+    private volatile bool _isRecording;
+
+    public bool IsRecording => _isRecording;
+
+    public void Start(BenchmarkOptions options)
+    {
+        _options = options;
+        _statistics.Clear();
+        _iterations = 0;
+        _timestamp = DateTime.Now;
+        _stopwatch.Restart();
+        _isRecording = true;
+    }
+
+    public void RegisterIteration() => Interlocked.Increment(ref _iterations);
+
+    public void Record(string testCasePath, string requestName, TimeSpan latency, bool succeeded)
+    {
+        if (!_isRecording)
+        {
+            return;
+        }
+
+        var statistics = _statistics.GetOrAdd((testCasePath, requestName), _ => new RequestStatistics());
+        statistics.Record(latency, succeeded);
+    }
+
+    public void Stop()
+    {
+        _isRecording = false;
+        _stopwatch.Stop();
+    }
+
+    public BenchmarkSummary GetSummary(string name)
+    {
+        var elapsed = _stopwatch.Elapsed;
+
+        var requests = _statistics
+            .OrderBy(s => s.Key.TestCasePath, StringComparer.Ordinal)
+            .ThenBy(s => s.Key.RequestName, StringComparer.Ordinal)
+            .Select(s => s.Value.ToResult(s.Key.TestCasePath, s.Key.RequestName, elapsed))
+            .ToList();
+
+        return new BenchmarkSummary(name, _timestamp, elapsed, _iterations, _options?.Concurrency ?? 1, requests);
+    }
+
+    private class RequestStatistics
+    {
+        private readonly LatencyHistogram _histogram = new();
+        private long _numberOfFailedRequests;
+
+        public void Record(TimeSpan latency, bool succeeded)
+        {
+            _histogram.Record(latency);
+            if (!succeeded)
+            {
+                Interlocked.Increment(ref _numberOfFailedRequests);
+            }
+        }
+
+        public RequestBenchmarkResult ToResult(string testCasePath, string requestName, TimeSpan elapsed)
+            => new(
+                testCasePath,
+                requestName,
+                _histogram.Count,
+                Interlocked.Read(ref _numberOfFailedRequests),
+                elapsed > TimeSpan.Zero ? _histogram.Count / elapsed.TotalSeconds : 0.0,
+                _histogram.MinMs,
+                _histogram.MeanMs,
+                _histogram.GetPercentile(50),
+                _histogram.GetPercentile(90),
+                _histogram.GetPercentile(99),
+                _histogram.MaxMs);
+    }
+}
@@ -0,0 +1,35 @@
+﻿namespace TeaPie.Benchmarking;
+
+internal record RequestBenchmarkResult(
+    string TestCasePath,
+    string RequestName,
+    long NumberOfRequests,
+    long NumberOfFailedRequests,
+    double RequestsPerSecond,
+    double MinMs,
+    double MeanMs,
+    double P50Ms,
+    double P90Ms,
+    double P99Ms,
+    double MaxMs);
+
+internal class BenchmarkSummary(
+    string name,
+    DateTime timestamp,
+    TimeSpan elapsed,
+    int iterations,
+    int concurrency,
+    IReadOnlyList<RequestBenchmarkResult> requests)
+{
+    public string Name { get; } = name;
+    public DateTime Timestamp { get; } = timestamp;
+    public double ElapsedMs { get; } = elapsed.TotalMilliseconds;
+    public int Iterations { get; } = iterations;
+    public int Concurrency { get; } = concurrency;
+
+    public long NumberOfRequests => Requests.Sum(r => r.NumberOfRequests);
+    public long NumberOfFailedRequests => Requests.Sum(r => r.NumberOfFailedRequests);
+    public double RequestsPerSecond => ElapsedMs > 0 ? NumberOfRequests / (ElapsedMs / 1000.0) : 0.0;
+
+    public IReadOnlyList<RequestBenchmarkResult> Requests { get; } = requests;
+}
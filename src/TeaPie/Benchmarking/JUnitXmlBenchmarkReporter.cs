@@ -0,0 +1,85 @@
+﻿using System.Globalization;
+using TeaPie.Reporting;
+using TeaPie.Xml;
+
+namespace TeaPie.Benchmarking;
+
+/// <summary>
+/// Writes each benchmarked request as a JUnit test case. Its time is the mean latency, throughput and percentiles are
+/// written as properties and requests which failed to receive any response are reported as failures.
+/// </summary>
+internal class JUnitXmlBenchmarkReporter(string reportFilePath) : IReporter<BenchmarkSummary>
+{
+    private readonly string _reportFilePath = reportFilePath;
+
+    public async Task Report(BenchmarkSummary report)
+    {
+        using var writer = new JUnitXmlWriter(_reportFilePath);
+
+        var requests = report.Requests;
+        writer.WriteTestSuitesRoot(
+            report.Name,
+            requests.Count,
+            0,
+            requests.Count(r => r.NumberOfFailedRequests > 0),
+            report.ElapsedMs,
+            report.Timestamp);
+
+        foreach (var testCase in requests.GroupBy(r => r.TestCasePath))
+        {
+            WriteTestSuite(writer, testCase.Key, [.. testCase]);
+        }
+
+        writer.EndTestSuitesRoot();
+
+        await Task.CompletedTask;
+    }
+
+    private static void WriteTestSuite(
+        JUnitXmlWriter writer,
+        string testCasePath,
+        List<RequestBenchmarkResult> requests)
+    {
+        writer.WriteTestSuite(
+            testCasePath,
+            requests.Count,
+            0,
+            requests.Count(r => r.NumberOfFailedRequests > 0),
+            requests.Sum(r => r.MeanMs * r.NumberOfRequests));
+
+        foreach (var request in requests)
+        {
+            writer.WriteTestCase(
+                testCasePath,
+                request.RequestName,
+                request.MeanMs,
+                false,
+                GetFailureMessage(request),
+                "RequestFailure",
+                properties: GetProperties(request));
+        }
+
+        writer.EndTestSuite();
+    }
+
+    private static string? GetFailureMessage(RequestBenchmarkResult request)
+        => request.NumberOfFailedRequests > 0
+            ? $"{request.NumberOfFailedRequests} of {request.NumberOfRequests} requests didn't receive any response."
+            : null;
+
+    private static Dictionary<string, string> GetProperties(RequestBenchmarkResult request)
+        => new()
+        {
+            ["requests"] = request.NumberOfRequests.ToString(CultureInfo.InvariantCulture),
+            ["failedRequests"] = request.NumberOfFailedRequests.ToString(CultureInfo.InvariantCulture),
+            ["requestsPerSecond"] = Format(request.RequestsPerSecond),
+            ["minMs"] = Format(request.MinMs),
+            ["meanMs"] = Format(request.MeanMs),
+            ["p50Ms"] = Format(request.P50Ms),
+            ["p90Ms"] = Format(request.P90Ms),
+            ["p99Ms"] = Format(request.P99Ms),
+            ["maxMs"] = Format(request.MaxMs)
+        };
+
+    private static string Format(double value) => value.ToString("0.###", CultureInfo.InvariantCulture);
+}
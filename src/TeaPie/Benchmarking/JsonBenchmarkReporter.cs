@@ -0,0 +1,21 @@
+﻿using System.Text.Json;
+using TeaPie.Reporting;
+
+namespace TeaPie.Benchmarking;
+
+internal class JsonBenchmarkReporter(string reportFilePath) : IReporter<BenchmarkSummary>
+{
+    private static readonly JsonSerializerOptions _serializerOptions = new()
+    {
+        PropertyNamingPolicy = JsonNamingPolicy.CamelCase,
+        WriteIndented = true
+    };
+
+    private readonly string _reportFilePath = reportFilePath;
+
+    public async Task Report(BenchmarkSummary report)
+    {
+        await using var stream = new FileStream(_reportFilePath, FileMode.Create, FileAccess.Write);
+        await JsonSerializer.SerializeAsync(stream, report, _serializerOptions);
+    }
+}
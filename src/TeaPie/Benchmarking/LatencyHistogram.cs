@@ -0,0 +1,126 @@
+﻿namespace TeaPie.Benchmarking;
+
+/// <summary>
+/// Histogram of latencies with logarithmic buckets (each bucket is 1 % wider than the previous one), so memory usage
+/// doesn't grow with the number of recorded requests and percentiles are accurate to 1 %.
+/// </summary>
+internal class LatencyHistogram
+{
+    private const double BucketRatio = 1.01;
+    // Upper bound of the last bucket is more than six hours (in microseconds).
+    private const int NumberOfBuckets = 2400;
+    private static readonly double _logOfBucketRatio = Math.Log(BucketRatio);
+
+    private readonly long[] _buckets = new long[NumberOfBuckets];
+    private readonly object _lock = new();
+
+    private long _count;
+    private double _sumMs;
+    private double _minMs = double.MaxValue;
+    private double _maxMs;
+
+    public long Count
+    {
+        get
+        {
+            lock (_lock)
+            {
+                return _count;
+            }
+        }
+    }
+
+    public double MeanMs
+    {
+        get
+        {
+            lock (_lock)
+            {
+                return _count > 0 ? _sumMs / _count : 0.0;
+            }
+        }
+    }
+
+    public double MinMs
+    {
+        get
+        {
+            lock (_lock)
+            {
+                return _count > 0 ? _minMs : 0.0;
+            }
+        }
+    }
+
+    public double MaxMs
+    {
+        get
+        {
+            lock (_lock)
+            {
+                return _maxMs;
+            }
+        }
+    }
+
+    public void Record(TimeSpan latency)
+    {
+        var latencyMs = Math.Max(0.0, latency.TotalMilliseconds);
+        var index = GetBucketIndex(latencyMs);
+
+        lock (_lock)
+        {
+            _buckets[index]++;
+            _count++;
+            _sumMs += latencyMs;
+            _minMs = Math.Min(_minMs, latencyMs);
+            _maxMs = Math.Max(_maxMs, latencyMs);
+        }
+    }
+
+    /// <summary>
+    /// Gets latency (in milliseconds) under which <paramref name="percentile"/> % of recorded latencies fall.
+    /// </summary>
+    /// <param name="percentile">Percentile within the range (0, 100].</param>
+    /// <returns>Latency in milliseconds, or zero if nothing was recorded.</returns>
+    public double GetPercentile(double percentile)
+    {
+        ArgumentOutOfRangeException.ThrowIfNegativeOrZero(percentile);
+        ArgumentOutOfRangeException.ThrowIfGreaterThan(percentile, 100.0);
+
+        lock (_lock)
+        {
+            if (_count == 0)
+            {
+                return 0.0;
+            }
+
+            var rank = Math.Max(1, (long)Math.Ceiling(percentile / 100.0 * _count));
+            long cumulativeCount = 0;
+            for (var index = 0; index < NumberOfBuckets; index++)
+            {
+                cumulativeCount += _buckets[index];
+                if (cumulativeCount >= rank)
+                {
+                    return Math.Clamp(GetBucketUpperBoundMs(index), _minMs, _maxMs);
+                }
+            }
+
+            return _maxMs;
+        }
+    }
+
+    private static int GetBucketIndex(double latencyMs)
+    {
+        var latencyMicroseconds = latencyMs * 1000.0;
+        if (latencyMicroseconds <= 1.0)
+        {
+            return 0;
+        }
+
+        var index = (int)Math.Ceiling(Math.Log(latencyMicroseconds) / _logOfBucketRatio);
+        return Math.Min(index, NumberOfBuckets - 1);
+    }
+
+    private static double GetBucketUpperBoundMs(int index) => Math.Pow(BucketRatio, index) / 1000.0;
+}
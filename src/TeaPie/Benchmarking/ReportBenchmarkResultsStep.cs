@@ -0,0 +1,38 @@
+﻿using TeaPie.Pipelines;
+using TeaPie.Reporting;
+
+namespace TeaPie.Benchmarking;
+
+internal class ReportBenchmarkResultsStep(IBenchmarkRecorder benchmarkRecorder) : IPipelineStep
+{
+    private const string JsonReportFileExtension = ".json";
+
+    private readonly IBenchmarkRecorder _benchmarkRecorder = benchmarkRecorder;
+
+    public bool ShouldExecute(ApplicationContext context) => context.Benchmark is not null;
+
+    public async Task Execute(ApplicationContext context, CancellationToken cancellationToken = default)
+    {
+        var summary = _benchmarkRecorder.GetSummary(context.StructureName);
+
+        foreach (var reporter in GetReporters(context.Benchmark!.ReportFilePath))
+        {
+            await reporter.Report(summary);
+        }
+    }
+
+    private static IEnumerable<IReporter<BenchmarkSummary>> GetReporters(string reportFilePath)
+    {
+        yield return new SpectreConsoleBenchmarkReporter();
+
+        if (!string.IsNullOrEmpty(reportFilePath))
+        {
+            yield return IsJsonReport(reportFilePath)
+                ? new JsonBenchmarkReporter(reportFilePath)
+                : new JUnitXmlBenchmarkReporter(reportFilePath);
+        }
+    }
+
+    private static bool IsJsonReport(string reportFilePath)
+        => Path.GetExtension(reportFilePath).Equals(JsonReportFileExtension, StringComparison.OrdinalIgnoreCase);
+}
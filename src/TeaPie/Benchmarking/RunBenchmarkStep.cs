@@ -0,0 +1,63 @@
+﻿using Microsoft.Extensions.Logging;
+using System.Diagnostics;
+using TeaPie.Pipelines;
+using TeaPie.TestCases;
+
+namespace TeaPie.Benchmarking;
+
+internal partial class RunBenchmarkStep(
+    IPipeline pipeline,
+    IBenchmarkRecorder benchmarkRecorder,
+    ILogger<RunBenchmarkStep> logger)
+    : IPipelineStep
+{
+    private readonly IPipeline _pipeline = pipeline;
+    private readonly IBenchmarkRecorder _benchmarkRecorder = benchmarkRecorder;
+    private readonly ILogger<RunBenchmarkStep> _logger = logger;
+
+    public async Task Execute(ApplicationContext context, CancellationToken cancellationToken = default)
+    {
+        var options = context.Benchmark
+            ?? throw new InvalidOperationException("Unable to run benchmark, if its options are not provided.");
+
+        LogBenchmarkStart(context.TestCases.Count, options.Concurrency);
+
+        _benchmarkRecorder.Start(options);
+        try
+        {
+            await _pipeline.RunInParallel(
+                context, CreateIterations(context, options), options.Concurrency, cancellationToken);
+        }
+        finally
+        {
+            _benchmarkRecorder.Stop();
+        }
+    }
+
+    /// <summary>
+    /// Iterations are generated lazily, so that run limited by duration doesn't start any new test case once the
+    /// duration elapses. Each test case gets fresh execution context, but scripts and requests are compiled
+    /// (respectively parsed) only during the first iteration and reused from caches afterwards.
+    /// </summary>
+    private IEnumerable<IPipelineStep[]> CreateIterations(ApplicationContext context, BenchmarkOptions options)
+    {
+        var stopwatch = Stopwatch.StartNew();
+        for (var iteration = 0; options.ShouldStartIteration(iteration, stopwatch.Elapsed); iteration++)
+        {
+            _benchmarkRecorder.RegisterIteration();
+            LogIterationStart(iteration + 1);
+
+            foreach (var testCase in context.TestCases)
+            {
+                yield return TestCaseStepsFactory.CreateStepsForTestCase(context.ServiceProvider, testCase);
+            }
+        }
+    }
+
+    [LoggerMessage("Benchmark of {count} test case(s) started with {concurrency} concurrent worker(s).",
+        Level = LogLevel.Information)]
+    partial void LogBenchmarkStart(int count, int concurrency);
+
+    [LoggerMessage("Iteration {iteration} of the benchmark started.", Level = LogLevel.Debug)]
+    partial void LogIterationStart(int iteration);
+}
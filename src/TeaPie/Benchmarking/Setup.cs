@@ -0,0 +1,9 @@
+﻿using Microsoft.Extensions.DependencyInjection;
+
+namespace TeaPie.Benchmarking;
+
+internal static class Setup
+{
+    public static IServiceCollection AddBenchmarking(this IServiceCollection services)
+        => services.AddSingleton<IBenchmarkRecorder, BenchmarkRecorder>();
+}
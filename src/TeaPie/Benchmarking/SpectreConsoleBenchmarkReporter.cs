@@ -0,0 +1,66 @@
+﻿using Spectre.Console;
+using System.Globalization;
+using TeaPie.Reporting;
+
+namespace TeaPie.Benchmarking;
+
+internal class SpectreConsoleBenchmarkReporter : IReporter<BenchmarkSummary>
+{
+    public async Task Report(BenchmarkSummary report)
+    {
+        var table = PrepareTable(GetHeading(report));
+
+        foreach (var request in report.Requests)
+        {
+            AddRequestRow(table, request);
+        }
+
+        AnsiConsole.Write(table);
+
+        await Task.CompletedTask;
+    }
+
+    private static string GetHeading(BenchmarkSummary report)
+        => "[bold yellow]Benchmark Results:[/] " +
+            $"[bold aqua]{report.NumberOfRequests}[/] requests " +
+            $"in [bold aqua]{Format(report.ElapsedMs / 1000.0)} s[/] " +
+            $"([bold aqua]{Format(report.RequestsPerSecond)}[/] req/s, {report.Iterations} iterations, " +
+            $"{report.Concurrency} workers)" +
+            (report.NumberOfFailedRequests > 0
+                ? $", [bold red]{report.NumberOfFailedRequests} failed[/]"
+                : string.Empty);
+
+    private static Table PrepareTable(string heading)
+    {
+        var table = new Table();
+        table.Border(TableBorder.Rounded);
+        table.Expand();
+        table.Title(heading);
+
+        table.AddColumn("[bold]Request[/]");
+        foreach (var column in new[] { "Count", "Failed", "Req/s", "Mean", "p50", "p90", "p99", "Max" })
+        {
+            table.AddColumn(new TableColumn($"[bold]{column}[/]").RightAligned());
+        }
+
+        return table;
+    }
+
+    private static void AddRequestRow(Table table, RequestBenchmarkResult request)
+        => table.AddRow(
+            $"[italic aqua]{request.TestCasePath.EscapeMarkup()}[/] [bold]{request.RequestName.EscapeMarkup()}[/]",
+            request.NumberOfRequests.ToString(CultureInfo.InvariantCulture),
+            request.NumberOfFailedRequests > 0
+                ? $"[bold red]{request.NumberOfFailedRequests}[/]"
+                : request.NumberOfFailedRequests.ToString(CultureInfo.InvariantCulture),
+            Format(request.RequestsPerSecond),
+            FormatLatency(request.MeanMs),
+            FormatLatency(request.P50Ms),
+            FormatLatency(request.P90Ms),
+            FormatLatency(request.P99Ms),
+            FormatLatency(request.MaxMs));
+
+    private static string FormatLatency(double latencyMs) => Format(latencyMs) + " ms";
+
+    private static string Format(double value) => value.ToString("0.##", CultureInfo.InvariantCulture);
+}
@@ -5,10 +5,13 @@ internal static class Constants
     public const string RequestFileExtension = ".http";
     public const string ScriptFileExtension = ".csx";
     public const string TestCaseFileExtension = ".tp";
+    public const string CsvDataSourceFileExtension = ".csv";
+    public const string JsonLinesDataSourceFileExtension = ".jsonl";
 
     public const string PreRequestSuffix = "-init";
     public const string RequestSuffix = "-req";
     public const string PostResponseSuffix = "-test";
+    public const string DataSourceSuffix = "-data";
 
     public const string DefaultEnvironmentFileName = "env";
     public const string EnvironmentFileExtension = ".json";
@@ -7,6 +7,8 @@ namespace TeaPie.Functions;
 internal interface IFunctionsResolver
 {
     string ResolveFunctionsInLine(string line);
+
+    string ResolveFunction(string expression);
 }
 
 internal partial class FunctionsResolver(IFunctions functions) : IFunctionsResolver
@@ -14,30 +16,31 @@ internal partial class FunctionsResolver(IFunctions functions) : IFunctionsResol
     private readonly IFunctions _functions = functions;
 
     public string ResolveFunctionsInLine(string line)
-        => FunctionNotationPatternRegex().Replace(line, match =>
-        {
-            string input = match.Groups[1].Value;
-            IEnumerable<string> tokens = CommandLineParser.SplitCommandLine(input);
+        => FunctionNotationPatternRegex().Replace(line, match => ResolveFunction(match.Groups[1].Value));
+
+    public string ResolveFunction(string expression)
+    {
+        IEnumerable<string> tokens = CommandLineParser.SplitCommandLine(expression);
 
-            var functionName = tokens.First();
-            string[] args = [.. tokens.Skip(1)];
+        var functionName = tokens.First();
+        string[] args = [.. tokens.Skip(1)];
 
-            if (_functions.Contains(functionName, args.Length))
+        if (_functions.Contains(functionName, args.Length))
+        {
+            object? result;
+            if (args.Length == 0)
+            {
+                result = _functions.Execute<object>(functionName);
+            }
+            else
             {
-                object? result;
-                if (args.Length == 0)
-                {
-                    result = _functions.Execute<object>(functionName);
-                }
-                else
-                {
-                    result = _functions.Execute<object>(functionName, args);
-                }
-                return result?.ToString() ?? "null";
+                result = _functions.Execute<object>(functionName, args);
             }
+            return result?.ToString() ?? "null";
+        }
 
-            throw new InvalidOperationException($"Function '{functionName}' was not found.");
-        });
+        throw new InvalidOperationException($"Function '{functionName}' was not found.");
+    }
 
     [GeneratedRegex(HttpFileParserConstants.FunctionNotationPattern)]
     private static partial Regex FunctionNotationPatternRegex();
@@ -1,4 +1,6 @@
-﻿namespace TeaPie.Http.Auth;
+﻿using TeaPie.Tracing;
+
+namespace TeaPie.Http.Auth;
 
 internal class AuthHttpMessageHandler(IAuthProviderAccessor accessor) : DelegatingHandler
 {
@@ -6,7 +8,10 @@ internal class AuthHttpMessageHandler(IAuthProviderAccessor accessor) : Delegati
 
     protected override async Task<HttpResponseMessage> SendAsync(HttpRequestMessage request, CancellationToken cancellationToken)
     {
-        await GetAuthProvider().Authenticate(request, cancellationToken);
+        var authProvider = GetAuthProvider();
+        await TeaPieTelemetry.TraceHttpPhase(
+            HttpPhases.Authentication, async () => await authProvider.Authenticate(request, cancellationToken));
+
         return await base.SendAsync(request, cancellationToken);
     }
 
@@ -1,4 +1,6 @@
-﻿namespace TeaPie.Http.Auth;
+﻿using TeaPie.Pipelines;
+
+namespace TeaPie.Http.Auth;
 
 internal interface IAuthProviderAccessor
 {
@@ -10,7 +12,14 @@ internal interface IAuthProviderAccessor
 
 internal class AuthProviderAccessor : IAuthProviderAccessor
 {
-    public IAuthProvider? CurrentProvider { get; set; }
+    private readonly BranchLocal<IAuthProvider?> _currentProvider = new(() => null);
+
+    public IAuthProvider? CurrentProvider
+    {
+        get => _currentProvider.Value;
+        set => _currentProvider.Value = value;
+    }
+
     public IAuthProvider? DefaultProvider { get; set; }
 
     public void SetCurrentProviderToDefault() => CurrentProvider = DefaultProvider;
@@ -10,6 +10,7 @@ public class OAuth2Options : IAuthOptions
     public string? ClientSecret { get; }
     public Uri? RedirectUri { get; }
     public string? AccessTokenVariableName { get; }
+    public bool PersistAccessToken { get; }
     public IReadOnlyDictionary<string, string> AdditionalParameters { get; } = new Dictionary<string, string>();
 
     private IReadOnlyDictionary<string, string>? _cachedParameters;
@@ -33,7 +34,8 @@ public class OAuth2Options : IAuthOptions
         string? password = null,
         string? clientSecret = null,
         string? accessTokenVariableName = null,
-        Dictionary<string, string>? additionalParameters = null)
+        Dictionary<string, string>? additionalParameters = null,
+        bool persistAccessToken = false)
     {
         AuthUrl = oauthUrl ?? throw new ArgumentNullException(nameof(oauthUrl));
         GrantType = grantType;
@@ -43,6 +45,7 @@ public class OAuth2Options : IAuthOptions
         ClientSecret = clientSecret;
         AccessTokenVariableName = accessTokenVariableName;
         AdditionalParameters = new Dictionary<string, string>(additionalParameters ?? []);
+        PersistAccessToken = persistAccessToken;
     }
 
     internal bool HasParameter(string parameterName) => GetParametersAsReadOnly().ContainsKey(parameterName);
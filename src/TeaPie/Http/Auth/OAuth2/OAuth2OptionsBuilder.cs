@@ -11,6 +11,7 @@ public sealed class OAuth2OptionsBuilder
     private string? _username;
     private string? _password;
     private string? _accessTokenVariableName;
+    private bool _persistAccessToken;
     private readonly Dictionary<string, string> _additionalParameters = [];
 
     private OAuth2OptionsBuilder() { }
@@ -95,6 +96,18 @@ public sealed class OAuth2OptionsBuilder
         return this;
     }
 
+    /// <summary>
+    /// Access token will be persisted (encrypted) in the cache of the '.teapie' folder, so that following runs use it
+    /// until it expires, instead of fetching new one.
+    /// </summary>
+    /// <param name="persist">Whether access token should be persisted.</param>
+    /// <returns>Updated instance of builder.</returns>
+    public OAuth2OptionsBuilder WithAccessTokenPersistence(bool persist = true)
+    {
+        _persistAccessToken = persist;
+        return this;
+    }
+
     /// <summary>
     /// Adds an additional parameter with <paramref name="key"/> and <paramref name="value"/>.
     /// </summary>
@@ -125,7 +138,8 @@ public sealed class OAuth2OptionsBuilder
             _password,
             _clientSecret,
             _accessTokenVariableName,
-            _additionalParameters.Count > 0 ? new Dictionary<string, string>(_additionalParameters) : null);
+            _additionalParameters.Count > 0 ? new Dictionary<string, string>(_additionalParameters) : null,
+            _persistAccessToken);
     }
 
     [MemberNotNull(nameof(_authUrl))]
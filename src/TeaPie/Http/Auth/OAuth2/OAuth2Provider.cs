@@ -1,5 +1,4 @@
-﻿using Microsoft.Extensions.Caching.Memory;
-using Microsoft.Extensions.Logging;
+﻿using Microsoft.Extensions.Logging;
 using System.Net.Http.Json;
 using System.Text.Json.Serialization;
 using TeaPie.Http.Headers;
@@ -10,76 +9,83 @@ namespace TeaPie.Http.Auth.OAuth2;
 
 internal class OAuth2Provider(
     IHttpClientFactory clientFactory,
-    IMemoryCache memoryCache,
+    IOAuth2TokenCache tokenCache,
     ILogger<OAuth2Provider> logger,
     IVariables variables)
     : IAuthProvider<OAuth2Options>
 {
-    private readonly string _accessTokenCacheKey = Guid.NewGuid() + "-access_token";
     private const string RedirectUriParameterKey = "redirect_uri";
 
     private readonly IHttpClientFactory _httpClientFactory = clientFactory;
-    private readonly IMemoryCache _cache = memoryCache;
+    private readonly IOAuth2TokenCache _tokenCache = tokenCache;
     private readonly ILogger<OAuth2Provider> _logger = logger;
     private readonly IVariables _variables = variables;
 
     private readonly AuthorizationHeaderHandler _authorizationHeaderHandler = new();
     private OAuth2Options _configuration = new();
+    private string? _lastAccessToken;
 
     public async Task Authenticate(HttpRequestMessage request, CancellationToken cancellationToken)
-        => _authorizationHeaderHandler.SetHeader($"Bearer {await GetToken()}", request);
+        => _authorizationHeaderHandler.SetHeader($"Bearer {await GetToken(cancellationToken)}", request);
 
     public IAuthProvider<OAuth2Options> ConfigureOptions(OAuth2Options configuration)
     {
         _configuration = configuration;
-        _cache.Remove(_accessTokenCacheKey);
         return this;
     }
 
-    private async Task<string> GetToken()
+    private async Task<string> GetToken(CancellationToken cancellationToken)
     {
-        var source = "cache";
-        var token = await _cache.GetOrCreateAsync(_accessTokenCacheKey, async _ =>
-        {
-            var newToken = await GetTokenFromRequest();
-            source = ResolveRequestUri();
-            SetVariableIfNeeded(newToken);
-            return newToken;
-        })!;
-
-        _logger.LogTrace("{Subject} was fetched from {Source}.", "Access token", source);
-        return token!;
+        var configuration = _configuration;
+        var token = await _tokenCache.GetToken(configuration, GetTokenFromRequest, cancellationToken);
+
+        SetVariableIfNeeded(configuration, token.AccessToken);
+
+        _logger.LogTrace("{Subject} was obtained (valid until {ExpiresAt}).", "Access token", token.ExpiresAt);
+        return token.AccessToken;
     }
 
-    private void SetVariableIfNeeded(string newToken)
+    /// <summary>
+    /// Token can be shared with other providers or refreshed in the background, so variable is updated whenever
+    /// the provider gets different token than the last time.
+    /// </summary>
+    private void SetVariableIfNeeded(OAuth2Options configuration, string accessToken)
     {
-        if (_configuration.AccessTokenVariableName is not null)
+        if (configuration.AccessTokenVariableName is null)
+        {
+            return;
+        }
+
+        var previousAccessToken = Interlocked.Exchange(ref _lastAccessToken, accessToken);
+        if (!string.Equals(previousAccessToken, accessToken, StringComparison.Ordinal))
         {
             _variables.SetVariable(
-                _configuration.AccessTokenVariableName, newToken, Constants.SecretVariableTag, Constants.NoCacheVariableTag);
+                configuration.AccessTokenVariableName,
+                accessToken,
+                Constants.SecretVariableTag,
+                Constants.NoCacheVariableTag);
         }
     }
 
-    private async Task<string> GetTokenFromRequest()
+    private async Task<OAuth2TokenResponse> GetTokenFromRequest(OAuth2Options configuration)
     {
-        ResolveParameters(out var requestContent, out var requestUri);
+        ResolveParameters(configuration, out var requestContent, out var requestUri);
 
         using (_logger.BeginTreeScope())
         {
-            LogSendingRequest();
+            LogSendingRequest(configuration);
 
             var result = await SendRequest(requestContent, requestUri);
 
-            CacheToken(result);
-
-            return result.AccessToken!;
+            _logger.LogTrace("{Subject} was fetched from {Source}.", "Access token", requestUri);
+            return result;
         }
     }
 
-    private void LogSendingRequest()
+    private void LogSendingRequest(OAuth2Options configuration)
     {
         var body = string.Join(
-            Environment.NewLine, _configuration.GetParametersAsReadOnly().Select(ToStringMaskingSecrets));
+            Environment.NewLine, configuration.GetParametersAsReadOnly().Select(ToStringMaskingSecrets));
 
         _logger.LogTrace("Following HTTP request's body (www-url-encoded):{NewLine}{Body}",
             Environment.NewLine,
@@ -92,10 +98,11 @@ internal class OAuth2Provider(
                 ? $"{parameter.Key}={new string('*', parameter.Value.Length)}"
                 : $"{parameter.Key}={parameter.Value}";
 
-    private void ResolveParameters(out FormUrlEncodedContent requestContent, out string requestUri)
+    private static void ResolveParameters(
+        OAuth2Options configuration, out FormUrlEncodedContent requestContent, out string requestUri)
     {
-        requestContent = new FormUrlEncodedContent(_configuration.GetParametersAsReadOnly());
-        requestUri = ResolveRequestUri();
+        requestContent = new FormUrlEncodedContent(configuration.GetParametersAsReadOnly());
+        requestUri = ResolveRequestUri(configuration);
     }
 
     private async Task<OAuth2TokenResponse> SendRequest(FormUrlEncodedContent requestContent, string requestUri)
@@ -113,21 +120,10 @@ internal class OAuth2Provider(
         return result;
     }
 
-    private void CacheToken(OAuth2TokenResponse result)
-    {
-        var cacheEntryOptions = new MemoryCacheEntryOptions
-        {
-            AbsoluteExpirationRelativeToNow = TimeSpan.FromSeconds(result.ExpiresIn),
-            Priority = CacheItemPriority.High
-        };
-
-        _cache.Set(_accessTokenCacheKey, result.AccessToken, cacheEntryOptions);
-    }
-
-    private string ResolveRequestUri()
-        => _configuration.HasParameter(RedirectUriParameterKey)
-             ? _configuration.GetParameter(RedirectUriParameterKey)
-             : _configuration.AuthUrl;
+    private static string ResolveRequestUri(OAuth2Options configuration)
+        => configuration.HasParameter(RedirectUriParameterKey)
+             ? configuration.GetParameter(RedirectUriParameterKey)
+             : configuration.AuthUrl;
 }
 
 internal class OAuth2TokenResponse
@@ -0,0 +1,36 @@
+﻿namespace TeaPie.Http.Auth.OAuth2;
+
+/// <summary>
+/// Access token together with its validity. Token without expiration is valid until the end of the run.
+/// </summary>
+internal record OAuth2Token(string AccessToken, DateTimeOffset IssuedAt, DateTimeOffset? ExpiresAt)
+{
+    /// <summary>
+    /// Token is refreshed in the background, once this part of its lifetime remains.
+    /// </summary>
+    private const double RefreshAheadRatio = 0.2;
+
+    /// <summary>
+    /// Token isn't used anymore, if it expires within this part of its lifetime (at most 30 seconds), so that it
+    /// doesn't expire while request is on the way.
+    /// </summary>
+    private const double ExpirationMarginRatio = 0.1;
+    private static readonly TimeSpan _maxExpirationMargin = TimeSpan.FromSeconds(30);
+
+    public static OAuth2Token Create(string accessToken, int expiresInSeconds, DateTimeOffset now)
+        => new(accessToken, now, expiresInSeconds > 0 ? now.AddSeconds(expiresInSeconds) : null);
+
+    public bool IsUsable(DateTimeOffset now)
+        => ExpiresAt is null || now < ExpiresAt - GetExpirationMargin();
+
+    public bool ShouldBeRefreshed(DateTimeOffset now)
+        => ExpiresAt is not null && now >= ExpiresAt - (GetLifetime() * RefreshAheadRatio);
+
+    private TimeSpan GetExpirationMargin()
+    {
+        var margin = GetLifetime() * ExpirationMarginRatio;
+        return margin < _maxExpirationMargin ? margin : _maxExpirationMargin;
+    }
+
+    private TimeSpan GetLifetime() => ExpiresAt is null ? TimeSpan.MaxValue : ExpiresAt.Value - IssuedAt;
+}
@@ -0,0 +1,146 @@
+﻿using Microsoft.Extensions.Logging;
+using System.Collections.Concurrent;
+using System.Security.Cryptography;
+using System.Text;
+
+namespace TeaPie.Http.Auth.OAuth2;
+
+internal interface IOAuth2TokenCache
+{
+    /// <summary>
+    /// Gets access token for given <paramref name="options"/>. Token is shared by all providers with the same
+    /// configuration (URL, grant type, client, user, scopes and other parameters). It is fetched by
+    /// <paramref name="fetchToken"/> only if there is no valid token yet - concurrent callers wait for the same fetch.
+    /// Token, which is about to expire, is still returned, while new one is fetched in the background.
+    /// </summary>
+    Task<OAuth2Token> GetToken(
+        OAuth2Options options,
+        Func<OAuth2Options, Task<OAuth2TokenResponse>> fetchToken,
+        CancellationToken cancellationToken = default);
+}
+
+internal partial class OAuth2TokenCache(
+    IOAuth2TokenStore tokenStore,
+    TimeProvider timeProvider,
+    ILogger<OAuth2TokenCache> logger)
+    : IOAuth2TokenCache
+{
+    private readonly IOAuth2TokenStore _tokenStore = tokenStore;
+    private readonly TimeProvider _timeProvider = timeProvider;
+    private readonly ILogger<OAuth2TokenCache> _logger = logger;
+    private readonly ConcurrentDictionary<string, TokenEntry> _entries = new();
+
+    public async Task<OAuth2Token> GetToken(
+        OAuth2Options options,
+        Func<OAuth2Options, Task<OAuth2TokenResponse>> fetchToken,
+        CancellationToken cancellationToken = default)
+    {
+        var key = GetKey(options);
+        var entry = _entries.GetOrAdd(key, _ => new TokenEntry(LoadPersistedToken(key, options)));
+
+        Task<OAuth2Token> fetch;
+        lock (entry)
+        {
+            var now = _timeProvider.GetUtcNow();
+            if (entry.Token is { } token && token.IsUsable(now))
+            {
+                if (token.ShouldBeRefreshed(now) && entry.PendingFetch is null)
+                {
+                    LogRefreshInBackground(token.ExpiresAt);
+                    var refresh = entry.PendingFetch = Fetch(entry, key, options, fetchToken);
+                    _ = refresh.ContinueWith(
+                        task => LogRefreshFailed(task.Exception!.GetBaseException().Message),
+                        CancellationToken.None,
+                        TaskContinuationOptions.OnlyOnFaulted,
+                        TaskScheduler.Default);
+                }
+
+                return token;
+            }
+
+            fetch = entry.PendingFetch ??= Fetch(entry, key, options, fetchToken);
+        }
+
+        return await fetch.WaitAsync(cancellationToken);
+    }
+
+    /// <summary>
+    /// Token is fetched independently on the caller, since other callers (or following requests) may wait for it.
+    /// </summary>
+    private Task<OAuth2Token> Fetch(
+        TokenEntry entry,
+        string key,
+        OAuth2Options options,
+        Func<OAuth2Options, Task<OAuth2TokenResponse>> fetchToken)
+        => Task.Run(async () =>
+        {
+            try
+            {
+                var response = await fetchToken(options);
+                var token = OAuth2Token.Create(response.AccessToken!, response.ExpiresIn, _timeProvider.GetUtcNow());
+
+                lock (entry)
+                {
+                    entry.Token = token;
+                }
+
+                if (options.PersistAccessToken)
+                {
+                    _tokenStore.Save(key, token);
+                }
+
+                return token;
+            }
+            finally
+            {
+                lock (entry)
+                {
+                    entry.PendingFetch = null;
+                }
+            }
+        });
+
+    private OAuth2Token? LoadPersistedToken(string key, OAuth2Options options)
+    {
+        if (options.PersistAccessToken &&
+            _tokenStore.TryLoad(key, out var token) &&
+            token.IsUsable(_timeProvider.GetUtcNow()))
+        {
+            LogPersistedTokenLoaded(token.ExpiresAt);
+            return token;
+        }
+
+        return null;
+    }
+
+    /// <summary>
+    /// Key is hash of the whole configuration, so that secrets don't appear in the cache. Since the configuration may
+    /// contain low-entropy secrets (e.g. passwords), the key itself is never written to the disk - names of files with
+    /// persisted tokens are derived from it by keyed hash (see <see cref="OAuth2TokenStore"/>).
+    /// </summary>
+    private static string GetKey(OAuth2Options options)
+    {
+        var builder = new StringBuilder(options.AuthUrl);
+        foreach (var (name, value) in options.GetParametersAsReadOnly().OrderBy(p => p.Key, StringComparer.Ordinal))
+        {
+            builder.Append('\n').Append(name).Append('=').Append(value);
+        }
+
+        return Convert.ToHexString(SHA256.HashData(Encoding.UTF8.GetBytes(builder.ToString()))).ToLowerInvariant();
+    }
+
+    [LoggerMessage("Access token expiring at {expiresAt} is refreshed in the background.", Level = LogLevel.Trace)]
+    partial void LogRefreshInBackground(DateTimeOffset? expiresAt);
+
+    [LoggerMessage("Background refresh of access token failed: {reason}", Level = LogLevel.Warning)]
+    partial void LogRefreshFailed(string reason);
+
+    [LoggerMessage("Access token valid until {expiresAt} was loaded from the cache folder.", Level = LogLevel.Debug)]
+    partial void LogPersistedTokenLoaded(DateTimeOffset? expiresAt);
+
+    private sealed class TokenEntry(OAuth2Token? token)
+    {
+        public OAuth2Token? Token { get; set; } = token;
+        public Task<OAuth2Token>? PendingFetch { get; set; }
+    }
+}
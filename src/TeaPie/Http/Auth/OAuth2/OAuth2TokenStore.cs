@@ -0,0 +1,202 @@
+﻿using System.Diagnostics.CodeAnalysis;
+using System.Security.Cryptography;
+using System.Text;
+using System.Text.Json;
+using TeaPie.StructureExploration.Paths;
+
+namespace TeaPie.Http.Auth.OAuth2;
+
+internal interface IOAuth2TokenStore
+{
+    bool TryLoad(string key, [NotNullWhen(true)] out OAuth2Token? token);
+
+    void Save(string key, OAuth2Token token);
+}
+
+/// <summary>
+/// Persists access tokens in the cache of the <c>.teapie</c> folder, encrypted by AES-GCM. Encryption key is stored
+/// outside of the <c>.teapie</c> folder (in user's local application data), so the cached tokens are useless for anyone
+/// who has just the folder (e.g. from the repository or CI artifacts). Names of the token files are derived from the
+/// keys by HMAC with (another) key derived from the same local key, so they can't be used to guess the configuration
+/// (including secrets) the tokens were issued for.
+/// </summary>
+internal class OAuth2TokenStore : IOAuth2TokenStore
+{
+    private const string TokenFileExtension = ".token";
+    private const int KeySize = 32;
+    private const int NonceSize = 12;
+    private const int TagSize = 16;
+    private const string FileNameKeyInfo = "TeaPie access token file names";
+
+    private static readonly JsonSerializerOptions _serializerOptions = new()
+    {
+        PropertyNamingPolicy = JsonNamingPolicy.CamelCase
+    };
+
+    private readonly IPathProvider _pathProvider;
+    private readonly string _keyFilePath;
+    private readonly object _lock = new();
+    private byte[]? _key;
+    private byte[]? _fileNameKey;
+
+    public OAuth2TokenStore(IPathProvider pathProvider)
+        : this(pathProvider, GetDefaultKeyFilePath())
+    {
+    }
+
+    internal OAuth2TokenStore(IPathProvider pathProvider, string keyFilePath)
+    {
+        _pathProvider = pathProvider;
+        _keyFilePath = keyFilePath;
+    }
+
+    public bool TryLoad(string key, [NotNullWhen(true)] out OAuth2Token? token)
+    {
+        token = null;
+        if (!CanPersist())
+        {
+            return false;
+        }
+
+        var tokenFilePath = GetTokenFilePath(key);
+        if (string.IsNullOrEmpty(tokenFilePath) || !File.Exists(tokenFilePath))
+        {
+            return false;
+        }
+
+        try
+        {
+            var content = Decrypt(File.ReadAllBytes(tokenFilePath), key);
+            token = JsonSerializer.Deserialize<OAuth2Token>(content, _serializerOptions);
+            return token is not null;
+        }
+        catch (Exception ex) when (ex is CryptographicException or JsonException or IOException)
+        {
+            // Token encrypted by another key or corrupted - it is fetched again and the file is rewritten.
+            return false;
+        }
+    }
+
+    public void Save(string key, OAuth2Token token)
+    {
+        if (!CanPersist() || token.ExpiresAt is null)
+        {
+            return;
+        }
+
+        var tokenFilePath = GetTokenFilePath(key);
+        if (string.IsNullOrEmpty(tokenFilePath))
+        {
+            return;
+        }
+
+        var content = Encrypt(JsonSerializer.SerializeToUtf8Bytes(token, _serializerOptions), key);
+
+        Directory.CreateDirectory(Path.GetDirectoryName(tokenFilePath)!);
+        var temporaryPath = $"{tokenFilePath}.{Guid.NewGuid():N}.tmp";
+        File.WriteAllBytes(temporaryPath, content);
+        File.Move(temporaryPath, tokenFilePath, true);
+    }
+
+    private bool CanPersist() => AesGcm.IsSupported && !string.IsNullOrEmpty(_keyFilePath);
+
+    private string GetTokenFilePath(string key)
+        => string.IsNullOrEmpty(_pathProvider.TeaPieFolderPath)
+            ? string.Empty
+            : Path.Combine(_pathProvider.AccessTokensFolderPath, GetFileName(key) + TokenFileExtension);
+
+    private string GetFileName(string key)
+        => Convert.ToHexString(HMACSHA256.HashData(GetFileNameKey(), Encoding.UTF8.GetBytes(key))).ToLowerInvariant();
+
+    #region Encryption
+
+    private byte[] Encrypt(byte[] plainText, string key)
+    {
+        var result = new byte[NonceSize + TagSize + plainText.Length];
+        var nonce = result.AsSpan(0, NonceSize);
+        var tag = result.AsSpan(NonceSize, TagSize);
+        var cipherText = result.AsSpan(NonceSize + TagSize);
+
+        RandomNumberGenerator.Fill(nonce);
+        using var aes = new AesGcm(GetKey(), TagSize);
+        aes.Encrypt(nonce, plainText, cipherText, tag, Encoding.UTF8.GetBytes(key));
+
+        return result;
+    }
+
+    private byte[] Decrypt(byte[] content, string key)
+    {
+        if (content.Length < NonceSize + TagSize)
+        {
+            throw new CryptographicException("Content of the token file is too short.");
+        }
+
+        var plainText = new byte[content.Length - NonceSize - TagSize];
+        using var aes = new AesGcm(GetKey(), TagSize);
+        aes.Decrypt(
+            content.AsSpan(0, NonceSize),
+            content.AsSpan(NonceSize + TagSize),
+            content.AsSpan(NonceSize, TagSize),
+            plainText,
+            Encoding.UTF8.GetBytes(key));
+
+        return plainText;
+    }
+
+    private byte[] GetKey()
+    {
+        lock (_lock)
+        {
+            return _key ??= LoadOrCreateKey();
+        }
+    }
+
+    /// <summary>
+    /// Separate key is derived for the file names, so that the encryption key isn't used for two purposes.
+    /// </summary>
+    private byte[] GetFileNameKey()
+    {
+        lock (_lock)
+        {
+            return _fileNameKey ??= HKDF.DeriveKey(
+                HashAlgorithmName.SHA256, GetKey(), KeySize, info: Encoding.UTF8.GetBytes(FileNameKeyInfo));
+        }
+    }
+
+    private byte[] LoadOrCreateKey()
+    {
+        if (File.Exists(_keyFilePath))
+        {
+            var existingKey = File.ReadAllBytes(_keyFilePath);
+            if (existingKey.Length == KeySize)
+            {
+                return existingKey;
+            }
+        }
+
+        var key = RandomNumberGenerator.GetBytes(KeySize);
+        Directory.CreateDirectory(Path.GetDirectoryName(_keyFilePath)!);
+
+        using (var stream = new FileStream(_keyFilePath, FileMode.Create, FileAccess.Write))
+        {
+            if (!OperatingSystem.IsWindows())
+            {
+                File.SetUnixFileMode(stream.SafeFileHandle, UnixFileMode.UserRead | UnixFileMode.UserWrite);
+            }
+
+            stream.Write(key);
+        }
+
+        return key;
+    }
+
+    private static string GetDefaultKeyFilePath()
+    {
+        var localApplicationData = Environment.GetFolderPath(Environment.SpecialFolder.LocalApplicationData);
+        return string.IsNullOrEmpty(localApplicationData)
+            ? string.Empty
+            : Path.Combine(localApplicationData, "TeaPie", "access-tokens.key");
+    }
+
+    #endregion
+}
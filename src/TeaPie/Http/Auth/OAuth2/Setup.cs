@@ -1,4 +1,5 @@
 ﻿using Microsoft.Extensions.DependencyInjection;
+using Microsoft.Extensions.DependencyInjection.Extensions;
 
 namespace TeaPie.Http.Auth.OAuth2;
 
@@ -6,7 +7,9 @@ internal static class Setup
 {
     public static IServiceCollection AddOAuth2(this IServiceCollection services)
     {
-        services.AddMemoryCache();
+        services.TryAddSingleton(TimeProvider.System);
+        services.AddSingleton<IOAuth2TokenStore, OAuth2TokenStore>();
+        services.AddSingleton<IOAuth2TokenCache, OAuth2TokenCache>();
         services.AddSingleton<OAuth2Provider>();
         services.AddHttpClient<IAuthProvider<OAuth2Options>, OAuth2Provider>(nameof(OAuth2Provider));
 
@@ -1,5 +1,4 @@
-﻿using Microsoft.Extensions.Caching.Memory;
-using Microsoft.Extensions.DependencyInjection;
+﻿using Microsoft.Extensions.DependencyInjection;
 using Microsoft.Extensions.Logging;
 using TeaPie.Variables;
 
@@ -29,7 +28,7 @@ public static class TeaPieOAuth2Extensions
     {
         var newProvider = new OAuth2Provider(
             teaPie._serviceProvider.GetRequiredService<IHttpClientFactory>(),
-            teaPie._serviceProvider.GetRequiredService<IMemoryCache>(),
+            teaPie._serviceProvider.GetRequiredService<IOAuth2TokenCache>(),
             teaPie._serviceProvider.GetRequiredService<ILogger<OAuth2Provider>>(),
             teaPie._serviceProvider.GetRequiredService<IVariables>());
 
@@ -1,6 +1,8 @@
 ﻿using Microsoft.Extensions.DependencyInjection;
 using TeaPie.Http.Auth.OAuth2;
+using TeaPie.Http.Bodies;
 using TeaPie.Logging;
+using TeaPie.Tracing;
 
 namespace TeaPie.Http.Auth;
 
@@ -9,11 +11,14 @@ internal static class Setup
     public static IServiceCollection AddAuthentication(this IServiceCollection services)
     {
         services.AddTransient<AuthHttpMessageHandler>();
+        services.AddTransient<BodyBufferingHandler>();
 
         services.AddHttpClient<ExecuteRequestStep>()
+            .AddHttpMessageHandler<HttpTracingHandler>()
             .AddHttpMessageHandler<AuthHttpMessageHandler>()
             .AddHttpMessageHandler<RequestsLoggingHandler>()
-            .AddHttpMessageHandler<LoggingInterceptorHandler>();
+            .AddHttpMessageHandler<LoggingInterceptorHandler>()
+            .AddHttpMessageHandler<BodyBufferingHandler>();
 
         services.AddSingleton<IAuthProviderRegistry, AuthProviderRegistry>();
         services.AddSingleton<IAuthProviderAccessor, AuthProviderAccessor>();
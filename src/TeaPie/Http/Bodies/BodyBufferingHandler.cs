@@ -0,0 +1,32 @@
+﻿using TeaPie.Tracing;
+
+namespace TeaPie.Http.Bodies;
+
+/// <summary>
+/// Reads the body of each response exactly once into <see cref="BufferedContent"/>, right after it is received.
+/// All outer handlers and consumers of the response then share the buffered body. It should be the innermost handler
+/// and requests should be sent with <see cref="HttpCompletionOption.ResponseHeadersRead"/>, so the body is not
+/// buffered by <see cref="HttpClient"/> once more.
+/// </summary>
+internal class BodyBufferingHandler : DelegatingHandler
+{
+    protected override async Task<HttpResponseMessage> SendAsync(
+        HttpRequestMessage request, CancellationToken cancellationToken)
+    {
+        var response = await TeaPieTelemetry.TraceHttpPhase(
+            HttpPhases.WaitingForResponse, async () => await base.SendAsync(request, cancellationToken));
+
+        try
+        {
+            await TeaPieTelemetry.TraceHttpPhase(
+                HttpPhases.ReadingResponseBody, async () => await response.BufferContent(cancellationToken));
+        }
+        catch
+        {
+            response.Dispose();
+            throw;
+        }
+
+        return response;
+    }
+}
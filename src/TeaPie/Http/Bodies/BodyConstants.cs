@@ -0,0 +1,23 @@
+﻿namespace TeaPie.Http.Bodies;
+
+internal static class BodyConstants
+{
+    /// <summary>
+    /// Maximal number of bytes of the body, which are held in pooled memory. The rest of the body is buffered
+    /// in a temporary file.
+    /// </summary>
+    public const int MemoryBufferLimit = 4 * 1024 * 1024;
+
+    /// <summary>
+    /// Maximal size (in bytes) of the body, whose decoded text and parsed form are cached.
+    /// Larger bodies are decoded or parsed on each access, directly from the buffer.
+    /// </summary>
+    public const int CachedBodyLimit = MemoryBufferLimit;
+
+    /// <summary>
+    /// Maximal number of characters of the body, which are written to the logs.
+    /// </summary>
+    public const int LoggedBodyLimit = 32 * 1024;
+
+    public const int BufferChunkSize = 64 * 1024;
+}
@@ -0,0 +1,206 @@
+﻿using System.Net;
+using System.Text;
+
+namespace TeaPie.Http.Bodies;
+
+/// <summary>
+/// HTTP content, which body is read only once into <see cref="PooledBodyBuffer"/>. The same buffer is then used
+/// for sending of the content (e.g. by retries), for logging and for resolution of request variables.
+/// Decoded text and parsed forms of the body are cached, if the body doesn't exceed
+/// <see cref="BodyConstants.CachedBodyLimit"/>.
+/// </summary>
+internal sealed class BufferedContent : HttpContent
+{
+    private const string ContentLengthHeaderName = "Content-Length";
+
+    private readonly PooledBodyBuffer _buffer;
+    private readonly Dictionary<Type, object> _parsedBodies = [];
+    private readonly object _lock = new();
+    private string? _text;
+    private bool _disposed;
+
+    private BufferedContent(PooledBodyBuffer buffer)
+    {
+        _buffer = buffer;
+    }
+
+    public long Length => _buffer.Length;
+
+    private bool IsCacheable => _buffer.Length <= BodyConstants.CachedBodyLimit;
+
+    /// <summary>
+    /// Reads given <paramref name="content"/> into the buffer, if it isn't buffered yet. Headers of the original
+    /// content are preserved.
+    /// </summary>
+    /// <param name="content">Content to be buffered.</param>
+    /// <param name="cancellationToken">Token to cancel reading of the content.</param>
+    /// <returns>Buffered content - either <paramref name="content"/> itself, or the new instance.</returns>
+    public static async Task<BufferedContent> From(HttpContent content, CancellationToken cancellationToken = default)
+    {
+        if (content is BufferedContent bufferedContent)
+        {
+            return bufferedContent;
+        }
+
+        PooledBodyBuffer buffer;
+        using (var stream = await content.ReadAsStreamAsync(cancellationToken))
+        {
+            buffer = await PooledBodyBuffer.Create(stream, cancellationToken: cancellationToken);
+        }
+
+        var result = new BufferedContent(buffer);
+        result.CopyHeadersFrom(content);
+        return result;
+    }
+
+    /// <summary>
+    /// Creates new content without any headers, which shares the buffer with this content.
+    /// </summary>
+    /// <returns>New content with the same body.</returns>
+    public BufferedContent Share() => new(_buffer.Acquire());
+
+    /// <summary>
+    /// Copies headers of the <paramref name="source"/> content, which are not present on this content yet.
+    /// </summary>
+    /// <param name="source">Content, from which headers are copied.</param>
+    public void CopyHeadersFrom(HttpContent source)
+    {
+        foreach (var header in source.Headers)
+        {
+            if (!header.Key.Equals(ContentLengthHeaderName, StringComparison.OrdinalIgnoreCase) &&
+                !Headers.Contains(header.Key))
+            {
+                Headers.TryAddWithoutValidation(header.Key, header.Value);
+            }
+        }
+    }
+
+    public Stream OpenRead() => new PooledBodyBufferStream(_buffer.Acquire());
+
+    public string ReadAsText()
+    {
+        if (_text is not null)
+        {
+            return _text;
+        }
+
+        using var reader = CreateReader();
+        var text = reader.ReadToEnd();
+
+        if (IsCacheable)
+        {
+            _text = text;
+        }
+
+        return text;
+    }
+
+    /// <summary>
+    /// Reads at most <paramref name="maxLength"/> characters of the body. Only the needed part of the body is decoded.
+    /// </summary>
+    /// <param name="maxLength">Maximal number of returned characters.</param>
+    /// <param name="isTruncated">Whether the body is longer than returned text.</param>
+    /// <returns>Beginning of the body's text.</returns>
+    public string ReadAsText(int maxLength, out bool isTruncated)
+    {
+        if (_text is not null)
+        {
+            isTruncated = _text.Length > maxLength;
+            return isTruncated ? _text[..maxLength] : _text;
+        }
+
+        using var reader = CreateReader();
+        var characters = new char[maxLength];
+        var count = reader.ReadBlock(characters, 0, maxLength);
+
+        isTruncated = reader.Peek() >= 0;
+        return new string(characters, 0, count);
+    }
+
+    /// <summary>
+    /// Gets the body parsed by the <paramref name="parse"/> function. Parsed body is cached per type, so each body
+    /// is parsed at most once (unless it exceeds <see cref="BodyConstants.CachedBodyLimit"/>).
+    /// </summary>
+    /// <typeparam name="TParsed">Type of the parsed body.</typeparam>
+    /// <param name="parse">Function which parses the body from the stream.</param>
+    /// <returns>Parsed body.</returns>
+    public TParsed GetParsed<TParsed>(Func<Stream, TParsed> parse)
+        where TParsed : class
+    {
+        lock (_lock)
+        {
+            if (_parsedBodies.TryGetValue(typeof(TParsed), out var parsed))
+            {
+                return (TParsed)parsed;
+            }
+        }
+
+        TParsed result;
+        using (var stream = OpenRead())
+        {
+            result = parse(stream);
+        }
+
+        if (IsCacheable)
+        {
+            lock (_lock)
+            {
+                _parsedBodies[typeof(TParsed)] = result;
+            }
+        }
+
+        return result;
+    }
+
+    private StreamReader CreateReader()
+        => new(OpenRead(), GetEncoding(), detectEncodingFromByteOrderMarks: true);
+
+    private Encoding GetEncoding()
+    {
+        var charSet = Headers.ContentType?.CharSet?.Trim('"');
+        if (string.IsNullOrEmpty(charSet))
+        {
+            return Encoding.UTF8;
+        }
+
+        try
+        {
+            return Encoding.GetEncoding(charSet);
+        }
+        catch (ArgumentException)
+        {
+            return Encoding.UTF8;
+        }
+    }
+
+    protected override async Task SerializeToStreamAsync(Stream stream, TransportContext? context)
+        => await SerializeToStreamAsync(stream, context, CancellationToken.None);
+
+    protected override async Task SerializeToStreamAsync(
+        Stream stream, TransportContext? context, CancellationToken cancellationToken)
+    {
+        using var source = OpenRead();
+        await source.CopyToAsync(stream, BodyConstants.BufferChunkSize, cancellationToken);
+    }
+
+    protected override bool TryComputeLength(out long length)
+    {
+        length = _buffer.Length;
+        return true;
+    }
+
+    protected override Task<Stream> CreateContentReadStreamAsync() => Task.FromResult(OpenRead());
+
+    protected override Stream CreateContentReadStream(CancellationToken cancellationToken) => OpenRead();
+
+    protected override void Dispose(bool disposing)
+    {
+        if (disposing && !_disposed)
+        {
+            _disposed = true;
+            _buffer.Release();
+        }
+
+        base.Dispose(disposing);
+    }
+}
@@ -0,0 +1,84 @@
+﻿namespace TeaPie.Http.Bodies;
+
+internal static class BufferedContentExtensions
+{
+    /// <summary>
+    /// Replaces content of the <paramref name="request"/> by <see cref="BufferedContent"/>, if it isn't buffered yet.
+    /// </summary>
+    /// <param name="request">Request which content should be buffered.</param>
+    /// <param name="cancellationToken">Token to cancel reading of the content.</param>
+    /// <returns>Buffered content or <see langword="null"/> if request doesn't have any content.</returns>
+    public static async Task<BufferedContent?> BufferContent(
+        this HttpRequestMessage request, CancellationToken cancellationToken = default)
+    {
+        if (request.Content is null)
+        {
+            return null;
+        }
+
+        var bufferedContent = await Buffer(request.Content, cancellationToken);
+        request.Content = bufferedContent;
+        return bufferedContent;
+    }
+
+    /// <summary>
+    /// Replaces content of the <paramref name="response"/> by <see cref="BufferedContent"/>, if it isn't buffered yet.
+    /// </summary>
+    /// <param name="response">Response which content should be buffered.</param>
+    /// <param name="cancellationToken">Token to cancel reading of the content.</param>
+    /// <returns>Buffered content or <see langword="null"/> if response doesn't have any content.</returns>
+    public static async Task<BufferedContent?> BufferContent(
+        this HttpResponseMessage response, CancellationToken cancellationToken = default)
+    {
+        if (response.Content is null)
+        {
+            return null;
+        }
+
+        var bufferedContent = await Buffer(response.Content, cancellationToken);
+        response.Content = bufferedContent;
+        return bufferedContent;
+    }
+
+    /// <summary>
+    /// Reads text of the <paramref name="content"/>, which is suitable for logging - it is truncated to
+    /// <see cref="BodyConstants.LoggedBodyLimit"/> characters.
+    /// </summary>
+    /// <param name="content">Content to be read.</param>
+    /// <param name="cancellationToken">Token to cancel reading of the content.</param>
+    /// <returns>(Possibly truncated) text of the content.</returns>
+    public static async Task<string> ReadAsLoggableText(
+        this HttpContent content, CancellationToken cancellationToken = default)
+    {
+        string text;
+        bool isTruncated;
+        long length;
+
+        if (content is BufferedContent bufferedContent)
+        {
+            text = bufferedContent.ReadAsText(BodyConstants.LoggedBodyLimit, out isTruncated);
+            length = bufferedContent.Length;
+        }
+        else
+        {
+            text = await content.ReadAsStringAsync(cancellationToken);
+            isTruncated = text.Length > BodyConstants.LoggedBodyLimit;
+            length = text.Length;
+            text = isTruncated ? text[..BodyConstants.LoggedBodyLimit] : text;
+        }
+
+        return isTruncated ? $"{text}... (truncated, total length: {length})" : text;
+    }
+
+    private static async Task<BufferedContent> Buffer(HttpContent content, CancellationToken cancellationToken)
+    {
+        if (content is BufferedContent bufferedContent)
+        {
+            return bufferedContent;
+        }
+
+        bufferedContent = await BufferedContent.From(content, cancellationToken);
+        content.Dispose();
+        return bufferedContent;
+    }
+}
@@ -0,0 +1,140 @@
+﻿using System.Buffers;
+
+namespace TeaPie.Http.Bodies;
+
+/// <summary>
+/// Read-only buffer of the body, which is filled only once. Body is stored in chunks rented from
+/// <see cref="ArrayPool{T}.Shared"/> up to the <c>memoryLimit</c>, the rest is written to the temporary file,
+/// so memory consumption stays bounded even for huge bodies. Buffer is shared by reference counting, chunks are
+/// returned to the pool when the last reference is released.
+/// </summary>
+internal sealed class PooledBodyBuffer
+{
+    private readonly List<byte[]> _chunks = [];
+    private readonly long _memoryLimit;
+    private long _memoryLength;
+    private FileStream? _overflow;
+    private int _references = 1;
+
+    private PooledBodyBuffer(long memoryLimit)
+    {
+        _memoryLimit = memoryLimit;
+    }
+
+    public long Length { get; private set; }
+
+    public bool IsInMemory => _overflow is null;
+
+    public static async Task<PooledBodyBuffer> Create(
+        Stream source,
+        long memoryLimit = BodyConstants.MemoryBufferLimit,
+        CancellationToken cancellationToken = default)
+    {
+        var buffer = new PooledBodyBuffer(memoryLimit);
+        try
+        {
+            await buffer.Fill(source, cancellationToken);
+        }
+        catch
+        {
+            buffer.Release();
+            throw;
+        }
+
+        return buffer;
+    }
+
+    private async Task Fill(Stream source, CancellationToken cancellationToken)
+    {
+        int read;
+        do
+        {
+            if (_memoryLength >= _memoryLimit)
+            {
+                await FillOverflow(source, cancellationToken);
+                return;
+            }
+
+            var offset = (int)(_memoryLength % BodyConstants.BufferChunkSize);
+            if (offset == 0 && _memoryLength / BodyConstants.BufferChunkSize == _chunks.Count)
+            {
+                _chunks.Add(ArrayPool<byte>.Shared.Rent(BodyConstants.BufferChunkSize));
+            }
+
+            var count = (int)Math.Min(BodyConstants.BufferChunkSize - offset, _memoryLimit - _memoryLength);
+            read = await source.ReadAsync(_chunks[^1].AsMemory(offset, count), cancellationToken);
+
+            _memoryLength += read;
+            Length += read;
+        } while (read > 0);
+    }
+
+    private async Task FillOverflow(Stream source, CancellationToken cancellationToken)
+    {
+        _overflow = new FileStream(
+            Path.Combine(Path.GetTempPath(), Path.GetRandomFileName()),
+            FileMode.CreateNew,
+            FileAccess.ReadWrite,
+            FileShare.None,
+            BodyConstants.BufferChunkSize,
+            FileOptions.Asynchronous | FileOptions.DeleteOnClose);
+
+        await source.CopyToAsync(_overflow, BodyConstants.BufferChunkSize, cancellationToken);
+        await _overflow.FlushAsync(cancellationToken);
+
+        Length += _overflow.Length;
+    }
+
+    /// <summary>
+    /// Reads bytes of the body starting at the given <paramref name="position"/>. Reading doesn't change any state
+    /// of the buffer, so more readers can read the buffer at the same time.
+    /// </summary>
+    /// <param name="position">Position in the body, from which bytes are read.</param>
+    /// <param name="destination">Destination, to which bytes are copied.</param>
+    /// <returns>Number of read bytes, <c>0</c> if the end of the body was reached.</returns>
+    public int Read(long position, Span<byte> destination)
+    {
+        if (position >= Length || destination.IsEmpty)
+        {
+            return 0;
+        }
+
+        if (position >= _memoryLength)
+        {
+            return RandomAccess.Read(_overflow!.SafeFileHandle, destination, position - _memoryLength);
+        }
+
+        var offset = (int)(position % BodyConstants.BufferChunkSize);
+        var count = (int)Math.Min(
+            Math.Min(destination.Length, BodyConstants.BufferChunkSize - offset), _memoryLength - position);
+
+        _chunks[(int)(position / BodyConstants.BufferChunkSize)].AsSpan(offset, count).CopyTo(destination);
+        return count;
+    }
+
+    public PooledBodyBuffer Acquire()
+    {
+        if (Interlocked.Increment(ref _references) <= 1)
+        {
+            throw new ObjectDisposedException(nameof(PooledBodyBuffer));
+        }
+
+        return this;
+    }
+
+    public void Release()
+    {
+        if (Interlocked.Decrement(ref _references) != 0)
+        {
+            return;
+        }
+
+        foreach (var chunk in _chunks)
+        {
+            ArrayPool<byte>.Shared.Return(chunk);
+        }
+
+        _chunks.Clear();
+        _overflow?.Dispose();
+    }
+}
@@ -1,6 +1,9 @@
 ﻿using Microsoft.Extensions.Logging;
 using Polly;
+using System.Diagnostics;
+using TeaPie.Benchmarking;
 using TeaPie.Http.Auth;
+using TeaPie.Http.Bodies;
 using TeaPie.Http.Headers;
 using TeaPie.Logging.Tree;
 using TeaPie.Pipelines;
@@ -14,6 +17,7 @@ internal class ExecuteRequestStep(
     IHeadersHandler headersHandler,
     IAuthProviderAccessor defaultAuthProviderAccessor,
     ITestScheduler testScheduler,
+    IBenchmarkRecorder benchmarkRecorder,
     IPipeline pipeline)
     : IPipelineStep
 {
@@ -23,6 +27,7 @@ internal class ExecuteRequestStep(
     private readonly IAuthProviderAccessor _authProviderAccessor = defaultAuthProviderAccessor;
     private readonly IPipeline _pipeline = pipeline;
     private readonly ITestScheduler _testScheduler = testScheduler;
+    private readonly IBenchmarkRecorder _benchmarkRecorder = benchmarkRecorder;
     private static readonly HttpRequestOptionsKey<RequestExecutionContext> _contextKey = new("__TeaPie_Context__");
 
     public async Task Execute(ApplicationContext context, CancellationToken cancellationToken = default)
@@ -100,9 +105,7 @@ internal class ExecuteRequestStep(
         CancellationToken cancellationToken)
     {
         var originalMessage = request;
-        var content = originalMessage.Content is not null
-            ? await originalMessage.Content.ReadAsStringAsync(cancellationToken)
-            : string.Empty;
+        await originalMessage.BufferContent(cancellationToken);
         var messageUsed = false;
         var retryAttemptNumber = -1;
 
@@ -111,21 +114,55 @@ internal class ExecuteRequestStep(
         return await resiliencePipeline.ExecuteAsync(async token =>
         {
             retryAttemptNumber = UpdateRetryAttemptNumber(logger, retryAttemptNumber);
-            var requestToSend = GetMessage(requestExecutionContext, originalMessage, content, ref messageUsed);
+            var requestToSend = GetMessage(requestExecutionContext, originalMessage, ref messageUsed);
             requestToSend.Options.Set(_contextKey, requestExecutionContext);
 
             if (retryAttemptNumber > 0)
             {
                 using (logger.BeginTreeScope())
                 {
-                    return await client.SendAsync(requestToSend, token);
+                    return await Send(requestExecutionContext, requestToSend, client, token);
                 }
             }
 
-            return await client.SendAsync(requestToSend, token);
+            return await Send(requestExecutionContext, requestToSend, client, token);
         }, cancellationToken);
     }
 
+    private async Task<HttpResponseMessage> Send(
+        RequestExecutionContext requestExecutionContext,
+        HttpRequestMessage request,
+        HttpClient client,
+        CancellationToken cancellationToken)
+    {
+        if (!_benchmarkRecorder.IsRecording)
+        {
+            return await client.SendAsync(request, HttpCompletionOption.ResponseHeadersRead, cancellationToken);
+        }
+
+        var startTimestamp = Stopwatch.GetTimestamp();
+        var succeeded = false;
+        try
+        {
+            var response = await client.SendAsync(request, HttpCompletionOption.ResponseHeadersRead, cancellationToken);
+            succeeded = true;
+            return response;
+        }
+        finally
+        {
+            _benchmarkRecorder.Record(
+                requestExecutionContext.RequestFile.RelativePath,
+                GetBenchmarkedRequestName(requestExecutionContext),
+                Stopwatch.GetElapsedTime(startTimestamp),
+                succeeded);
+        }
+    }
+
+    private static string GetBenchmarkedRequestName(RequestExecutionContext requestExecutionContext)
+        => string.IsNullOrEmpty(requestExecutionContext.Name)
+            ? $"#{requestExecutionContext.Position}"
+            : requestExecutionContext.Name;
+
     private static int UpdateRetryAttemptNumber(ILogger logger, int retryAttempt)
     {
         retryAttempt++;
@@ -140,7 +177,6 @@ internal class ExecuteRequestStep(
     private HttpRequestMessage GetMessage(
         RequestExecutionContext requestExecutionContext,
         HttpRequestMessage originalMessage,
-        string content,
         ref bool messageUsed)
     {
         var request = originalMessage;
@@ -150,23 +186,26 @@ internal class ExecuteRequestStep(
         }
         else
         {
-            request = CloneMessage(originalMessage, content);
+            request = CloneMessage(originalMessage);
             requestExecutionContext.Request = request;
         }
 
         return request;
     }
 
-    private HttpRequestMessage CloneMessage(
-        HttpRequestMessage originalMessage,
-        string content)
+    private HttpRequestMessage CloneMessage(HttpRequestMessage originalMessage)
     {
+        var content = (originalMessage.Content as BufferedContent)?.Share();
         var request = new HttpRequestMessage(originalMessage.Method, originalMessage.RequestUri)
         {
-            Content = new StringContent(content)
+            Content = content
         };
 
         _headersHandler.SetHeaders(originalMessage, request);
+
+        // Content headers without dedicated handler would be lost otherwise.
+        content?.CopyHeadersFrom(originalMessage.Content!);
+
         return request;
     }
 
@@ -34,11 +34,13 @@ internal partial class GenerateStepsForRequestsStep(ITestCaseExecutionContextAcc
     {
         List<IPipelineStep> newSteps = [];
         RequestExecutionContext requestExecutionContext;
+        var position = 0;
         foreach (var requestContent in separatedRequests)
         {
             requestExecutionContext = new(testCaseExecutionContext.TestCase.RequestsFile, testCaseExecutionContext)
             {
-                RawContent = requestContent
+                RawContent = requestContent,
+                Position = ++position
             };
 
             newSteps.AddRange(
@@ -1,5 +1,6 @@
 ﻿using System.Text.Json;
 using System.Text.Json.Serialization;
+using TeaPie.Http.Bodies;
 using TeaPie.Json;
 using Serializer = System.Text.Json.JsonSerializer;
 
@@ -133,7 +134,12 @@ public static class HttpMessagesExtensions
     #endregion
 
     private static async Task<string> GetBody(HttpContent? content)
-        => content is null ? string.Empty : await content.ReadAsStringAsync();
+        => content switch
+        {
+            null => string.Empty,
+            BufferedContent bufferedContent => bufferedContent.ReadAsText(),
+            _ => await content.ReadAsStringAsync()
+        };
 
     /// <summary>
     /// Gets the status code as an <see cref="int"/> from the specified <paramref name="response"/>.
@@ -3,40 +3,51 @@ using TeaPie.Http.Parsing;
 using TeaPie.Logging;
 using TeaPie.Logging.Tree;
 using TeaPie.Pipelines;
+using TeaPie.Tracing;
 using Timer = TeaPie.Logging.Timer;
 
 namespace TeaPie.Http;
 
-internal class ParseHttpRequestStep(IRequestExecutionContextAccessor contextAccessor, IHttpRequestParser parser) : IPipelineStep
+internal class ParseHttpRequestStep(
+    IRequestExecutionContextAccessor contextAccessor,
+    IHttpRequestParser parser,
+    IStepsTracer tracer) : IPipelineStep
 {
     private readonly IRequestExecutionContextAccessor _requestExecutionContextAccessor = contextAccessor;
     private readonly IHttpRequestParser _parser = parser;
+    private readonly IStepsTracer _tracer = tracer;
 
     public async Task Execute(ApplicationContext context, CancellationToken cancellationToken = default)
     {
         ValidateContext(out var requestExecutionContext);
 
-        Parse(context, requestExecutionContext);
+        await Parse(context, requestExecutionContext);
+
+        // Scope is opened after parsing, so the name of the request is already known. It still covers this step.
+        requestExecutionContext.TracingScope ??= _tracer.BeginScope("Request", GetRequestName(requestExecutionContext));
 
         requestExecutionContext.TestCaseExecutionContext?.RegisterRequest(
             requestExecutionContext.Request!,
             requestExecutionContext.Name);
-
-        await Task.CompletedTask;
     }
 
-    private void Parse(ApplicationContext context, RequestExecutionContext requestExecutionContext)
+    private async Task Parse(ApplicationContext context, RequestExecutionContext requestExecutionContext)
     {
         using (context.Logger.BeginTreeScope())
         {
             LogParsingStart(context, requestExecutionContext);
 
-            Timer.Execute(
-                () => _parser.Parse(requestExecutionContext),
+            await Timer.Execute(
+                async () => await _parser.Parse(requestExecutionContext),
                 elapsedTime => LogEndOfParsing(context, requestExecutionContext, elapsedTime));
         }
     }
 
+    private static string GetRequestName(RequestExecutionContext requestExecutionContext)
+        => requestExecutionContext.Name.Equals(string.Empty)
+            ? $"#{requestExecutionContext.Position} ({requestExecutionContext.RequestFile.RelativePath})"
+            : requestExecutionContext.Name;
+
     private static void LogParsingStart(ApplicationContext context, RequestExecutionContext requestExecutionContext)
         => context.Logger.LogTrace("Parsing of the request at path '{Path}' started.",
             requestExecutionContext.RequestFile.RelativePath);
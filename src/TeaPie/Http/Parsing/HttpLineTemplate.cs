@@ -0,0 +1,134 @@
+﻿using System.Diagnostics;
+using System.Text.RegularExpressions;
+
+namespace TeaPie.Http.Parsing;
+
+[DebuggerDisplay("{Probe}")]
+internal partial class HttpLineTemplate
+{
+    private const string SlotPlaceholder = "value";
+
+    private bool _isClassifiedAsBody;
+    private bool _isClassifiedWithMethodAndUri;
+
+    private HttpLineTemplate(IReadOnlyList<HttpTemplateSegment> segments)
+    {
+        Segments = segments;
+        HasVariables = segments.Any(s => s is HttpTemplateSegment.Variable);
+        IsConstant = segments.All(s => s is HttpTemplateSegment.Literal);
+        IsShapeDependent = !IsConstant && !StartsWithLiteral(segments);
+        Probe = string.Concat(segments.Select(s => s is HttpTemplateSegment.Literal literal ? literal.Text : SlotPlaceholder));
+    }
+
+    public IReadOnlyList<HttpTemplateSegment> Segments { get; }
+
+    public bool HasVariables { get; }
+
+    /// <summary>
+    /// Indicates whether line consists of literal text only, so it doesn't need to be resolved at all.
+    /// </summary>
+    public bool IsConstant { get; }
+
+    /// <summary>
+    /// Indicates whether kind of the line (comment, directive, header...) can't be determined without values of its
+    /// slots - e.g. when the whole line is made of single variable.
+    /// </summary>
+    public bool IsShapeDependent { get; }
+
+    /// <summary>
+    /// Text of the line, in which all slots are replaced by placeholder. It is used for classification of the line.
+    /// </summary>
+    public string Probe { get; }
+
+    public ILineParser? Parser { get; private set; }
+
+    public void Classify(ILineParser? parser, HttpParsingContext context)
+    {
+        Parser = parser;
+        _isClassifiedAsBody = context.IsBody;
+        _isClassifiedWithMethodAndUri = context.IsMethodAndUriResolved;
+    }
+
+    /// <summary>
+    /// Checks whether pre-computed <see cref="Parser"/> is applicable for the line in the given parsing
+    /// <paramref name="context"/>. It is not, if the line is shape-dependent or if the state of parsing differs from the
+    /// one, in which line was classified.
+    /// </summary>
+    /// <param name="context">Current parsing context.</param>
+    /// <returns><c>true</c> if <see cref="Parser"/> can be used, <c>false</c> otherwise.</returns>
+    public bool IsClassifiedFor(HttpParsingContext context)
+        => !IsShapeDependent
+            && _isClassifiedAsBody == context.IsBody
+            && _isClassifiedWithMethodAndUri == context.IsMethodAndUriResolved;
+
+    public static HttpLineTemplate Create(string line)
+    {
+        var segments = new List<HttpTemplateSegment>();
+        Tokenize(line, VariableNotationPatternRegex(), name => new HttpTemplateSegment.Variable(name), segments);
+
+        // Functions are resolved after variables, so values of variables can be used as parameters of functions.
+        // That's why functions are pre-tokenized only within lines without any variable.
+        if (!segments.Any(s => s is HttpTemplateSegment.Variable))
+        {
+            segments.Clear();
+            Tokenize(
+                line, FunctionNotationPatternRegex(), expression => new HttpTemplateSegment.Function(expression), segments);
+        }
+
+        return new HttpLineTemplate(segments);
+    }
+
+    private static void Tokenize(
+        string line,
+        Regex slotRegex,
+        Func<string, HttpTemplateSegment> slotFactory,
+        List<HttpTemplateSegment> segments)
+    {
+        var position = 0;
+        foreach (Match match in slotRegex.Matches(line))
+        {
+            AddLiteral(line[position..match.Index], segments);
+            segments.Add(slotFactory(match.Groups[1].Value));
+            position = match.Index + match.Length;
+        }
+
+        AddLiteral(line[position..], segments);
+
+        if (segments.Count == 0)
+        {
+            segments.Add(new HttpTemplateSegment.Literal(string.Empty));
+        }
+    }
+
+    private static void AddLiteral(string text, List<HttpTemplateSegment> segments)
+    {
+        if (text.Length > 0)
+        {
+            segments.Add(new HttpTemplateSegment.Literal(text));
+        }
+    }
+
+    private static bool StartsWithLiteral(IReadOnlyList<HttpTemplateSegment> segments)
+    {
+        foreach (var segment in segments)
+        {
+            if (segment is not HttpTemplateSegment.Literal literal)
+            {
+                return false;
+            }
+
+            if (!string.IsNullOrWhiteSpace(literal.Text))
+            {
+                return true;
+            }
+        }
+
+        return false;
+    }
+
+    [GeneratedRegex(HttpFileParserConstants.VariableNotationPattern)]
+    private static partial Regex VariableNotationPatternRegex();
+
+    [GeneratedRegex(HttpFileParserConstants.FunctionNotationPattern)]
+    private static partial Regex FunctionNotationPatternRegex();
+}
@@ -1,4 +1,5 @@
-﻿using System.Text;
+﻿using System.Collections.Concurrent;
+using System.Text;
 using TeaPie.Functions;
 using TeaPie.Http.Auth;
 using TeaPie.Http.Headers;
@@ -10,7 +11,7 @@ namespace TeaPie.Http.Parsing;
 
 internal interface IHttpRequestParser
 {
-    void Parse(RequestExecutionContext requestExecutionContext);
+    Task Parse(RequestExecutionContext requestExecutionContext);
 }
 
 internal class HttpRequestParser(
@@ -33,7 +34,9 @@ internal class HttpRequestParser(
     private readonly ITestFactory _testFactory = testFactory;
     private readonly ITestScheduler _testScheduler = testScheduler;
 
-    private readonly IEnumerable<ILineParser> _lineParsers =
+    private readonly ConcurrentDictionary<string, HttpRequestTemplate> _templates = new();
+
+    private readonly IReadOnlyList<ILineParser> _lineParsers =
     [
         new CommentLineParser(),
         new DirectivesLineParser(),
@@ -43,7 +46,7 @@ internal class HttpRequestParser(
         new BodyParser()
     ];
 
-    public void Parse(RequestExecutionContext requestExecutionContext)
+    public async Task Parse(RequestExecutionContext requestExecutionContext)
     {
         var parsingContext = new HttpParsingContext(_headersProvider.GetDefaultHeaders());
 
@@ -52,28 +55,57 @@ internal class HttpRequestParser(
             throw new InvalidOperationException("Unable to parse file, which content is null.");
         }
 
-        var content = requestExecutionContext.RawContent.Replace(Constants.WindowsEndOfLine, Constants.UnixEndOfLine);
-        foreach (var line in content.Split(Constants.UnixEndOfLine))
-        {
-            var resolvedLine = _variablesResolver.ResolveVariablesInLine(line, requestExecutionContext);
-            resolvedLine = _functionsResolver.ResolveFunctionsInLine(resolvedLine);
+        var template = _templates.GetOrAdd(
+            requestExecutionContext.RawContent, content => HttpRequestTemplate.Compile(content, _lineParsers));
 
-            ParseLine(resolvedLine, parsingContext);
+        foreach (var line in template.Lines)
+        {
+            var resolvedLine = await ResolveLine(line, requestExecutionContext);
+            ParseLine(line, resolvedLine, parsingContext);
         }
 
         UpdateState(requestExecutionContext, parsingContext);
     }
 
-    private void ParseLine(string line, HttpParsingContext context)
+    private async Task<string> ResolveLine(HttpLineTemplate line, RequestExecutionContext requestExecutionContext)
     {
-        foreach (var parser in _lineParsers)
+        if (line.IsConstant)
+        {
+            return ((HttpTemplateSegment.Literal)line.Segments[0]).Text;
+        }
+
+        var builder = new StringBuilder();
+        foreach (var segment in line.Segments)
         {
-            if (parser.CanParse(line, context))
+            switch (segment)
             {
-                parser.Parse(line, context);
-                break;
+                case HttpTemplateSegment.Literal literal:
+                    builder.Append(literal.Text);
+                    break;
+                case HttpTemplateSegment.Variable variable:
+                    builder.Append(await _variablesResolver.ResolveVariable(variable.Name, requestExecutionContext));
+                    break;
+                case HttpTemplateSegment.Function function:
+                    builder.Append(_functionsResolver.ResolveFunction(function.Expression));
+                    break;
             }
         }
+
+        var resolvedLine = builder.ToString();
+
+        // Functions within lines with variables are not pre-tokenized, since their parameters may come from variables.
+        return line.HasVariables && resolvedLine.Contains(HttpFileParserConstants.FunctionNotationPrefix)
+            ? _functionsResolver.ResolveFunctionsInLine(resolvedLine)
+            : resolvedLine;
+    }
+
+    private void ParseLine(HttpLineTemplate line, string resolvedLine, HttpParsingContext context)
+    {
+        var parser = line.IsClassifiedFor(context)
+            ? line.Parser
+            : _lineParsers.FirstOrDefault(p => p.CanParse(resolvedLine, context));
+
+        parser?.Parse(resolvedLine, context);
     }
 
     private void UpdateState(RequestExecutionContext requestExecutionContext, HttpParsingContext parsingContext)
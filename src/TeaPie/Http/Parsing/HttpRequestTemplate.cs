@@ -0,0 +1,53 @@
+﻿namespace TeaPie.Http.Parsing;
+
+/// <summary>
+/// Pre-compiled form of the request definition. Each line is tokenized into literal segments and slots for variables
+/// and functions and it is classified by the parser which should process it. Template is built only once per request
+/// definition and it is then re-used for every execution of the request, which only fills the slots.
+/// </summary>
+internal class HttpRequestTemplate
+{
+    private HttpRequestTemplate(IReadOnlyList<HttpLineTemplate> lines)
+    {
+        Lines = lines;
+    }
+
+    public IReadOnlyList<HttpLineTemplate> Lines { get; }
+
+    public static HttpRequestTemplate Compile(string rawContent, IReadOnlyList<ILineParser> lineParsers)
+    {
+        var content = rawContent.Replace(Constants.WindowsEndOfLine, Constants.UnixEndOfLine);
+        var lines = content.Split(Constants.UnixEndOfLine).Select(HttpLineTemplate.Create).ToList();
+
+        Classify(lines, lineParsers);
+
+        return new HttpRequestTemplate(lines);
+    }
+
+    private static void Classify(List<HttpLineTemplate> lines, IReadOnlyList<ILineParser> lineParsers)
+    {
+        using var message = new HttpRequestMessage();
+        var state = new HttpParsingContext(message.Headers);
+
+        foreach (var line in lines)
+        {
+            var parser = lineParsers.FirstOrDefault(p => p.CanParse(line.Probe, state));
+            line.Classify(parser, state);
+
+            UpdateState(parser, state);
+        }
+    }
+
+    // Only request line and the first empty line after it change the way how following lines are parsed.
+    private static void UpdateState(ILineParser? parser, HttpParsingContext state)
+    {
+        if (parser is MethodAndUriParser)
+        {
+            state.IsMethodAndUriResolved = true;
+        }
+        else if (parser is EmptyLineParser && state.IsMethodAndUriResolved)
+        {
+            state.IsBody = true;
+        }
+    }
+}
@@ -0,0 +1,11 @@
+﻿using Dunet;
+
+namespace TeaPie.Http.Parsing;
+
+[Union]
+internal partial record HttpTemplateSegment
+{
+    public partial record Literal(string Text);
+    public partial record Variable(string Name);
+    public partial record Function(string Expression);
+}
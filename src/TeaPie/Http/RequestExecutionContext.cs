@@ -12,14 +12,18 @@ internal class RequestExecutionContext(InternalFile requestFile, TestCaseExecuti
     public TestCaseExecutionContext? TestCaseExecutionContext { get; set; } = testCaseExecutionContext;
     public InternalFile RequestFile { get; set; } = requestFile;
     public string Name { get; set; } = string.Empty;
+    public int Position { get; set; } = 1;
     public string? RawContent { get; set; }
     public HttpRequestMessage? Request { get; set; }
     public HttpResponseMessage? Response { get; set; }
     public ResiliencePipeline<HttpResponseMessage>? ResiliencePipeline { get; set; }
     public IAuthProvider? AuthProvider { get; set; }
+    public IDisposable? TracingScope { get; set; }
 
     public void Dispose()
     {
         RawContent = null;
+        TracingScope?.Dispose();
+        TracingScope = null;
     }
 }
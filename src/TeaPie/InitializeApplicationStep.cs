@@ -31,7 +31,8 @@ internal class InitializeApplicationStep(
     {
         DeleteOldTempFolderIfNeeded();
 
-        await DownloadAndInstallGlobalNuGetPackages(context.Logger);
+        _nuGetPackageHandler.UseOptions(context.NuGet);
+        await DownloadAndInstallGlobalNuGetPackages(context.Logger, cancellationToken);
 
         ResolveAuthProviders(context.Logger);
 
@@ -58,9 +59,9 @@ internal class InitializeApplicationStep(
             AuthConstants.NoAuthKey, AuthConstants.OAuth2Key);
     }
 
-    private async Task DownloadAndInstallGlobalNuGetPackages(ILogger logger)
+    private async Task DownloadAndInstallGlobalNuGetPackages(ILogger logger, CancellationToken cancellationToken)
     {
-        await _nuGetPackageHandler.HandleNuGetPackages(ScriptsConstants.DefaultNuGetPackages);
+        await _nuGetPackageHandler.HandleNuGetPackages(ScriptsConstants.DefaultNuGetPackages, cancellationToken);
 
         logger.LogTrace("Default NuGet packages were successfully added: ({NuGetPackages})",
             string.Join(", ", ScriptsConstants.DefaultNuGetPackages.Select(x => $"{x.PackageName}, {x.Version}")));
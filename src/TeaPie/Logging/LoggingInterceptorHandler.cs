@@ -1,4 +1,5 @@
 ﻿using Microsoft.Extensions.Logging;
+using TeaPie.Http.Bodies;
 
 namespace TeaPie.Logging;
 
@@ -8,11 +9,18 @@ internal class LoggingInterceptorHandler(ILogger<LoggingInterceptorHandler> logg
 
     protected override async Task<HttpResponseMessage> SendAsync(HttpRequestMessage request, CancellationToken cancellationToken)
     {
-        await LogRequestBody(request, cancellationToken);
+        var isTraceEnabled = _logger.IsEnabled(LogLevel.Trace);
+        if (isTraceEnabled)
+        {
+            await LogRequestBody(request, cancellationToken);
+        }
 
         var response = await base.SendAsync(request, cancellationToken);
 
-        await LogResponse(response, cancellationToken);
+        if (isTraceEnabled)
+        {
+            await LogResponse(response, cancellationToken);
+        }
 
         return response;
     }
@@ -21,7 +29,7 @@ internal class LoggingInterceptorHandler(ILogger<LoggingInterceptorHandler> logg
     {
         if (request.Content is not null)
         {
-            var content = await request.Content.ReadAsStringAsync(cancellationToken);
+            var content = await request.Content.ReadAsLoggableText(cancellationToken);
 
             _logger.LogTrace("Following HTTP request's body ({ContentType}):{NewLine}{Body}",
                 request.Content.Headers.ContentType?.MediaType,
@@ -41,7 +49,7 @@ internal class LoggingInterceptorHandler(ILogger<LoggingInterceptorHandler> logg
 
         if (response.Content is not null)
         {
-            var content = await response.Content.ReadAsStringAsync(cancellationToken);
+            var content = await response.Content.ReadAsLoggableText(cancellationToken);
 
             _logger.LogTrace("Response's body ({ContentType}): {NewLine}{BodyContent}",
                 response.Content.Headers.ContentType?.MediaType ?? "text",
@@ -1,6 +1,7 @@
 ﻿using System.Net.Http.Headers;
 using TeaPie.Http;
 using TeaPie.Http.Auth;
+using TeaPie.Http.Bodies;
 using Microsoft.Extensions.Logging;
 
 namespace TeaPie.Logging;
@@ -91,7 +92,7 @@ internal class RequestsLoggingHandler(IAuthProviderAccessor authProviderAccessor
 
         try
         {
-            return await content.ReadAsStringAsync();
+            return await content.ReadAsLoggableText();
         }
         catch (OperationCanceledException ex)
         {
@@ -15,6 +15,16 @@ internal static class Timer
         return result;
     }
 
+    public static async Task Execute(Func<Task> asyncFunction, Action<long> log)
+    {
+        var stopwatch = Stopwatch.StartNew();
+
+        await asyncFunction();
+
+        stopwatch.Stop();
+        log(stopwatch.ElapsedMilliseconds);
+    }
+
     public static T Execute<T>(Func<T> function, Action<long> log)
     {
         var stopwatch = Stopwatch.StartNew();
@@ -0,0 +1,36 @@
+﻿namespace TeaPie.Pipelines;
+
+/// <summary>
+/// Value, which is shared across the whole application run, unless it is accessed from within a
+/// <see cref="PipelineBranch"/>. In such case, each branch works with its own instance created by the factory.
+/// </summary>
+/// <typeparam name="T">Type of the value.</typeparam>
+internal sealed class BranchLocal<T>
+{
+    private readonly Func<T> _factory;
+    private T _sharedValue;
+
+    public BranchLocal(Func<T> factory)
+    {
+        _factory = factory;
+        _sharedValue = factory();
+    }
+
+    public T Value
+    {
+        get => PipelineBranch.Current is { } branch
+            ? (T)branch.GetOrAddState(this, () => _factory())!
+            : _sharedValue;
+        set
+        {
+            if (PipelineBranch.Current is { } branch)
+            {
+                branch.SetState(this, value);
+            }
+            else
+            {
+                _sharedValue = value;
+            }
+        }
+    }
+}
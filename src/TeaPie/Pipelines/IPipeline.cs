@@ -4,6 +4,21 @@ internal interface IPipeline
 {
     Task<int> Run(ApplicationContext context, CancellationToken cancellationToken = default);
 
+    /// <summary>
+    /// Executes each of <paramref name="branches"/> as a separate <see cref="PipelineBranch"/>, while at most
+    /// <paramref name="maxDegreeOfParallelism"/> branches run at the same time. Steps inserted during execution of
+    /// a branch are added only to that branch.
+    /// </summary>
+    /// <param name="context">Context of the application run.</param>
+    /// <param name="branches">Steps of the branches which should be executed.</param>
+    /// <param name="maxDegreeOfParallelism">Maximal number of branches executed at the same time.</param>
+    /// <param name="cancellationToken">Token for cancellation of the execution.</param>
+    Task RunInParallel(
+        ApplicationContext context,
+        IEnumerable<IPipelineStep[]> branches,
+        int maxDegreeOfParallelism,
+        CancellationToken cancellationToken = default);
+
     /// <summary>
     /// Adds <paramref name="steps"/> to the end of the pipeline.
     /// </summary>
@@ -0,0 +1,27 @@
+﻿using System.Collections.Concurrent;
+
+namespace TeaPie.Pipelines;
+
+/// <summary>
+/// Independently executed part of the pipeline (e.g. single test case during parallel run). The branch is bound to
+/// the asynchronous control flow in which its steps are executed, so that state of shared components can be isolated
+/// for each branch by <see cref="BranchLocal{T}"/>.
+/// </summary>
+internal sealed class PipelineBranch
+{
+    private static readonly AsyncLocal<PipelineBranch?> _current = new();
+
+    private readonly ConcurrentDictionary<object, object?> _state = new();
+
+    public static PipelineBranch? Current => _current.Value;
+
+    public StepsCollection Steps { get; } = [];
+
+    public IPipelineStep? CurrentStep { get; set; }
+
+    public void Enter() => _current.Value = this;
+
+    public object? GetOrAddState(object owner, Func<object?> factory) => _state.GetOrAdd(owner, _ => factory());
+
+    public void SetState(object owner, object? value) => _state[owner] = value;
+}
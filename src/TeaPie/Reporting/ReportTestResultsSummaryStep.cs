@@ -1,18 +1,24 @@
 ﻿using TeaPie.Pipelines;
 using TeaPie.Testing;
+using TeaPie.Tracing;
 
 namespace TeaPie.Reporting;
 
-internal class ReportTestResultsSummaryStep(ITestResultsSummaryAccessor testResultsSummaryAccessor) : IPipelineStep
+internal class ReportTestResultsSummaryStep(
+    ITestResultsSummaryAccessor testResultsSummaryAccessor,
+    IStepsTracer stepsTracer) : IPipelineStep
 {
+    private const int NumberOfSlowestSteps = 10;
+
     private readonly ITestResultsSummaryAccessor _testResultsSummaryAccessor = testResultsSummaryAccessor;
+    private readonly IStepsTracer _stepsTracer = stepsTracer;
 
     public bool ShouldExecute(ApplicationContext context) => true;
 
     public async Task Execute(ApplicationContext context, CancellationToken cancellationToken = default)
     {
         UpdateContext(context);
-        RegisterReporters(context.ReportFilePath, context.Reporter);
+        RegisterReporters(context.ReportFilePath, context.Reporter, GetSlowestSteps(context));
         await context.Reporter.Report();
     }
 
@@ -24,9 +30,13 @@ internal class ReportTestResultsSummaryStep(ITestResultsSummaryAccessor testResu
         context.AllTestsPassed = summary.AllTestsPassed;
     }
 
-    private static void RegisterReporters(string reportFilePath, ITestResultsSummaryReporter reporter)
+    private IReadOnlyList<StepTimings> GetSlowestSteps(ApplicationContext context)
+        => context.DisplaySlowestSteps ? _stepsTracer.GetSlowestSteps(NumberOfSlowestSteps) : [];
+
+    private static void RegisterReporters(
+        string reportFilePath, ITestResultsSummaryReporter reporter, IReadOnlyList<StepTimings> slowestSteps)
     {
-        reporter.RegisterReporter(new SpectreConsoleTestResultsSummaryReporter());
+        reporter.RegisterReporter(new SpectreConsoleTestResultsSummaryReporter(slowestSteps));
 
         if (!string.IsNullOrEmpty(reportFilePath))
         {
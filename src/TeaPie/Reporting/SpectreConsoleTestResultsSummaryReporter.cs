@@ -1,11 +1,16 @@
 ﻿using Spectre.Console;
+using System.Globalization;
 using System.Text;
 using TeaPie.Testing;
+using TeaPie.Tracing;
 
 namespace TeaPie.Reporting;
 
-internal class SpectreConsoleTestResultsSummaryReporter : IReporter<TestResultsSummary>
+internal class SpectreConsoleTestResultsSummaryReporter(IReadOnlyList<StepTimings>? slowestSteps = null)
+    : IReporter<TestResultsSummary>
 {
+    private readonly IReadOnlyList<StepTimings> _slowestSteps = slowestSteps ?? [];
+
     public async Task Report(TestResultsSummary report)
     {
         if (report.NumberOfTests > 0)
@@ -17,9 +22,44 @@ internal class SpectreConsoleTestResultsSummaryReporter : IReporter<TestResultsS
             ReportZeroTests();
         }
 
+        ReportSlowestStepsIfAny();
+
         await Task.CompletedTask;
     }
 
+    private void ReportSlowestStepsIfAny()
+    {
+        if (_slowestSteps.Count == 0)
+        {
+            return;
+        }
+
+        var table = new Table();
+        table.Border(TableBorder.Rounded);
+        table.Expand();
+        table.Title("[bold yellow]Slowest Steps[/] (exclusive time)");
+
+        table.AddColumn("[bold]Step[/]");
+        foreach (var column in new[] { "Executions", "Total", "Mean", "Max" })
+        {
+            table.AddColumn(new TableColumn($"[bold]{column}[/]").RightAligned());
+        }
+
+        foreach (var step in _slowestSteps)
+        {
+            table.AddRow(
+                $"[aqua]{step.StepName.EscapeMarkup()}[/]",
+                step.NumberOfExecutions.ToString(CultureInfo.InvariantCulture),
+                FormatTime(step.TotalMs),
+                FormatTime(step.MeanMs),
+                FormatTime(step.MaxMs));
+        }
+
+        AnsiConsole.Write(table);
+    }
+
+    private static string FormatTime(double timeMs) => timeMs.ToString("0.##", CultureInfo.InvariantCulture) + " ms";
+
     private static void ReportTestResultsSummary(TestResultsSummary summary)
     {
         var table = PrepareMainTable("[bold yellow]Test Results:[/] " + GetOverallResult(summary));
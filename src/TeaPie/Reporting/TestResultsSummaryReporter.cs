@@ -6,6 +6,7 @@ internal class TestResultsSummaryReporter(ITestResultsSummaryAccessor accessor)
 {
     private readonly List<IReporter<TestResultsSummary>> _reporters = [];
     private readonly ITestResultsSummaryAccessor _accessor = accessor;
+    private readonly object _lock = new();
     private CollectionTestResultsSummary _summary = new();
     private bool _started;
 
@@ -15,25 +16,31 @@ internal class TestResultsSummaryReporter(ITestResultsSummaryAccessor accessor)
 
     public void Initialize()
     {
-        if (_started)
+        lock (_lock)
         {
-            return;
-        }
+            if (_started)
+            {
+                return;
+            }
 
-        _summary = GetSummary();
-        _summary.Start();
-        _started = true;
+            _summary = GetSummary();
+            _summary.Start();
+            _started = true;
+        }
     }
 
     public void RegisterTestResult(string testCaseName, TestResult testResult)
     {
-        CheckCurrentState();
-
-        switch (testResult)
+        lock (_lock)
         {
-            case TestResult.NotRun skipped: _summary.AddSkippedTest(testCaseName, skipped); break;
-            case TestResult.Passed passed: _summary.AddPassedTest(testCaseName, passed); break;
-            case TestResult.Failed failed: _summary.AddFailedTest(testCaseName, failed); break;
+            CheckCurrentState();
+
+            switch (testResult)
+            {
+                case TestResult.NotRun skipped: _summary.AddSkippedTest(testCaseName, skipped); break;
+                case TestResult.Passed passed: _summary.AddPassedTest(testCaseName, passed); break;
+                case TestResult.Failed failed: _summary.AddFailedTest(testCaseName, failed); break;
+            }
         }
     }
 
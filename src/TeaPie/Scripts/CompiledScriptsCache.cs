@@ -0,0 +1,238 @@
+﻿using Microsoft.CodeAnalysis.Scripting;
+using Microsoft.Extensions.Logging;
+using System.Diagnostics.CodeAnalysis;
+using System.Reflection;
+using System.Security.Cryptography;
+using System.Text;
+using System.Text.Json;
+using System.Text.RegularExpressions;
+using TeaPie.StructureExploration.Paths;
+
+namespace TeaPie.Scripts;
+
+internal interface ICompiledScriptsCache
+{
+    /// <summary>
+    /// Computes cache key for the given pre-processed <paramref name="scriptContent"/>. The key reflects content of the
+    /// script (including all scripts referenced by <c>#load</c> directives and NuGet packages referenced by their
+    /// <c>#nuget</c> directives) and version of the runtime and TeaPie assembly against which the script is compiled.
+    /// </summary>
+    /// <param name="scriptContent">Pre-processed content of the script.</param>
+    /// <returns>Key under which compiled script is (or will be) cached.</returns>
+    string GetKey(string scriptContent);
+
+    /// <summary>
+    /// Loads compiled script together with <paramref name="warnings"/> reported during its compilation, so that they
+    /// can be reported even if the script isn't compiled again.
+    /// </summary>
+    bool TryGet(
+        string key,
+        [NotNullWhen(true)] out ScriptRunner<object>? scriptRunner,
+        out IReadOnlyList<string> warnings);
+
+    void Store(string key, Script<object> script, IReadOnlyList<string> warnings);
+}
+
+internal partial class CompiledScriptsCache(IPathProvider pathProvider, ILogger<CompiledScriptsCache> logger)
+    : ICompiledScriptsCache
+{
+    private const string SubmissionFactoryMethodName = "<Factory>";
+    private const string WarningsFileExtension = ".warnings.json";
+
+    /// <summary>
+    /// Compiled scripts, which weren't used for this period, or which exceed this count (the least recently used
+    /// first), are removed from the cache.
+    /// </summary>
+    internal const int MaxCompiledScriptsCount = 500;
+    internal static readonly TimeSpan MaxCompiledScriptAge = TimeSpan.FromDays(30);
+
+    private readonly IPathProvider _pathProvider = pathProvider;
+    private readonly ILogger<CompiledScriptsCache> _logger = logger;
+    private int _isCleanedUp;
+
+    public string GetKey(string scriptContent)
+    {
+        using var hash = IncrementalHash.CreateHash(HashAlgorithmName.SHA256);
+
+        AppendScriptContent(hash, scriptContent, []);
+        AppendReferences(hash);
+
+        return Convert.ToHexString(hash.GetHashAndReset()).ToLowerInvariant();
+    }
+
+    public bool TryGet(
+        string key,
+        [NotNullWhen(true)] out ScriptRunner<object>? scriptRunner,
+        out IReadOnlyList<string> warnings)
+    {
+        scriptRunner = null;
+        warnings = [];
+        var path = GetCompiledScriptPath(key);
+        if (!File.Exists(path))
+        {
+            return false;
+        }
+
+        try
+        {
+            var assembly = Assembly.Load(File.ReadAllBytes(path));
+            scriptRunner = CreateScriptRunner(assembly);
+            warnings = LoadWarnings(key);
+
+            // Time of the last use is tracked by the time of the last write, which is used during the clean-up.
+            File.SetLastWriteTimeUtc(path, DateTime.UtcNow);
+        }
+        catch (Exception ex)
+            when (ex is IOException or BadImageFormatException or InvalidOperationException or JsonException)
+        {
+            LogUnableToLoadCompiledScript(path, ex.Message);
+            scriptRunner = null;
+            return false;
+        }
+
+        return true;
+    }
+
+    public void Store(string key, Script<object> script, IReadOnlyList<string> warnings)
+    {
+        var path = GetCompiledScriptPath(key);
+        Directory.CreateDirectory(_pathProvider.CompiledScriptsFolderPath);
+        CleanUpOnce();
+
+        using var peStream = new MemoryStream();
+        var emitResult = script.GetCompilation().Emit(peStream);
+        if (!emitResult.Success)
+        {
+            LogUnableToStoreCompiledScript(path);
+            return;
+        }
+
+        // Warnings are written first, so that compiled script is never found without them.
+        using var warningsStream = new MemoryStream(JsonSerializer.SerializeToUtf8Bytes(warnings));
+        WriteAtomically(GetWarningsPath(key), warningsStream);
+        WriteAtomically(path, peStream);
+    }
+
+    private IReadOnlyList<string> LoadWarnings(string key)
+    {
+        var path = GetWarningsPath(key);
+        return File.Exists(path)
+            ? JsonSerializer.Deserialize<List<string>>(File.ReadAllBytes(path)) ?? []
+            : [];
+    }
+
+    /// <summary>
+    /// Every change of a script produces new compiled script, so the old ones are removed from the cache - at most once
+    /// per run, before the first compiled script is stored.
+    /// </summary>
+    private void CleanUpOnce()
+    {
+        if (Interlocked.Exchange(ref _isCleanedUp, 1) == 1)
+        {
+            return;
+        }
+
+        var oldestAllowed = DateTime.UtcNow - MaxCompiledScriptAge;
+        var compiledScripts = new DirectoryInfo(_pathProvider.CompiledScriptsFolderPath)
+            .GetFiles($"*{ScriptsConstants.LibraryFileExtension}")
+            .OrderByDescending(file => file.LastWriteTimeUtc)
+            .Select((file, index) => (file, index))
+            .Where(entry => entry.index >= MaxCompiledScriptsCount || entry.file.LastWriteTimeUtc < oldestAllowed)
+            .Select(entry => entry.file)
+            .ToList();
+
+        foreach (var compiledScript in compiledScripts)
+        {
+            try
+            {
+                compiledScript.Delete();
+                File.Delete(GetWarningsPath(Path.GetFileNameWithoutExtension(compiledScript.Name)));
+            }
+            catch (Exception ex) when (ex is IOException or UnauthorizedAccessException)
+            {
+                // Compiled script may be just used by another run - it will be removed next time.
+            }
+        }
+
+        if (compiledScripts.Count > 0)
+        {
+            LogCompiledScriptsRemoved(compiledScripts.Count);
+        }
+    }
+
+    private static ScriptRunner<object> CreateScriptRunner(Assembly assembly)
+    {
+        var factory = assembly.GetTypes()
+            .Select(t => t.GetMethod(SubmissionFactoryMethodName, BindingFlags.Public | BindingFlags.Static))
+            .FirstOrDefault(m => m is not null)
+            ?? throw new InvalidOperationException("Compiled script doesn't contain submission factory method.");
+
+        return (globals, _) =>
+        {
+            // Submission array holds globals object on the first position and the submission itself on the second one.
+            object?[] submissionStates = [globals, null];
+            return (Task<object>)factory.Invoke(null, [submissionStates])!;
+        };
+    }
+
+    private static void WriteAtomically(string path, MemoryStream content)
+    {
+        var temporaryPath = $"{path}.{Guid.NewGuid():N}.tmp";
+        using (var fileStream = new FileStream(temporaryPath, FileMode.Create, FileAccess.Write))
+        {
+            content.Seek(0, SeekOrigin.Begin);
+            content.CopyTo(fileStream);
+        }
+
+        File.Move(temporaryPath, path, true);
+    }
+
+    private static void AppendScriptContent(IncrementalHash hash, string scriptContent, HashSet<string> visitedScripts)
+    {
+        AppendText(hash, scriptContent);
+
+        foreach (Match match in LoadDirectiveRegex().Matches(scriptContent))
+        {
+            var path = match.Groups[1].Value;
+            if (visitedScripts.Add(path) && File.Exists(path))
+            {
+                AppendScriptContent(hash, File.ReadAllText(path), visitedScripts);
+            }
+        }
+    }
+
+    /// <summary>
+    /// NuGet packages aren't appended, since those referenced by the script are already part of its pre-processed
+    /// content (see <see cref="ScriptPreProcessorConstants.NuGetPackageComment"/>).
+    /// </summary>
+    private static void AppendReferences(IncrementalHash hash)
+    {
+        AppendText(hash, Environment.Version.ToString());
+        AppendText(hash, typeof(Globals).Assembly.ManifestModule.ModuleVersionId.ToString());
+    }
+
+    private static void AppendText(IncrementalHash hash, string text)
+    {
+        hash.AppendData(Encoding.UTF8.GetBytes(text));
+        hash.AppendData([0]);
+    }
+
+    private string GetCompiledScriptPath(string key)
+        => Path.Combine(_pathProvider.CompiledScriptsFolderPath, key + ScriptsConstants.LibraryFileExtension);
+
+    private string GetWarningsPath(string key)
+        => Path.Combine(_pathProvider.CompiledScriptsFolderPath, key + WarningsFileExtension);
+
+    [GeneratedRegex(@"^#load\s+""(.+)""\s*$", RegexOptions.Multiline)]
+    private static partial Regex LoadDirectiveRegex();
+
+    [LoggerMessage("Compiled script at path '{path}' couldn't be loaded and will be compiled again. Reason: {reason}",
+        Level = LogLevel.Debug)]
+    partial void LogUnableToLoadCompiledScript(string path, string reason);
+
+    [LoggerMessage("Compiled script couldn't be emitted to the path '{path}'.", Level = LogLevel.Debug)]
+    partial void LogUnableToStoreCompiledScript(string path);
+
+    [LoggerMessage("{count} unused compiled scripts were removed from the cache.", Level = LogLevel.Debug)]
+    partial void LogCompiledScriptsRemoved(int count);
+}
@@ -21,7 +21,7 @@ internal class ExecuteScriptStep(IScriptExecutionContextAccessor scriptExecution
     private static async Task ExecuteScript(
         ApplicationContext context,
         ScriptExecutionContext scriptExecutionContext,
-        Script<object> script,
+        ScriptRunner<object> script,
         CancellationToken cancellationToken)
     {
         using (context.Logger.BeginTreeScope())
@@ -34,10 +34,10 @@ internal class ExecuteScriptStep(IScriptExecutionContextAccessor scriptExecution
     private static async Task ExecuteAndLog(
         ApplicationContext context,
         ScriptExecutionContext scriptExecutionContext,
-        Script<object> script,
+        ScriptRunner<object> script,
         CancellationToken cancellationToken)
         => await Timer.Execute(
-            async () => await script.RunAsync(new Globals() { tp = TeaPie.Instance }, cancellationToken),
+            async () => await script(new Globals() { tp = TeaPie.Instance }, cancellationToken),
             (elapsedTime) => LogEndOfExecution(context, scriptExecutionContext, elapsedTime));
 
     private static void LogStartOfExecution(ApplicationContext context, ScriptExecutionContext scriptExecutionContext)
@@ -68,7 +68,7 @@ internal class ExecuteScriptStep(IScriptExecutionContextAccessor scriptExecution
         };
     }
 
-    private void ValidateContext(out ScriptExecutionContext scriptExecutionContext, out Script<object> script)
+    private void ValidateContext(out ScriptExecutionContext scriptExecutionContext, out ScriptRunner<object> script)
     {
         const string activityName = "execute script";
         ExecutionContextValidator.Validate(_scriptContextAccessor, out scriptExecutionContext, activityName);
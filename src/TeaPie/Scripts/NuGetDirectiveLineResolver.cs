@@ -12,7 +12,8 @@ internal partial class NuGetDirectiveLineResolver(INuGetPackageHandler nugetPack
     public async Task<string> ResolveLine(string line, ScriptPreProcessContext context)
     {
         var nuGetPackage = ParseDirective(line);
-        await _nugetPackagesHandler.HandleNuGetPackage(nuGetPackage);
+        await _nugetPackagesHandler.HandleNuGetPackage(nuGetPackage, context.CancellationToken);
+        context.AddNuGetPackage(nuGetPackage);
 
         return string.Empty;
     }
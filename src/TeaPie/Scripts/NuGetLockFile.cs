@@ -0,0 +1,89 @@
+﻿using System.Text.Json;
+
+namespace TeaPie.Scripts;
+
+/// <summary>
+/// Persisted result of NuGet resolution - for every package requested by <c>#nuget</c> directive (or by default), it
+/// holds all packages of its dependency graph. Once the package is locked and all packages of its graph are in the
+/// packages folder, no request to any feed is needed.
+/// </summary>
+internal class NuGetLockFile(string filePath)
+{
+    private static readonly JsonSerializerOptions _serializerOptions = new()
+    {
+        PropertyNamingPolicy = JsonNamingPolicy.CamelCase,
+        WriteIndented = true
+    };
+
+    private readonly string _filePath = filePath;
+    private readonly object _lock = new();
+    private Dictionary<string, List<LockedNuGetPackage>>? _packages;
+
+    public bool TryGet(NuGetPackageDescription package, out IReadOnlyList<LockedNuGetPackage> resolvedPackages)
+    {
+        lock (_lock)
+        {
+            if (GetPackages().TryGetValue(GetKey(package), out var packages))
+            {
+                resolvedPackages = packages;
+                return true;
+            }
+
+            resolvedPackages = [];
+            return false;
+        }
+    }
+
+    public void Set(NuGetPackageDescription package, IEnumerable<LockedNuGetPackage> resolvedPackages)
+    {
+        lock (_lock)
+        {
+            var packages = GetPackages();
+            var key = GetKey(package);
+            List<LockedNuGetPackage> newPackages = [.. resolvedPackages];
+
+            if (!packages.TryGetValue(key, out var lockedPackages) || !lockedPackages.SequenceEqual(newPackages))
+            {
+                packages[key] = newPackages;
+                Save();
+            }
+        }
+    }
+
+    private Dictionary<string, List<LockedNuGetPackage>> GetPackages() => _packages ??= Load();
+
+    private Dictionary<string, List<LockedNuGetPackage>> Load()
+    {
+        if (!File.Exists(_filePath))
+        {
+            return new(StringComparer.OrdinalIgnoreCase);
+        }
+
+        try
+        {
+            var content = JsonSerializer.Deserialize<LockFileContent>(File.ReadAllText(_filePath), _serializerOptions);
+            return new(content?.Packages ?? [], StringComparer.OrdinalIgnoreCase);
+        }
+        catch (JsonException)
+        {
+            // Corrupted lock file is ignored - packages are resolved again and the file is rewritten.
+            return new(StringComparer.OrdinalIgnoreCase);
+        }
+    }
+
+    private void Save()
+    {
+        Directory.CreateDirectory(Path.GetDirectoryName(_filePath)!);
+
+        var temporaryPath = $"{_filePath}.{Guid.NewGuid():N}.tmp";
+        File.WriteAllText(
+            temporaryPath, JsonSerializer.Serialize(new LockFileContent(_packages!), _serializerOptions));
+        File.Move(temporaryPath, _filePath, true);
+    }
+
+    private static string GetKey(NuGetPackageDescription package) => $"{package.PackageName}/{package.Version}";
+
+    private record LockFileContent(Dictionary<string, List<LockedNuGetPackage>> Packages);
+}
+
+internal record LockedNuGetPackage(string Id, string Version);
@@ -0,0 +1,17 @@
+﻿namespace TeaPie.Scripts;
+
+internal class NuGetOptions(bool offline = false, string? localFeedPath = null)
+{
+    /// <summary>
+    /// If <c>true</c>, no package is downloaded from the remote feed. Packages are restored from the lock file and
+    /// packages folder in the cache, or from the <see cref="LocalFeedPath"/>.
+    /// </summary>
+    public bool Offline { get; } = offline;
+
+    /// <summary>
+    /// Folder with <c>.nupkg</c> files, which is searched before the remote feed. Empty, if no local feed is used.
+    /// </summary>
+    public string LocalFeedPath { get; } = localFeedPath ?? string.Empty;
+
+    public bool HasLocalFeed => !string.IsNullOrEmpty(LocalFeedPath);
+}
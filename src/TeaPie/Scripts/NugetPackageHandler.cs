@@ -1,9 +1,13 @@
 ﻿using Microsoft.Extensions.Logging;
+using NuGet.Configuration;
 using NuGet.Frameworks;
+using NuGet.Packaging;
 using NuGet.Packaging.Core;
+using NuGet.Packaging.Signing;
 using NuGet.Protocol;
 using NuGet.Protocol.Core.Types;
 using NuGet.Versioning;
+using System.Collections.Concurrent;
 using System.Reflection;
 using TeaPie.StructureExploration.Paths;
 
@@ -11,9 +15,17 @@ namespace TeaPie.Scripts;
 
 internal interface INuGetPackageHandler
 {
-    Task HandleNuGetPackage(NuGetPackageDescription nugetPackage);
+    IReadOnlyCollection<NuGetPackageDescription> LoadedPackages { get; }
 
-    Task HandleNuGetPackages(IEnumerable<NuGetPackageDescription> nugetPackages);
+    /// <summary>
+    /// Sets feeds, from which packages are resolved. Should be called before the first package is handled.
+    /// </summary>
+    void UseOptions(NuGetOptions options);
+
+    Task HandleNuGetPackage(NuGetPackageDescription nugetPackage, CancellationToken cancellationToken = default);
+
+    Task HandleNuGetPackages(
+        IEnumerable<NuGetPackageDescription> nugetPackages, CancellationToken cancellationToken = default);
 }
 
 internal partial class NuGetPackageHandler(
@@ -22,83 +34,269 @@ internal partial class NuGetPackageHandler(
     NuGet.Common.ILogger nugetLogger)
     : INuGetPackageHandler
 {
+    private const int MaxParallelRequests = 8;
+
+    private static readonly NuGetFramework _targetFramework = FrameworkConstants.CommonFrameworks.NetStandard20;
+
     private readonly IPathProvider _pathProvider = pathProvider;
     private readonly ILogger<NuGetPackageHandler> _logger = logger;
     private readonly NuGet.Common.ILogger _nugetLogger = nugetLogger;
 
+    private readonly SemaphoreSlim _semaphore = new(1, 1);
+    private readonly SourceCacheContext _cache = new();
+
     private readonly HashSet<NuGetPackageDescription> _downloadedNuGetPackages = [];
     private readonly HashSet<NuGetPackageDescription> _nugetPackagesInAssembly = [];
 
-    public async Task HandleNuGetPackages(IEnumerable<NuGetPackageDescription> nugetPackages)
+    private NuGetOptions _options = new();
+    private IReadOnlyList<SourceRepository>? _repositories;
+    private NuGetLockFile? _lockFile;
+
+    public IReadOnlyCollection<NuGetPackageDescription> LoadedPackages { get; private set; } = [];
+
+    public void UseOptions(NuGetOptions options)
+    {
+        _options = options;
+        _repositories = null;
+    }
+
+    public async Task HandleNuGetPackages(
+        IEnumerable<NuGetPackageDescription> nugetPackages, CancellationToken cancellationToken = default)
+        => await Handle([.. nugetPackages], cancellationToken);
+
+    public async Task HandleNuGetPackage(
+        NuGetPackageDescription nugetPackage, CancellationToken cancellationToken = default)
+        => await Handle([nugetPackage], cancellationToken);
+
+    private async Task Handle(List<NuGetPackageDescription> nugetPackages, CancellationToken cancellationToken)
     {
-        foreach (var package in nugetPackages)
+        await _semaphore.WaitAsync(cancellationToken);
+        try
         {
-            await HandleNuGetPackage(package);
+            await DownloadNuGets(nugetPackages, cancellationToken);
+
+            foreach (var nugetPackage in nugetPackages)
+            {
+                AddNuGetDllToAssembly(nugetPackage);
+            }
+        }
+        finally
+        {
+            _semaphore.Release();
         }
     }
 
-    public async Task HandleNuGetPackage(NuGetPackageDescription nugetPackage)
+    private async Task DownloadNuGets(List<NuGetPackageDescription> nugetPackages, CancellationToken cancellationToken)
     {
-        await DownloadNuGet(nugetPackage);
-        AddNuGetDllToAssembly(nugetPackage);
+        var pendingPackages = nugetPackages.Distinct().Where(p => !_downloadedNuGetPackages.Contains(p)).ToList();
+        if (pendingPackages.Count == 0)
+        {
+            return;
+        }
+
+        var repositories = GetRepositories();
+        var lockFile = GetLockFile();
+        var graphs = new Dictionary<NuGetPackageDescription, IReadOnlyList<PackageIdentity>>();
+
+        // Dependency graphs of all packages are resolved and downloaded in parallel. First failure cancels the rest.
+        await ForEach(pendingPackages, cancellationToken, async (nugetPackage, token) =>
+        {
+            var graph = await ResolveDependencyGraph(nugetPackage, repositories, token);
+            lock (graphs)
+            {
+                graphs[nugetPackage] = graph;
+            }
+        });
+
+        var missingPackages = graphs.Values.SelectMany(g => g).Distinct().Where(p => !IsInstalled(p)).ToList();
+        await ForEach(missingPackages, cancellationToken,
+            async (package, token) => await DownloadPackage(package, repositories, token));
+
+        foreach (var (nugetPackage, graph) in graphs)
+        {
+            lockFile?.Set(
+                nugetPackage, graph.Select(p => new LockedNuGetPackage(p.Id, p.Version.ToNormalizedString())));
+            _downloadedNuGetPackages.Add(nugetPackage);
+        }
     }
 
-    private async Task DownloadNuGet(NuGetPackageDescription nugetPackage)
+    private async Task<IReadOnlyList<PackageIdentity>> ResolveDependencyGraph(
+        NuGetPackageDescription nugetPackage,
+        IReadOnlyList<SourceRepository> repositories,
+        CancellationToken cancellationToken)
     {
-        if (_downloadedNuGetPackages.Contains(nugetPackage))
+        if (TryGetLockedGraph(nugetPackage, repositories, out var lockedGraph))
         {
-            return;
+            LogNuGetPackageRestoredFromLockFile(nugetPackage.PackageName, nugetPackage.Version);
+            return lockedGraph;
         }
 
-        var packageId = nugetPackage.PackageName;
-        var version = nugetPackage.Version;
-        var cache = new SourceCacheContext();
-        var repositories = Repository.Factory.GetCoreV3(ScriptsConstants.NuGetApiResourcesUrl);
-
-        await repositories.GetResourceAsync<FindPackageByIdResource>();
-        var packageVersion = new NuGetVersion(version);
-        var dependencyInfoResource = await repositories.GetResourceAsync<DependencyInfoResource>();
-        var dependencyInfo = await dependencyInfoResource.ResolvePackage(
-            new PackageIdentity(packageId, packageVersion),
-            FrameworkConstants.CommonFrameworks.NetStandard20,
-            cache,
-            _nugetLogger,
-            CancellationToken.None)
-            ?? throw new NuGetPackageNotFoundException(packageId, version);
+        if (repositories.Count == 0)
+        {
+            throw new NuGetPackageNotFoundException(
+                $"The NuGet package '{nugetPackage.PackageName}' version '{nugetPackage.Version}' could not be " +
+                "restored in offline mode. It is neither locked in the cache nor available in a local feed.");
+        }
+
+        var root = await ResolveDependencyInfo(
+            nugetPackage.PackageName, VersionRange.Parse($"[{nugetPackage.Version}]"), repositories, cancellationToken);
+        var graph = new ConcurrentDictionary<string, PackageIdentity>(StringComparer.OrdinalIgnoreCase);
+        graph.TryAdd(root.Id, root);
+
+        // Graph is resolved level by level, packages of the same level in parallel. The first resolved version of
+        // each package wins - the same way as when the nearest dependency wins.
+        List<SourcePackageDependencyInfo> level = [root];
+        while (level.Count > 0)
+        {
+            var nextLevel = new ConcurrentBag<SourcePackageDependencyInfo>();
+            var dependencies = level
+                .SelectMany(p => p.Dependencies)
+                .Where(d => !graph.ContainsKey(d.Id))
+                .DistinctBy(d => d.Id, StringComparer.OrdinalIgnoreCase);
+
+            await ForEach(dependencies, cancellationToken, async (dependency, token) =>
+            {
+                var resolved = await ResolveDependencyInfo(dependency.Id, dependency.VersionRange, repositories, token);
+                if (graph.TryAdd(resolved.Id, resolved))
+                {
+                    nextLevel.Add(resolved);
+                }
+            });
+
+            level = [.. nextLevel];
+        }
+
+        LogNuGetDependencyGraphResolved(nugetPackage.PackageName, nugetPackage.Version, graph.Count);
+        return [.. graph.Values.OrderBy(p => p.Id, StringComparer.OrdinalIgnoreCase)];
+    }
+
+    private bool TryGetLockedGraph(
+        NuGetPackageDescription nugetPackage,
+        IReadOnlyList<SourceRepository> repositories,
+        out IReadOnlyList<PackageIdentity> graph)
+    {
+        graph = [];
+        if (GetLockFile()?.TryGet(nugetPackage, out var lockedPackages) != true)
+        {
+            return false;
+        }
 
-        foreach (var dependency in dependencyInfo.Dependencies)
+        graph = [.. lockedPackages.Select(p => new PackageIdentity(p.Id, NuGetVersion.Parse(p.Version)))];
+
+        // Locked packages, which are missing in the packages folder, are downloaded without resolution of the graph.
+        return repositories.Count > 0 || graph.All(IsInstalled);
+    }
+
+    private async Task<SourcePackageDependencyInfo> ResolveDependencyInfo(
+        string packageId,
+        VersionRange versionRange,
+        IReadOnlyList<SourceRepository> repositories,
+        CancellationToken cancellationToken)
+    {
+        foreach (var repository in repositories)
         {
-            var dependencyPackage = new PackageIdentity(dependency.Id, dependency.VersionRange.MinVersion);
+            var dependencyInfoResource = await repository.GetResourceAsync<DependencyInfoResource>(cancellationToken);
+            var candidates = (await dependencyInfoResource.ResolvePackages(
+                packageId, _targetFramework, _cache, _nugetLogger, cancellationToken)).ToList();
+
+            var bestVersion = versionRange.FindBestMatch(candidates.Select(c => c.Version));
+            if (bestVersion is not null)
+            {
+                return candidates.First(c => c.Version == bestVersion);
+            }
+        }
+
+        throw new NuGetPackageNotFoundException(packageId, versionRange.OriginalString ?? versionRange.ToString());
+    }
 
-            var resolvedDependency = await dependencyInfoResource.ResolvePackage(
-                dependencyPackage,
-                FrameworkConstants.CommonFrameworks.NetStandard20,
-                cache,
+    private async Task DownloadPackage(
+        PackageIdentity package,
+        IReadOnlyList<SourceRepository> repositories,
+        CancellationToken cancellationToken)
+    {
+        foreach (var repository in repositories)
+        {
+            var downloadResource = await repository.GetResourceAsync<DownloadResource>(cancellationToken);
+            using var downloadResult = await downloadResource.GetDownloadResourceResultAsync(
+                package,
+                new PackageDownloadContext(_cache),
+                _pathProvider.NuGetPackagesFolderPath,
                 _nugetLogger,
-                CancellationToken.None);
+                cancellationToken);
+
+            if (downloadResult.Status == DownloadResourceResultStatus.Available)
+            {
+                await ExtractPackage(package, downloadResult, cancellationToken);
+                LogSuccessfullNuGetDownload(package.Id, package.Version.ToNormalizedString());
+                return;
+            }
+        }
 
-            await DownloadPackage(resolvedDependency, repositories, cache);
+        throw new NuGetPackageNotFoundException(package.Id, package.Version.ToNormalizedString());
+    }
+
+    /// <summary>
+    /// Packages from remote feed are extracted into the packages folder already during the download. Local feed
+    /// provides just the stream of the <c>.nupkg</c> file, so such package has to be extracted explicitly.
+    /// </summary>
+    private async Task ExtractPackage(
+        PackageIdentity package, DownloadResourceResult downloadResult, CancellationToken cancellationToken)
+    {
+        if (IsInstalled(package))
+        {
+            return;
         }
 
-        var packageDownloadContext = new PackageDownloadContext(cache);
-        var downloadResource = await repositories.GetResourceAsync<DownloadResource>();
-        var downloadResult = await downloadResource.GetDownloadResourceResultAsync(
-            new PackageIdentity(packageId, packageVersion),
-            packageDownloadContext,
+        using var extractionResult = await GlobalPackagesFolderUtility.AddPackageAsync(
+            downloadResult.PackageSource,
+            package,
+            downloadResult.PackageStream,
             _pathProvider.NuGetPackagesFolderPath,
+            Guid.Empty,
+            ClientPolicyContext.GetClientPolicy(NullSettings.Instance, _nugetLogger),
             _nugetLogger,
-            CancellationToken.None);
+            cancellationToken);
+    }
+
+    private bool IsInstalled(PackageIdentity package)
+        => File.Exists(new VersionFolderPathResolver(_pathProvider.NuGetPackagesFolderPath)
+            .GetNupkgMetadataPath(package.Id, package.Version));
+
+    private IReadOnlyList<SourceRepository> GetRepositories()
+        => _repositories ??= CreateRepositories();
 
-        if (downloadResult.Status == DownloadResourceResultStatus.NotFound)
+    private List<SourceRepository> CreateRepositories()
+    {
+        List<SourceRepository> repositories = [];
+        if (_options.HasLocalFeed)
         {
-            throw new NuGetPackageNotFoundException(packageId, version);
+            repositories.Add(Repository.Factory.GetCoreV3(_options.LocalFeedPath));
         }
 
-        _downloadedNuGetPackages.Add(nugetPackage);
+        if (!_options.Offline)
+        {
+            repositories.Add(Repository.Factory.GetCoreV3(ScriptsConstants.NuGetApiResourcesUrl));
+        }
 
-        LogSuccessfullNuGetDownload(packageId, version);
+        return repositories;
     }
 
+    private NuGetLockFile? GetLockFile()
+        => _lockFile ??= string.IsNullOrEmpty(_pathProvider.NuGetLockFilePath)
+            ? null
+            : new NuGetLockFile(_pathProvider.NuGetLockFilePath);
+
+    private static async Task ForEach<T>(
+        IEnumerable<T> source, CancellationToken cancellationToken, Func<T, CancellationToken, Task> action)
+        => await Parallel.ForEachAsync(
+            source,
+            new ParallelOptions()
+            {
+                MaxDegreeOfParallelism = MaxParallelRequests,
+                CancellationToken = cancellationToken
+            },
+            async (item, token) => await action(item, token));
+
     private void AddNuGetDllToAssembly(NuGetPackageDescription nugetPackage)
     {
         if (!_nugetPackagesInAssembly.Contains(nugetPackage))
@@ -109,6 +307,7 @@ internal partial class NuGetPackageHandler(
 
             Assembly.LoadFrom(dllPath);
             _nugetPackagesInAssembly.Add(nugetPackage);
+            LoadedPackages = [.. _nugetPackagesInAssembly];
 
             LogSuccessfullNuGetAdditionToAssembly(nugetPackage.PackageName, nugetPackage.Version);
         }
@@ -133,35 +332,6 @@ internal partial class NuGetPackageHandler(
         throw new InvalidOperationException("No NuGet package version with compatible framework found.");
     }
 
-    private async Task DownloadPackage(
-        PackageDependencyInfo dependencyInfo,
-        SourceRepository repositories,
-        SourceCacheContext cache)
-    {
-        var packageDownloadContext = new PackageDownloadContext(cache);
-        var downloadResource = await repositories.GetResourceAsync<DownloadResource>();
-        var downloadResult = await downloadResource.GetDownloadResourceResultAsync(
-            new PackageIdentity(dependencyInfo.Id, dependencyInfo.Version),
-            packageDownloadContext,
-            _pathProvider.NuGetPackagesFolderPath,
-            _nugetLogger,
-            CancellationToken.None);
-
-        if (downloadResult.Status == DownloadResourceResultStatus.Available)
-        {
-            await using var packageStream = downloadResult.PackageStream;
-            var packageFilePath = Path.Combine(
-                _pathProvider.NuGetPackagesFolderPath,
-                $"{dependencyInfo.Id}.{dependencyInfo.Version}{ScriptsConstants.NuGetPackageFileExtension}");
-            await using var fileStream = new FileStream(packageFilePath, FileMode.Create, FileAccess.Write);
-            await packageStream.CopyToAsync(fileStream);
-        }
-        else if (downloadResult.Status == DownloadResourceResultStatus.NotFound)
-        {
-            throw new NuGetPackageNotFoundException(dependencyInfo.Id, dependencyInfo.Version.Version.ToString());
-        }
-    }
-
     [LoggerMessage("NuGet Package {name}, {version} was successfully downloaded.",
         Level = LogLevel.Trace)]
     partial void LogSuccessfullNuGetDownload(string name, string version);
@@ -169,6 +339,13 @@ internal partial class NuGetPackageHandler(
     [LoggerMessage("NuGet Package {name}, {version} was successfully addded to execution assembly.",
         Level = LogLevel.Trace)]
     partial void LogSuccessfullNuGetAdditionToAssembly(string name, string version);
+
+    [LoggerMessage("NuGet Package {name}, {version} was restored from the lock file.", Level = LogLevel.Trace)]
+    partial void LogNuGetPackageRestoredFromLockFile(string name, string version);
+
+    [LoggerMessage("Dependency graph of NuGet Package {name}, {version} was resolved ({count} packages).",
+        Level = LogLevel.Debug)]
+    partial void LogNuGetDependencyGraphResolved(string name, string version, int count);
 }
 
 internal class NuGetPackageDescription(string packageName, string version)
@@ -26,21 +26,22 @@ internal sealed class PreProcessScriptStep(
         List<ScriptReference> referencedScriptsPaths;
         using (context.Logger.BeginTreeScope())
         {
-            referencedScriptsPaths = await ProcessScript(context, scriptExecutionContext);
+            referencedScriptsPaths = await ProcessScript(context, scriptExecutionContext, cancellationToken);
         }
 
         HandleReferencedScripts(context, referencedScriptsPaths);
     }
 
     private async Task<List<ScriptReference>> ProcessScript(
-        ApplicationContext context, ScriptExecutionContext scriptExecutionContext)
+        ApplicationContext context, ScriptExecutionContext scriptExecutionContext, CancellationToken cancellationToken)
     {
         LogPreprocessStart(context, scriptExecutionContext);
 
         var referencedScriptsPaths = new List<ScriptReference>();
 
         await Timer.Execute(
-            async () => await _scriptPreProcessor.ProcessScript(scriptExecutionContext, referencedScriptsPaths),
+            async () => await _scriptPreProcessor.ProcessScript(
+                scriptExecutionContext, referencedScriptsPaths, cancellationToken),
             elapsedTime => LogEndOfPreprocess(context, scriptExecutionContext, elapsedTime));
 
         return referencedScriptsPaths;
@@ -30,7 +30,12 @@ internal sealed class SaveTempScriptStep(IScriptExecutionContextAccessor accesso
         var temporaryPath = _temporaryPathResolver.ResolvePath(scriptExecution.Script.File.Path, string.Empty);
 
         Directory.CreateDirectory(Path.GetDirectoryName(temporaryPath)!);
-        await File.WriteAllTextAsync(temporaryPath, content, cancellationToken);
+
+        // Test cases executed in parallel may save the same referenced script at the same time,
+        // so the file is replaced at once, rather than re-written.
+        var partialPath = $"{temporaryPath}.{Guid.NewGuid():N}";
+        await File.WriteAllTextAsync(partialPath, content, cancellationToken);
+        File.Move(partialPath, temporaryPath, true);
 
         return temporaryPath;
     }
@@ -2,67 +2,129 @@
 using Microsoft.CodeAnalysis.CSharp.Scripting;
 using Microsoft.CodeAnalysis.Scripting;
 using Microsoft.Extensions.Logging;
+using System.Collections.Concurrent;
 using System.Collections.Immutable;
 using System.Data;
+using System.Reflection;
 
 namespace TeaPie.Scripts;
 
 internal interface IScriptCompiler
 {
-    Script<object> CompileScript(string scriptContent, string path);
+    ScriptRunner<object> CompileScript(string scriptContent, string path);
 }
 
-internal partial class ScriptCompiler(ILogger<ScriptCompiler> logger) : IScriptCompiler
+internal partial class ScriptCompiler(ICompiledScriptsCache compiledScriptsCache, ILogger<ScriptCompiler> logger)
+    : IScriptCompiler
 {
+    private readonly ICompiledScriptsCache _compiledScriptsCache = compiledScriptsCache;
     private readonly ILogger<ScriptCompiler> _logger = logger;
 
-    public Script<object> CompileScript(string scriptContent, string path)
+    private readonly object _lock = new();
+    // Runners which were already compiled (or loaded) during this run, so that repeated executions of the same script
+    // (e.g. during benchmark) don't load the same assembly over and over again.
+    private readonly ConcurrentDictionary<string, ScriptRunner<object>> _compiledScripts = new();
+    private readonly HashSet<Assembly> _referencedAssemblies = [];
+    private ScriptOptions _scriptOptions = ScriptOptions.Default.WithImports(ScriptsConstants.DefaultImports);
+
+    public ScriptRunner<object> CompileScript(string scriptContent, string path)
+    {
+        var key = _compiledScriptsCache.GetKey(scriptContent);
+        if (_compiledScripts.TryGetValue(key, out var compiledScript))
+        {
+            return compiledScript;
+        }
+
+        compiledScript = LoadOrCompileScript(scriptContent, path, key);
+        return _compiledScripts.GetOrAdd(key, compiledScript);
+    }
+
+    private ScriptRunner<object> LoadOrCompileScript(string scriptContent, string path, string key)
     {
-        var scriptOptions = ScriptOptions.Default
-            .AddReferences(AppDomain.CurrentDomain.GetAssemblies().Where(x => !string.IsNullOrEmpty(x.Location)))
-            .WithImports(ScriptsConstants.DefaultImports);
+        if (_compiledScriptsCache.TryGet(key, out var cachedScript, out var cachedWarnings))
+        {
+            LogCompiledScriptLoadedFromCache(path);
+            LogWarnings(path, cachedWarnings);
+            return cachedScript;
+        }
 
-        var script = CSharpScript.Create(scriptContent, scriptOptions, typeof(Globals));
+        var script = CSharpScript.Create(scriptContent, GetScriptOptions(), typeof(Globals));
 
         var compilationDiagnostics = script.Compile();
-        ResolveCompilationDiagnostics(compilationDiagnostics, path);
+        var warnings = ResolveCompilationDiagnostics(compilationDiagnostics, path);
+
+        _compiledScriptsCache.Store(key, script, warnings);
 
-        return script;
+        return script.CreateDelegate();
     }
 
-    private void ResolveCompilationDiagnostics(ImmutableArray<Diagnostic> compilationDiagnostics, string path)
+    /// <summary>
+    /// Script options are built only once and extended only by assemblies, which were loaded since the last compilation
+    /// (e.g. libraries from NuGet packages), so that references don't have to be re-created for each script.
+    /// </summary>
+    private ScriptOptions GetScriptOptions()
+    {
+        lock (_lock)
+        {
+            var newAssemblies = AppDomain.CurrentDomain.GetAssemblies()
+                .Where(a => !a.IsDynamic && !string.IsNullOrEmpty(a.Location) && _referencedAssemblies.Add(a))
+                .ToList();
+
+            if (newAssemblies.Count > 0)
+            {
+                _scriptOptions = _scriptOptions.AddReferences(newAssemblies);
+            }
+
+            return _scriptOptions;
+        }
+    }
+
+    /// <returns>Messages of warnings, which are stored together with compiled script.</returns>
+    private List<string> ResolveCompilationDiagnostics(ImmutableArray<Diagnostic> compilationDiagnostics, string path)
     {
         var filteredDiagnostics = compilationDiagnostics
             .Where(d => !ScriptsConstants.SuppressedWarnings.Contains(d.Id))
-            .GroupBy(d => d.Severity);
+            .ToList();
 
-        foreach (var group in filteredDiagnostics)
+        var errors = filteredDiagnostics.Where(d => d.Severity == DiagnosticSeverity.Error).ToList();
+        if (errors.Count > 0)
         {
-            if (group.Key == DiagnosticSeverity.Warning)
-            {
-                LogDiagnostics(path, group, LogWarningsOccured, LogWarning);
-            }
-            else if (group.Key == DiagnosticSeverity.Error)
-            {
-                LogDiagnostics(path, group, LogErrorsOccured, LogError);
-                throw new SyntaxErrorException("Exception thrown during script compilation: Script contains syntax errors.");
-            }
+            LogDiagnostics(path, [.. errors.Select(d => d.GetMessage())], LogErrorsOccured, LogError);
+            throw new SyntaxErrorException("Exception thrown during script compilation: Script contains syntax errors.");
+        }
+
+        List<string> warnings = [.. filteredDiagnostics
+            .Where(d => d.Severity == DiagnosticSeverity.Warning)
+            .Select(d => d.GetMessage())];
+
+        LogWarnings(path, warnings);
+        return warnings;
+    }
+
+    private void LogWarnings(string path, IReadOnlyList<string> warnings)
+    {
+        if (warnings.Count > 0)
+        {
+            LogDiagnostics(path, warnings, LogWarningsOccured, LogWarning);
         }
     }
 
     private static void LogDiagnostics(
         string path,
-        IGrouping<DiagnosticSeverity, Diagnostic> diagnostics,
+        IReadOnlyList<string> messages,
         Action<string, int> logGroupExistence,
         Action<string> logSingleOccurence)
     {
-        logGroupExistence(path, diagnostics.Count());
-        foreach (var diagnostic in diagnostics)
+        logGroupExistence(path, messages.Count);
+        foreach (var message in messages)
         {
-            logSingleOccurence(diagnostic.GetMessage());
+            logSingleOccurence(message);
         }
     }
 
+    [LoggerMessage("The script at path '{path}' was loaded from the compiled scripts cache.", Level = LogLevel.Trace)]
+    partial void LogCompiledScriptLoadedFromCache(string path);
+
     [LoggerMessage("The script at path '{path}' has {count} warnings.", Level = LogLevel.Warning)]
     partial void LogWarningsOccured(string path, int count);
 
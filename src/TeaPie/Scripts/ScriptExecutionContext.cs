@@ -10,7 +10,7 @@ internal class ScriptExecutionContext(Script script) : IDisposable
     public Script Script { get; set; } = script;
     public string? RawContent { get; set; }
     public string? ProcessedContent { get; set; }
-    public Script<object>? ScriptObject { get; set; }
+    public ScriptRunner<object>? ScriptObject { get; set; }
 
     public void Dispose()
     {
@@ -2,13 +2,23 @@
 
 namespace TeaPie.Scripts;
 
-internal class ScriptPreProcessContext(Script script, List<ScriptReference> referencedScripts)
+internal class ScriptPreProcessContext(
+    Script script,
+    List<ScriptReference> referencedScripts,
+    CancellationToken cancellationToken = default)
 {
     public Script Script { get; set; } = script;
 
+    public CancellationToken CancellationToken { get; } = cancellationToken;
+
     public IReadOnlyList<ScriptReference> ReferencedScripts => _referencedScripts;
 
+    public IReadOnlyCollection<NuGetPackageDescription> NuGetPackages => _nugetPackages;
+
     private readonly List<ScriptReference> _referencedScripts = referencedScripts;
+    private readonly HashSet<NuGetPackageDescription> _nugetPackages = [];
 
     public void AddScriptReference(ScriptReference reference) => _referencedScripts.Add(reference);
+
+    public void AddNuGetPackage(NuGetPackageDescription package) => _nugetPackages.Add(package);
 }
@@ -2,22 +2,28 @@
 
 internal interface IScriptPreProcessor
 {
-    Task ProcessScript(ScriptExecutionContext script, List<ScriptReference> referencedScripts);
+    Task ProcessScript(
+        ScriptExecutionContext script,
+        List<ScriptReference> referencedScripts,
+        CancellationToken cancellationToken = default);
 }
 
 internal class ScriptPreProcessor(IScriptLineResolversProvider resolversProvider) : IScriptPreProcessor
 {
     private readonly IReadOnlyList<IScriptLineResolver> _scriptLineResolvers = resolversProvider.GetAvailableResolvers();
 
-    public async Task ProcessScript(ScriptExecutionContext scriptContext, List<ScriptReference> referencedScripts)
+    public async Task ProcessScript(
+        ScriptExecutionContext scriptContext,
+        List<ScriptReference> referencedScripts,
+        CancellationToken cancellationToken = default)
     {
         CheckContext(scriptContext, out var scriptContent);
 
-        var context = new ScriptPreProcessContext(scriptContext.Script, referencedScripts);
+        var context = new ScriptPreProcessContext(scriptContext.Script, referencedScripts, cancellationToken);
 
         var resolvedLines = await ResolveLines(scriptContent, context);
 
-        scriptContext.ProcessedContent = GetProcessedContent(resolvedLines);
+        scriptContext.ProcessedContent = GetProcessedContent(resolvedLines, context.NuGetPackages);
     }
 
     private async Task<List<string>> ResolveLines(string scriptContent, ScriptPreProcessContext context)
@@ -42,9 +48,13 @@ internal class ScriptPreProcessor(IScriptLineResolversProvider resolversProvider
         return await resolver.ResolveLine(line, context);
     }
 
-    private static string? GetProcessedContent(List<string> lines)
+    private static string? GetProcessedContent(List<string> lines, IEnumerable<NuGetPackageDescription> nugetPackages)
     {
         lines = [.. lines.Where(l => !string.IsNullOrEmpty(l))];
+        lines.AddRange(nugetPackages
+            .Select(p => $"{ScriptPreProcessorConstants.NuGetPackageComment} {p}")
+            .Order(StringComparer.Ordinal));
+
         return string.Join(Environment.NewLine, lines);
     }
 
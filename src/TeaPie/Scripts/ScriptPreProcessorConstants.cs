@@ -5,6 +5,12 @@ internal static class ScriptPreProcessorConstants
     public const string LoadScriptDirective = "#load";
     public const string NuGetDirective = "#nuget";
 
+    /// <summary>
+    /// Prefix of comments, which are appended to the pre-processed script for each of its NuGet packages. Packages
+    /// become part of the content of the script, so that compiled script is cached with respect to them.
+    /// </summary>
+    public const string NuGetPackageComment = "// NuGet package:";
+
     public const string LoadDirectivePattern = @"^#load\s+""([a-zA-Z0-9_\-\.\s\\\/]+\.([a-zA-Z0-9]+))""$";
     public const string NuGetDirectivePattern = @"^#nuget\s+""([a-zA-Z0-9_.-]+),\s*([0-9]+\.[0-9]+\.[0-9]+)""$";
 }
@@ -16,6 +16,16 @@ internal static class ScriptStepsFactory
         ScriptExecutionContext scriptExecutionContext)
         => CreateSteps(serviceProvider, scriptExecutionContext, GetStepsForScriptPreProcessAndExecution);
 
+    public static IPipelineStep[] CreateStepsForScriptCompilation(
+        IServiceProvider serviceProvider,
+        ScriptExecutionContext scriptExecutionContext)
+        => CreateSteps(serviceProvider, scriptExecutionContext, GetStepsForScriptCompilation);
+
+    public static IPipelineStep[] CreateStepsForCompiledScriptExecution(
+        IServiceProvider serviceProvider,
+        ScriptExecutionContext scriptExecutionContext)
+        => CreateSteps(serviceProvider, scriptExecutionContext, GetStepsForCompiledScriptExecution);
+
     public static IEnumerable<IPipelineStep> CreateStepsForScriptExecution(
         IServiceProvider serviceProvider,
         TestCaseExecutionContext testCaseExecutionContext)
@@ -63,6 +73,16 @@ internal static class ScriptStepsFactory
             provider.GetStep<ExecuteScriptStep>(),
             provider.GetStep<DisposeScriptStep>()];
 
+    private static IPipelineStep[] GetStepsForScriptCompilation(IServiceProvider provider)
+        => [provider.GetStep<ReadScriptFileStep>(),
+            provider.GetStep<PreProcessScriptStep>(),
+            provider.GetStep<SaveTempScriptStep>(),
+            provider.GetStep<CompileScriptStep>()];
+
+    private static IPipelineStep[] GetStepsForCompiledScriptExecution(IServiceProvider provider)
+        => [provider.GetStep<ExecuteScriptStep>(),
+            provider.GetStep<DisposeScriptStep>()];
+
     private static IPipelineStep[] GetStepsForScriptsExecution(IServiceProvider provider)
     => [provider.GetStep<RunScriptTestsStep>()];
 }
@@ -8,6 +8,7 @@ internal static class Setup
     {
         services.AddSingleton<IScriptPreProcessor, ScriptPreProcessor>();
         services.AddSingleton<IScriptCompiler, ScriptCompiler>();
+        services.AddSingleton<ICompiledScriptsCache, CompiledScriptsCache>();
         services.AddSingleton<INuGetPackageHandler, NuGetPackageHandler>();
 
         services.AddSingleton<IScriptLineResolversProvider, ScriptLineResolversProvider>();
@@ -1,4 +1,5 @@
 ﻿using Microsoft.Extensions.DependencyInjection;
+using TeaPie.Benchmarking;
 using TeaPie.Environments;
 using TeaPie.Functions;
 using TeaPie.Http;
@@ -9,6 +10,7 @@ using TeaPie.Scripts;
 using TeaPie.StructureExploration;
 using TeaPie.TestCases;
 using TeaPie.Testing;
+using TeaPie.Tracing;
 using TeaPie.Variables;
 
 namespace TeaPie;
@@ -28,6 +30,8 @@ internal static class Setup
         services.AddTesting();
         services.AddPipelines();
         services.AddReporting();
+        services.AddBenchmarking();
+        services.AddTracing();
         services.AddLogging(loggingConfiguration);
 
         return services;
@@ -5,7 +5,9 @@ using TeaPie.TestCases;
 
 namespace TeaPie.StructureExploration;
 
-internal abstract class BaseStructureExplorer(IPathProvider pathProvider, ILogger logger, TpFileParser tpFileParser) : IStructureExplorer
+internal abstract class BaseStructureExplorer(
+    IPathProvider pathProvider, IStructureIndex structureIndex, ILogger logger, TpFileParser tpFileParser)
+    : IStructureExplorer
 {
     public const string RemoteFolderName = "~Remote";
     protected string _remoteFolderPath = string.Empty;
@@ -15,6 +17,8 @@ internal abstract class BaseStructureExplorer(IPathProvider pathProvider, ILogge
     protected string? _environmentFileName;
     protected string? _initializationScriptName;
     protected IPathProvider _pathProvider = pathProvider;
+    protected readonly IStructureIndex _structureIndex = structureIndex;
+    protected HashSet<string> _testCasesFilter = [];
 
     public IReadOnlyCollectionStructure Explore(ApplicationContext applicationContext)
     {
@@ -27,6 +31,8 @@ internal abstract class BaseStructureExplorer(IPathProvider pathProvider, ILogge
             () => ExploreStructure(applicationContext),
             realTime => elapsedTime = realTime);
 
+        _structureIndex.Save();
+
         LogEnd(collectionStructure, elapsedTime.ToHumanReadableTime());
 
         return collectionStructure;
@@ -80,6 +86,7 @@ internal abstract class BaseStructureExplorer(IPathProvider pathProvider, ILogge
 
         testCase.PreRequestScripts = preRequestScript is not null ? [preRequestScript] : [];
         testCase.PostResponseScripts = postResponseScript is not null ? [postResponseScript] : [];
+        testCase.DataSource = GetDataSource(testCaseName, currentFolder, files);
 
         if (!collectionStructure.TryAddTestCase(testCase))
         {
@@ -107,7 +114,8 @@ internal abstract class BaseStructureExplorer(IPathProvider pathProvider, ILogge
             {
                 Name = definition.Name,
                 IsFromTpFile = true,
-                TpDefinition = definition
+                TpDefinition = definition,
+                DataSource = GetDataSource(definition, tpFilePath, currentFolder)
             };
 
             if (!collectionStructure.TryAddTestCase(testCase))
@@ -129,6 +137,7 @@ internal abstract class BaseStructureExplorer(IPathProvider pathProvider, ILogge
     protected void CheckAndResolveArguments(ApplicationContext applicationContext)
     {
         ValidatePath(applicationContext.Path);
+        _testCasesFilter = [.. applicationContext.TestCasesFilter.Select(Path.GetFullPath)];
         CheckAndResolveEnvironmentFile(applicationContext.EnvironmentFilePath);
         CheckAndResolveInitializationScript(applicationContext.InitializationScriptPath);
     }
@@ -164,8 +173,13 @@ internal abstract class BaseStructureExplorer(IPathProvider pathProvider, ILogge
 
     #region Getter Methods
 
-    protected static IList<string> GetFiles(Folder currentFolder)
-        => [.. Directory.GetFiles(currentFolder.Path).OrderBy(path => path, StringComparer.OrdinalIgnoreCase)];
+    protected IList<string> GetFiles(Folder currentFolder) => [.. _structureIndex.GetFiles(currentFolder.Path)];
+
+    /// <summary>
+    /// Determines whether test cases from given file should be explored. If no filter is set, all of them are.
+    /// </summary>
+    protected bool IsSelected(string testCaseFilePath)
+        => _testCasesFilter.Count == 0 || _testCasesFilter.Contains(Path.GetFullPath(testCaseFilePath));
 
     protected static Script? GetScript(
         string requestFileName,
@@ -178,6 +192,52 @@ internal abstract class BaseStructureExplorer(IPathProvider pathProvider, ILogge
         return file is not null ? new Script(InternalFile.Create(file, folder)) : null;
     }
 
+    /// <summary>
+    /// Gets data source of the test case - sidecar file '<i>&lt;test-case-name&gt;-data.csv</i>' or
+    /// '<i>&lt;test-case-name&gt;-data.jsonl</i>' next to its request file.
+    /// </summary>
+    protected static InternalFile? GetDataSource(string requestFileName, Folder folder, IEnumerable<string> files)
+    {
+        var dataSourceName =
+            Path.GetFileNameWithoutExtension(requestFileName).TrimSuffix(Constants.RequestSuffix) +
+            Constants.DataSourceSuffix;
+
+        var dataSources = files.Where(f =>
+            Path.GetFileName(f).Equals(dataSourceName + Constants.CsvDataSourceFileExtension) ||
+            Path.GetFileName(f).Equals(dataSourceName + Constants.JsonLinesDataSourceFileExtension))
+            .ToList();
+
+        return dataSources.Count switch
+        {
+            0 => null,
+            1 => InternalFile.Create(dataSources[0], folder),
+            _ => throw new InvalidOperationException(
+                $"Test case '{requestFileName}' has multiple data sources. Only one of them is allowed.")
+        };
+    }
+
+    /// <summary>
+    /// Gets data source referenced by the '<i>--- DATA</i>' marker of the test case from <c>.tp</c> file. Its path is
+    /// relative to the <c>.tp</c> file.
+    /// </summary>
+    private static File? GetDataSource(TpTestCaseDefinition definition, string tpFilePath, Folder folder)
+    {
+        if (definition.DataSourcePath is null)
+        {
+            return null;
+        }
+
+        var path = Path.GetFullPath(Path.Combine(folder.Path, definition.DataSourcePath));
+        if (!System.IO.File.Exists(path))
+        {
+            throw new InvalidOperationException(
+                $"Data source '{definition.DataSourcePath}' of test case '{definition.Name}' from .tp file " +
+                $"'{tpFilePath}' doesn't exist.");
+        }
+
+        return new File(path, Path.Combine(folder.RelativePath, definition.DataSourcePath));
+    }
+
     private static string GetRelatedScriptFileName(string requestFileName, string desiredSuffix)
         => Path.GetFileNameWithoutExtension(requestFileName).TrimSuffix(Constants.RequestSuffix) +
             desiredSuffix + Constants.ScriptFileExtension;
@@ -5,8 +5,11 @@ using TeaPie.TestCases;
 namespace TeaPie.StructureExploration;
 
 internal partial class CollectionStructureExplorer(
-    IPathProvider pathProvider, ILogger<CollectionStructureExplorer> logger, TpFileParser tpFileParser)
-    : BaseStructureExplorer(pathProvider, logger, tpFileParser)
+    IPathProvider pathProvider,
+    IStructureIndex structureIndex,
+    ILogger<CollectionStructureExplorer> logger,
+    TpFileParser tpFileParser)
+    : BaseStructureExplorer(pathProvider, structureIndex, logger, tpFileParser)
 {
     protected override CollectionStructure ExploreStructure(ApplicationContext applicationContext)
     {
@@ -67,14 +70,14 @@ internal partial class CollectionStructureExplorer(
         Folder currentFolder,
         IList<string> files)
     {
-        foreach (var reqFile in files.Where(f => f.EndsWith(Constants.RequestFileExtension)).Order())
+        foreach (var reqFile in files.Where(f => f.EndsWith(Constants.RequestFileExtension) && IsSelected(f)).Order())
         {
             var testCase = GetTestCase(currentFolder, out var fileName, out var relativePath, out var requestFileObj, reqFile);
 
             ExploreTestCase(testCase.RequestsFile.Path, collectionStructure, currentFolder, files);
         }
 
-        foreach (var tpFile in files.Where(f => f.IsTpFile()).Order())
+        foreach (var tpFile in files.Where(f => f.IsTpFile() && IsSelected(f)).Order())
         {
             ExploreTpFile(tpFile, collectionStructure, currentFolder);
         }
@@ -97,8 +100,7 @@ internal partial class CollectionStructureExplorer(
 
     #region Getter Methods
 
-    private static IList<string> GetFolders(Folder currentFolder)
-        => [.. Directory.GetDirectories(currentFolder.Path).OrderBy(path => path, StringComparer.OrdinalIgnoreCase)];
+    private IList<string> GetFolders(Folder currentFolder) => [.. _structureIndex.GetFolders(currentFolder.Path)];
 
     #endregion
 
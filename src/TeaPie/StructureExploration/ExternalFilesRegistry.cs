@@ -1,10 +1,12 @@
-﻿namespace TeaPie.StructureExploration;
+﻿using System.Collections.Concurrent;
+
+namespace TeaPie.StructureExploration;
 
 internal interface IExternalFileRegistry : IRegistry<ExternalFile>;
 
 internal class ExternalFilesRegistry : IExternalFileRegistry
 {
-    private readonly Dictionary<string, ExternalFile> _externalFiles = [];
+    private readonly ConcurrentDictionary<string, ExternalFile> _externalFiles = new();
 
     public void Register(string name, ExternalFile element) => _externalFiles[name] = element;
 
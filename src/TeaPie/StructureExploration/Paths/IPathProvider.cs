@@ -20,6 +20,14 @@ internal interface IPathProvider
 
     string NuGetPackagesFolderPath { get; }
 
+    string NuGetLockFilePath { get; }
+
+    string StructureIndexFilePath { get; }
+
+    string AccessTokensFolderPath { get; }
+
+    string CompiledScriptsFolderPath { get; }
+
     string VariablesFolderPath { get; }
 
     string VariablesFilePath { get; }
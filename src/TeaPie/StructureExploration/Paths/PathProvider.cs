@@ -9,6 +9,11 @@ internal class PathProvider : IPathProvider
     private const string ReportsFolderName = "reports";
     private const string TempFolderName = "temp";
     private const string NuGetPackagesFolderName = "packages";
+    private const string CompiledScriptsFolderName = "scripts";
+    private const string NuGetLockFileName = "nuget.lock.json";
+    private const string StructureIndexFolderName = "structure";
+    private const string AccessTokensFolderName = "tokens";
+    private const string StructureIndexFileExtension = ".json";
 
     private const string VariablesFolderName = "variables";
     private const string RunsFolderName = "runs";
@@ -26,6 +31,12 @@ internal class PathProvider : IPathProvider
     public string CacheFolderPath => Path.Combine(TeaPieFolderPath, CacheFolderName);
     public string TempFolderPath => Path.Combine(CacheFolderPath, TempFolderName, GetStructurePathHash());
     public string NuGetPackagesFolderPath => Path.Combine(CacheFolderPath, NuGetPackagesFolderName);
+    public string NuGetLockFilePath => Path.Combine(CacheFolderPath, NuGetLockFileName);
+    public string StructureIndexFilePath => string.IsNullOrEmpty(RootPath)
+        ? string.Empty
+        : Path.Combine(CacheFolderPath, StructureIndexFolderName, GetStructurePathHash() + StructureIndexFileExtension);
+    public string AccessTokensFolderPath => Path.Combine(CacheFolderPath, AccessTokensFolderName);
+    public string CompiledScriptsFolderPath => Path.Combine(CacheFolderPath, CompiledScriptsFolderName);
     public string ReportsFolderPath => Path.Combine(TeaPieFolderPath, ReportsFolderName);
 
     public string RunsFolderPath => Path.Combine(TeaPieFolderPath, RunsFolderName);
@@ -15,6 +15,8 @@ internal static class Setup
 
         services.AddPaths();
 
+        services.AddSingleton<IStructureIndex, StructureIndex>();
+
         return isCollectionRun
             ? services.AddSingleton<IStructureExplorer, CollectionStructureExplorer>()
             : services.AddSingleton<IStructureExplorer, TestCaseStructureExplorer>();
@@ -202,6 +202,11 @@ internal class SpectreConsoleTreeStructureRenderer(IPathProvider pathProvider) :
             descriptionParts.Add("test");
         }
 
+        if (testCase.DataSource is not null)
+        {
+            descriptionParts.Add("data");
+        }
+
         var description = descriptionParts.Count > 0
             ? $" [grey]({string.Join(", ", descriptionParts)})[/]"
             : string.Empty;
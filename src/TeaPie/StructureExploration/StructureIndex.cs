@@ -0,0 +1,325 @@
+﻿using System.Security.Cryptography;
+using System.Text;
+using System.Text.Json;
+using System.Text.RegularExpressions;
+using TeaPie.StructureExploration.Paths;
+
+namespace TeaPie.StructureExploration;
+
+internal interface IStructureIndex
+{
+    /// <summary>
+    /// Gets paths of all files directly within the folder. Folder is listed again only if it was modified since
+    /// the last listing, otherwise the listing is taken from the index.
+    /// </summary>
+    IReadOnlyList<string> GetFiles(string folderPath);
+
+    /// <summary>
+    /// Gets paths of all sub-folders of the folder. Folder is listed again only if it was modified since
+    /// the last listing, otherwise the listing is taken from the index.
+    /// </summary>
+    IReadOnlyList<string> GetFolders(string folderPath);
+
+    /// <summary>
+    /// Gets hash of the file's content. File is read (and hashed) again only if its size or modification time changed.
+    /// </summary>
+    /// <returns>Hash of the content or <c>null</c>, if the file doesn't exist.</returns>
+    string? GetContentHash(string filePath);
+
+    /// <summary>
+    /// Gets full paths of all scripts, which are referenced by <c>#load</c> directives within the file (and of data
+    /// sources referenced by <c>--- DATA</c> markers, if it is <c>.tp</c> file).
+    /// </summary>
+    IReadOnlyCollection<string> GetDependencies(string filePath);
+
+    /// <summary>
+    /// Refreshes hash of the file's content and returns whether the content differs from the previously known one.
+    /// File, which wasn't hashed before, is considered as changed.
+    /// </summary>
+    bool HasContentChanged(string filePath);
+
+    /// <summary>
+    /// Persists the index to the cache, so that the following runs explore only modified folders.
+    /// </summary>
+    void Save();
+}
+
+/// <summary>
+/// Index of the explored structure, which is persisted in the cache. For every folder it holds its listing (files
+/// with their sizes and modification times and sub-folders) and for files it lazily holds hashes of their contents and
+/// scripts referenced by them. Index is refreshed incrementally - only folders and files, which were modified since
+/// they were indexed, are read again.
+/// </summary>
+internal partial class StructureIndex(IPathProvider pathProvider, IPathResolver pathResolver) : IStructureIndex
+{
+    private const int FormatVersion = 2;
+
+    private static readonly JsonSerializerOptions _serializerOptions = new()
+    {
+        PropertyNamingPolicy = JsonNamingPolicy.CamelCase
+    };
+
+    private readonly IPathProvider _pathProvider = pathProvider;
+    private readonly IPathResolver _pathResolver = pathResolver;
+    private readonly object _lock = new();
+    private IndexContent? _content;
+    private string? _loadedFromPath;
+    private bool _changed;
+
+    public IReadOnlyList<string> GetFiles(string folderPath)
+    {
+        lock (_lock)
+        {
+            return [.. GetFolder(folderPath).Files.Select(name => Path.Combine(folderPath, name))];
+        }
+    }
+
+    public IReadOnlyList<string> GetFolders(string folderPath)
+    {
+        lock (_lock)
+        {
+            return [.. GetFolder(folderPath).Folders.Select(name => Path.Combine(folderPath, name))];
+        }
+    }
+
+    public string? GetContentHash(string filePath)
+    {
+        lock (_lock)
+        {
+            return GetFile(filePath)?.Hash;
+        }
+    }
+
+    public IReadOnlyCollection<string> GetDependencies(string filePath)
+    {
+        lock (_lock)
+        {
+            return GetFile(filePath)?.Dependencies ?? [];
+        }
+    }
+
+    public bool HasContentChanged(string filePath)
+    {
+        lock (_lock)
+        {
+            var previousHash = GetContent().Files.TryGetValue(filePath, out var entry) ? entry.Hash : null;
+            var currentHash = GetFile(filePath)?.Hash;
+
+            return previousHash is null || !previousHash.Equals(currentHash, StringComparison.Ordinal);
+        }
+    }
+
+    public void Save()
+    {
+        lock (_lock)
+        {
+            var indexFilePath = _pathProvider.StructureIndexFilePath;
+            if (!_changed || string.IsNullOrEmpty(indexFilePath))
+            {
+                return;
+            }
+
+            Directory.CreateDirectory(Path.GetDirectoryName(indexFilePath)!);
+
+            var temporaryPath = $"{indexFilePath}.{Guid.NewGuid():N}.tmp";
+            System.IO.File.WriteAllText(temporaryPath, JsonSerializer.Serialize(_content, _serializerOptions));
+            System.IO.File.Move(temporaryPath, indexFilePath, true);
+
+            _changed = false;
+        }
+    }
+
+    #region Folders
+
+    private FolderEntry GetFolder(string folderPath)
+    {
+        var content = GetContent();
+        var lastWriteTime = Directory.GetLastWriteTimeUtc(folderPath).Ticks;
+
+        if (content.Folders.TryGetValue(folderPath, out var entry) && entry.LastWriteTime == lastWriteTime)
+        {
+            return entry;
+        }
+
+        var newEntry = ListFolder(folderPath, lastWriteTime, content);
+        if (entry is not null)
+        {
+            RemoveMissingEntries(folderPath, entry, newEntry, content);
+        }
+
+        content.Folders[folderPath] = newEntry;
+        _changed = true;
+
+        return newEntry;
+    }
+
+    private static FolderEntry ListFolder(string folderPath, long lastWriteTime, IndexContent content)
+    {
+        var directory = new DirectoryInfo(folderPath);
+        var files = directory.GetFiles().OrderBy(file => file.Name, StringComparer.OrdinalIgnoreCase).ToList();
+        var folders = directory.GetDirectories().Select(folder => folder.Name).Order(StringComparer.OrdinalIgnoreCase);
+
+        foreach (var file in files)
+        {
+            var filePath = Path.Combine(folderPath, file.Name);
+            var fileLastWriteTime = file.LastWriteTimeUtc.Ticks;
+            if (!content.Files.TryGetValue(filePath, out var fileEntry) ||
+                !fileEntry.Matches(fileLastWriteTime, file.Length))
+            {
+                content.Files[filePath] = new FileEntry(fileLastWriteTime, file.Length);
+            }
+        }
+
+        return new FolderEntry(lastWriteTime, [.. files.Select(file => file.Name)], [.. folders]);
+    }
+
+    private static void RemoveMissingEntries(
+        string folderPath, FolderEntry oldEntry, FolderEntry newEntry, IndexContent content)
+    {
+        foreach (var fileName in oldEntry.Files.Except(newEntry.Files))
+        {
+            content.Files.Remove(Path.Combine(folderPath, fileName));
+        }
+
+        foreach (var folderName in oldEntry.Folders.Except(newEntry.Folders))
+        {
+            RemoveFolder(Path.Combine(folderPath, folderName), content);
+        }
+    }
+
+    private static void RemoveFolder(string folderPath, IndexContent content)
+    {
+        if (!content.Folders.Remove(folderPath, out var entry))
+        {
+            return;
+        }
+
+        foreach (var fileName in entry.Files)
+        {
+            content.Files.Remove(Path.Combine(folderPath, fileName));
+        }
+
+        foreach (var folderName in entry.Folders)
+        {
+            RemoveFolder(Path.Combine(folderPath, folderName), content);
+        }
+    }
+
+    #endregion
+
+    #region Files
+
+    private FileEntry? GetFile(string filePath)
+    {
+        var content = GetContent();
+        var file = new FileInfo(filePath);
+
+        if (!file.Exists)
+        {
+            _changed |= content.Files.Remove(filePath);
+            return null;
+        }
+
+        var lastWriteTime = file.LastWriteTimeUtc.Ticks;
+        if (content.Files.TryGetValue(filePath, out var entry) &&
+            entry.Matches(lastWriteTime, file.Length) &&
+            entry.Hash is not null)
+        {
+            return entry;
+        }
+
+        var fileContent = System.IO.File.ReadAllBytes(filePath);
+        var newEntry = new FileEntry(lastWriteTime, file.Length)
+        {
+            Hash = Convert.ToHexString(SHA256.HashData(fileContent)).ToLowerInvariant(),
+            Dependencies = GetDependencies(filePath, Encoding.UTF8.GetString(fileContent))
+        };
+
+        content.Files[filePath] = newEntry;
+        _changed = true;
+
+        return newEntry;
+    }
+
+    private List<string> GetDependencies(string filePath, string fileContent)
+    {
+        var directory = Path.GetDirectoryName(filePath)!;
+
+        var referencedScripts = LoadDirectiveRegex().Matches(fileContent)
+            .Select(match => match.Groups[1].Value.Trim().NormalizeSeparators())
+            .Where(path => !string.IsNullOrEmpty(path))
+            .Select(path => Path.GetFullPath(_pathResolver.ResolvePath(path, directory)));
+
+        var dataSources = filePath.IsTpFile()
+            ? DataMarkerRegex().Matches(fileContent)
+                .Select(match => Path.GetFullPath(Path.Combine(directory, match.Groups[1].Value.Trim())))
+            : [];
+
+        return [.. referencedScripts.Concat(dataSources).Distinct()];
+    }
+
+    #endregion
+
+    #region Persistence
+
+    private IndexContent GetContent()
+    {
+        // Paths can change during the run (they are resolved by one of the first steps), so the index is (re)loaded
+        // for the currently resolved structure.
+        var indexFilePath = _pathProvider.StructureIndexFilePath;
+        if (_content is null || !string.Equals(_loadedFromPath, indexFilePath, StringComparison.Ordinal))
+        {
+            _content = Load(indexFilePath);
+            _loadedFromPath = indexFilePath;
+            _changed = false;
+        }
+
+        return _content;
+    }
+
+    private static IndexContent Load(string indexFilePath)
+    {
+        if (string.IsNullOrEmpty(indexFilePath) || !System.IO.File.Exists(indexFilePath))
+        {
+            return new IndexContent();
+        }
+
+        try
+        {
+            var content = JsonSerializer.Deserialize<IndexContent>(
+                System.IO.File.ReadAllText(indexFilePath), _serializerOptions);
+
+            return content?.Version == FormatVersion ? content : new IndexContent();
+        }
+        catch (JsonException)
+        {
+            // Corrupted index is ignored - whole structure is explored again and the index is rewritten.
+            return new IndexContent();
+        }
+    }
+
+    #endregion
+
+    [GeneratedRegex(@"^#load\s+""(.+)""\s*$", RegexOptions.Multiline)]
+    private static partial Regex LoadDirectiveRegex();
+
+    [GeneratedRegex(@"^\s*---\s*DATA\s+(.+?)\s*$", RegexOptions.Multiline | RegexOptions.IgnoreCase)]
+    private static partial Regex DataMarkerRegex();
+
+    private class IndexContent
+    {
+        public int Version { get; set; } = FormatVersion;
+        public Dictionary<string, FolderEntry> Folders { get; set; } = [];
+        public Dictionary<string, FileEntry> Files { get; set; } = [];
+    }
+
+    private record FolderEntry(long LastWriteTime, List<string> Files, List<string> Folders);
+
+    private record FileEntry(long LastWriteTime, long Length)
+    {
+        public string? Hash { get; init; }
+        public List<string>? Dependencies { get; init; }
+
+        public bool Matches(long lastWriteTime, long length) => LastWriteTime == lastWriteTime && Length == length;
+    }
+}
@@ -12,6 +12,7 @@ internal class TestCase(InternalFile requestFile)
     public IEnumerable<Script> PreRequestScripts = [];
     public InternalFile RequestsFile = requestFile;
     public IEnumerable<Script> PostResponseScripts = [];
+    public File? DataSource;
 
     public bool IsFromTpFile { get; init; }
     public TpTestCaseDefinition? TpDefinition { get; init; }
@@ -5,8 +5,11 @@ using TeaPie.TestCases;
 namespace TeaPie.StructureExploration;
 
 internal partial class TestCaseStructureExplorer(
-    IPathProvider pathProvider, ILogger<TestCaseStructureExplorer> logger, TpFileParser tpFileParser)
-    : BaseStructureExplorer(pathProvider, logger, tpFileParser)
+    IPathProvider pathProvider,
+    IStructureIndex structureIndex,
+    ILogger<TestCaseStructureExplorer> logger,
+    TpFileParser tpFileParser)
+    : BaseStructureExplorer(pathProvider, structureIndex, logger, tpFileParser)
 {
     protected override CollectionStructure ExploreStructure(ApplicationContext applicationContext)
     {
@@ -103,6 +106,11 @@ internal partial class TestCaseStructureExplorer(
             tokens.Add("post-response script");
         }
 
+        if (testCase.DataSource is not null)
+        {
+            tokens.Add("data source");
+        }
+
         if (tokens.Count == 0)
         {
             tokens.Add("HTTP only");
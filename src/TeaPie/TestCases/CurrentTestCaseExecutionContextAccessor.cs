@@ -1,4 +1,5 @@
 ﻿using System.Diagnostics;
+using TeaPie.Pipelines;
 
 namespace TeaPie.TestCases;
 
@@ -7,5 +8,11 @@ internal interface ICurrentTestCaseExecutionContextAccessor : IContextAccessor<T
 [DebuggerDisplay("{Context}")]
 internal class CurrentTestCaseExecutionContextAccessor : ICurrentTestCaseExecutionContextAccessor
 {
-    public TestCaseExecutionContext? Context { get; set; }
+    private readonly BranchLocal<TestCaseExecutionContext?> _context = new(() => null);
+
+    public TestCaseExecutionContext? Context
+    {
+        get => _context.Value;
+        set => _context.Value = value;
+    }
 }
@@ -0,0 +1,272 @@
+﻿using System.Runtime.CompilerServices;
+using System.Text;
+using System.Text.Json;
+using TeaPie.Variables;
+
+namespace TeaPie.TestCases;
+
+/// <summary>
+/// Row of the data source of data-driven test case.
+/// </summary>
+/// <param name="Number">Order of the row within the data source (starting with 1).</param>
+/// <param name="Values">Values of the row by names of the columns.</param>
+internal record DataRow(int Number, IReadOnlyDictionary<string, object?> Values);
+
+/// <summary>
+/// Streams rows of the data source, so that even large data sources are never loaded into the memory at once.
+/// Supported formats are CSV (first line contains names of the columns) and JSON lines (one object per line).
+/// </summary>
+internal static class DataSourceReader
+{
+    private const char CsvSeparator = ',';
+    private const char CsvQuote = '"';
+
+    public static IAsyncEnumerable<DataRow> ReadRows(string path, CancellationToken cancellationToken = default)
+        => Path.GetExtension(path).ToLowerInvariant() switch
+        {
+            Constants.CsvDataSourceFileExtension => ReadCsvRows(path, cancellationToken),
+            Constants.JsonLinesDataSourceFileExtension => ReadJsonLinesRows(path, cancellationToken),
+            _ => throw new InvalidOperationException(
+                $"Unsupported format of the data source '{path}'. Only " +
+                $"'{Constants.CsvDataSourceFileExtension}' and '{Constants.JsonLinesDataSourceFileExtension}' " +
+                "files are supported.")
+        };
+
+    /// <summary>
+    /// Names of the columns (properties) become names of the variables, so they are validated only once, when they
+    /// are read, rather than for each row.
+    /// </summary>
+    private static void ValidateName(string name, string location)
+    {
+        try
+        {
+            VariableNameValidator.Resolve(name);
+        }
+        catch (VariableNameViolationException ex)
+        {
+            throw new InvalidOperationException($"{location} with invalid name '{name}': {ex.Message}", ex);
+        }
+    }
+
+    #region CSV
+
+    private static async IAsyncEnumerable<DataRow> ReadCsvRows(
+        string path, [EnumeratorCancellation] CancellationToken cancellationToken)
+    {
+        using var reader = new StreamReader(path);
+
+        var header = await ReadCsvRecord(reader, path, cancellationToken);
+        if (header is null)
+        {
+            yield break;
+        }
+
+        var columns = GetColumns(header, path);
+        var number = 0;
+
+        while (await ReadCsvRecord(reader, path, cancellationToken) is { } values)
+        {
+            if (values is [""])
+            {
+                continue;
+            }
+
+            number++;
+            if (values.Count != columns.Length)
+            {
+                throw new InvalidOperationException(
+                    $"Row {number} of the data source '{path}' has {values.Count} values, but {columns.Length} " +
+                    "columns are defined by its header.");
+            }
+
+            yield return new DataRow(number, CreateValues(columns, values));
+        }
+    }
+
+    private static string[] GetColumns(List<string> header, string path)
+    {
+        var columns = header.Select(column => column.Trim()).ToArray();
+        if (columns.Any(string.IsNullOrEmpty))
+        {
+            throw new InvalidOperationException(
+                $"Header of the data source '{path}' contains column without name.");
+        }
+
+        foreach (var column in columns)
+        {
+            ValidateName(column, $"Header of the data source '{path}' contains column");
+        }
+
+        var duplicatedColumn = columns.GroupBy(column => column).FirstOrDefault(group => group.Count() > 1);
+        if (duplicatedColumn is not null)
+        {
+            throw new InvalidOperationException(
+                $"Header of the data source '{path}' contains column '{duplicatedColumn.Key}' more than once.");
+        }
+
+        return columns;
+    }
+
+    private static Dictionary<string, object?> CreateValues(string[] columns, List<string> values)
+    {
+        var result = new Dictionary<string, object?>(columns.Length);
+        for (var i = 0; i < columns.Length; i++)
+        {
+            result[columns[i]] = values[i];
+        }
+
+        return result;
+    }
+
+    /// <summary>
+    /// Reads one record - values separated by comma. Values may be enclosed in double quotes, in such case they can
+    /// contain commas, line breaks and (doubled) double quotes.
+    /// </summary>
+    private static async Task<List<string>?> ReadCsvRecord(
+        StreamReader reader, string path, CancellationToken cancellationToken)
+    {
+        var line = await reader.ReadLineAsync(cancellationToken);
+        if (line is null)
+        {
+            return null;
+        }
+
+        List<string> values = [];
+        var value = new StringBuilder();
+        var quoted = false;
+
+        while (true)
+        {
+            for (var i = 0; i < line.Length; i++)
+            {
+                var character = line[i];
+                if (quoted)
+                {
+                    if (character != CsvQuote)
+                    {
+                        value.Append(character);
+                    }
+                    else if (i + 1 < line.Length && line[i + 1] == CsvQuote)
+                    {
+                        value.Append(CsvQuote);
+                        i++;
+                    }
+                    else
+                    {
+                        quoted = false;
+                    }
+                }
+                else if (character == CsvQuote && value.Length == 0)
+                {
+                    quoted = true;
+                }
+                else if (character == CsvSeparator)
+                {
+                    values.Add(value.ToString());
+                    value.Clear();
+                }
+                else
+                {
+                    value.Append(character);
+                }
+            }
+
+            if (!quoted)
+            {
+                break;
+            }
+
+            line = await reader.ReadLineAsync(cancellationToken)
+                ?? throw new InvalidOperationException($"Data source '{path}' ends within quoted value.");
+            value.Append('\n');
+        }
+
+        values.Add(value.ToString());
+        return values;
+    }
+
+    #endregion
+
+    #region JSON Lines
+
+    private static async IAsyncEnumerable<DataRow> ReadJsonLinesRows(
+        string path, [EnumeratorCancellation] CancellationToken cancellationToken)
+    {
+        using var reader = new StreamReader(path);
+
+        var number = 0;
+        while (await reader.ReadLineAsync(cancellationToken) is { } line)
+        {
+            if (string.IsNullOrWhiteSpace(line))
+            {
+                continue;
+            }
+
+            number++;
+            yield return new DataRow(number, ParseJsonLine(line, number, path));
+        }
+    }
+
+    private static Dictionary<string, object?> ParseJsonLine(string line, int number, string path)
+    {
+        try
+        {
+            using var document = JsonDocument.Parse(line);
+            if (document.RootElement.ValueKind != JsonValueKind.Object)
+            {
+                throw new InvalidOperationException(
+                    $"Row {number} of the data source '{path}' is not a JSON object.");
+            }
+
+            var values = new Dictionary<string, object?>();
+            foreach (var property in document.RootElement.EnumerateObject())
+            {
+                ValidateName(property.Name, $"Row {number} of the data source '{path}' contains property");
+                if (!values.TryAdd(property.Name, GetValue(property)))
+                {
+                    throw new InvalidOperationException(
+                        $"Row {number} of the data source '{path}' contains property '{property.Name}' " +
+                        "more than once.");
+                }
+            }
+
+            return values;
+        }
+        catch (JsonException ex)
+        {
+            throw new InvalidOperationException(
+                $"Row {number} of the data source '{path}' is not a valid JSON: {ex.Message}", ex);
+        }
+    }
+
+    /// <summary>
+    /// Primitive values are converted to their .NET counterparts, objects and arrays are kept as JSON text.
+    /// </summary>
+    private static object? GetValue(JsonProperty property)
+        => property.Value.ValueKind switch
+        {
+            JsonValueKind.String => property.Value.GetString(),
+            JsonValueKind.Number => GetNumber(property.Value),
+            JsonValueKind.True => true,
+            JsonValueKind.False => false,
+            JsonValueKind.Null => null,
+            _ => property.Value.GetRawText()
+        };
+
+    private static object GetNumber(JsonElement element)
+    {
+        if (element.TryGetInt64(out var integer))
+        {
+            return integer;
+        }
+
+        if (element.TryGetDecimal(out var number))
+        {
+            return number;
+        }
+
+        return element.GetDouble();
+    }
+
+    #endregion
+}
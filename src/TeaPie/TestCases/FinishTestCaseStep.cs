@@ -23,5 +23,7 @@ internal class FinishTestCaseStep : IPipelineStep
             $"{context.CurrentTestCase.Id}/{context.TestCases.Count}");
         context.CurrentTestCase.TreeScope?.Dispose();
         context.CurrentTestCase.TreeScope = null;
+        context.CurrentTestCase.TracingScope?.Dispose();
+        context.CurrentTestCase.TracingScope = null;
     }
 }
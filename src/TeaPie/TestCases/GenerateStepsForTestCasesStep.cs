@@ -25,9 +25,16 @@ internal class GenerateStepsForTestCasesStep(IPipeline pipeline) : IPipelineStep
                 return Task.CompletedTask;
             }));
 
-            foreach (var testCase in collectionGroup)
+            if (context.MaxDegreeOfParallelism > 1)
             {
-                AddStepsForTestCase(context, testCase, newSteps);
+                AddStepForParallelExecution(context, collectionGroup, newSteps);
+            }
+            else
+            {
+                foreach (var testCase in collectionGroup)
+                {
+                    AddStepsForTestCase(context, testCase, newSteps);
+                }
             }
 
             newSteps.Add(new InlineStep((ctx, _) =>
@@ -48,8 +55,23 @@ internal class GenerateStepsForTestCasesStep(IPipeline pipeline) : IPipelineStep
 
     private static void AddStepsForTestCase(
         ApplicationContext context, TestCase testCase, List<IPipelineStep> newSteps)
+        => newSteps.AddRange(CreateStepsForTestCase(context, testCase));
+
+    private void AddStepForParallelExecution(
+        ApplicationContext context, IEnumerable<TestCase> testCases, List<IPipelineStep> newSteps)
     {
-        var testCaseExecutionContext = new TestCaseExecutionContext(testCase);
-        newSteps.AddRange(TestCaseStepsFactory.CreateStepsForTestsCase(context.ServiceProvider, testCaseExecutionContext));
+        var branches = testCases.Select(testCase => CreateStepsForTestCase(context, testCase)).ToList();
+
+        newSteps.Add(new InlineStep(async (ctx, cancellationToken) =>
+        {
+            ctx.Logger.LogDebug("Test cases ({Count}) are going to be executed in parallel by at most {Workers} workers.",
+                branches.Count,
+                ctx.MaxDegreeOfParallelism);
+
+            await _pipeline.RunInParallel(ctx, branches, ctx.MaxDegreeOfParallelism, cancellationToken);
+        }));
     }
+
+    private static IPipelineStep[] CreateStepsForTestCase(ApplicationContext context, TestCase testCase)
+        => TestCaseStepsFactory.CreateStepsForTestCase(context.ServiceProvider, testCase);
 }
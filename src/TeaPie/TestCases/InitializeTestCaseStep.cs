@@ -2,14 +2,19 @@ using Microsoft.Extensions.Logging;
 using TeaPie.Logging.Tree;
 using TeaPie.Pipelines;
 using TeaPie.Scripts;
+using TeaPie.Tracing;
 using Script = TeaPie.StructureExploration.Script;
 
 namespace TeaPie.TestCases;
 
-internal class InitializeTestCaseStep(ITestCaseExecutionContextAccessor accessor, IPipeline pipeline) : IPipelineStep
+internal class InitializeTestCaseStep(
+    ITestCaseExecutionContextAccessor accessor,
+    IPipeline pipeline,
+    IStepsTracer tracer) : IPipelineStep
 {
     private readonly IPipeline _pipeline = pipeline;
     private readonly ITestCaseExecutionContextAccessor _testCaseExecutionContextAccessor = accessor;
+    private readonly IStepsTracer _tracer = tracer;
 
     public async Task Execute(ApplicationContext context, CancellationToken cancellationToken = default)
     {
@@ -17,7 +22,8 @@ internal class InitializeTestCaseStep(ITestCaseExecutionContextAccessor accessor
 
         context.CurrentTestCase = testCaseExecutionContext;
 
-        if (testCaseExecutionContext.TestCase.IsFromTpFile)
+        // Test case with plan (e.g. row of data-driven test case) was already prepared when the plan was created.
+        if (testCaseExecutionContext.TestCase.IsFromTpFile && testCaseExecutionContext.Plan is null)
         {
             PrepareTpTestCase(testCaseExecutionContext);
         }
@@ -25,11 +31,12 @@ internal class InitializeTestCaseStep(ITestCaseExecutionContextAccessor accessor
         AddSteps(context, testCaseExecutionContext);
 
         LogTestCase(context, testCaseExecutionContext);
+        testCaseExecutionContext.TracingScope = _tracer.BeginScope("Test case", testCaseExecutionContext.TestCase.Name);
 
         await Task.CompletedTask;
     }
 
-    private static void PrepareTpTestCase(TestCaseExecutionContext ctx)
+    internal static void PrepareTpTestCase(TestCaseExecutionContext ctx)
     {
         var testCase = ctx.TestCase;
         var def = testCase.TpDefinition!;
@@ -88,6 +95,7 @@ internal class InitializeTestCaseStep(ITestCaseExecutionContextAccessor accessor
             context,
             testCaseExecutionContext.TestCase.PreRequestScripts,
             testCaseExecutionContext.RegisterPreRequestScript,
+            testCaseExecutionContext.Plan,
             newSteps);
 
     private static void AddStepsForRegisterTestScripts(
@@ -98,6 +106,7 @@ internal class InitializeTestCaseStep(ITestCaseExecutionContextAccessor accessor
             context,
             testCaseExecutionContext.TestCase.PostResponseScripts,
             testCaseExecutionContext.RegisterPostResponseScript,
+            testCaseExecutionContext.Plan,
             newSteps);
 
     private static void AddStepsForExecuteTestsScripts(
@@ -113,17 +122,26 @@ internal class InitializeTestCaseStep(ITestCaseExecutionContextAccessor accessor
         ApplicationContext context,
         IEnumerable<Script> scriptsCollection,
         Action<string, ScriptExecutionContext> addToCollection,
+        TestCasePlan? plan,
         List<IPipelineStep> newSteps)
     {
         foreach (var script in scriptsCollection)
         {
             addToCollection(script.File.Path, new(script));
-            AddStepsForScript(context, script, newSteps);
+            AddStepsForScript(context, script, plan, newSteps);
         }
     }
 
-    private static void AddStepsForScript(ApplicationContext context, Script script, List<IPipelineStep> newSteps)
+    private static void AddStepsForScript(
+        ApplicationContext context, Script script, TestCasePlan? plan, List<IPipelineStep> newSteps)
     {
+        if (plan is not null && plan.TryGetCompiledScript(script.File.Path, out var compiledScript))
+        {
+            newSteps.AddRange(ScriptStepsFactory.CreateStepsForCompiledScriptExecution(
+                context.ServiceProvider, new ScriptExecutionContext(script) { ScriptObject = compiledScript }));
+            return;
+        }
+
         var scriptExecutionContext = new ScriptExecutionContext(script)
         {
             RawContent = script.Content
@@ -0,0 +1,216 @@
+﻿using Microsoft.Extensions.Logging;
+using TeaPie.Logging;
+using TeaPie.Logging.Tree;
+using TeaPie.Pipelines;
+using TeaPie.Scripts;
+using TeaPie.StructureExploration;
+using TeaPie.Variables;
+using File = System.IO.File;
+using Timer = TeaPie.Logging.Timer;
+
+namespace TeaPie.TestCases;
+
+/// <summary>
+/// Executes test case once for each row of its data source. Requests file is read and scripts are compiled only once -
+/// into the <see cref="TestCasePlan"/>, which is shared by all rows. Rows are streamed from the data source and
+/// executed in batches, each row in its own <see cref="PipelineBranch"/> with values of the row as test-case variables.
+/// </summary>
+internal class RunDataDrivenTestCaseStep(
+    ITestCaseExecutionContextAccessor accessor,
+    IPipeline pipeline,
+    IVariables variables) : IPipelineStep
+{
+    /// <summary>
+    /// Number of rows, which are read from the data source and executed at once.
+    /// </summary>
+    internal const int BatchSize = 100;
+
+    private readonly ITestCaseExecutionContextAccessor _testCaseExecutionContextAccessor = accessor;
+    private readonly IPipeline _pipeline = pipeline;
+    private readonly IVariables _variables = variables;
+
+    public async Task Execute(ApplicationContext context, CancellationToken cancellationToken = default)
+    {
+        ValidateContext(out var testCaseExecutionContext, out var dataSource);
+
+        using (context.Logger.BeginOuterTreeScope())
+        {
+            LogStart(context, testCaseExecutionContext, dataSource);
+
+            var plan = await CreatePlan(context, testCaseExecutionContext, cancellationToken);
+            if (context.PrematureTermination is not null)
+            {
+                return;
+            }
+
+            long elapsedTime = 0;
+            var numberOfRows = await Timer.Execute(
+                async () => await ExecuteRows(context, testCaseExecutionContext, plan, dataSource, cancellationToken),
+                realTime => elapsedTime = realTime);
+
+            LogEnd(context, testCaseExecutionContext, numberOfRows, elapsedTime);
+        }
+    }
+
+    private async Task<TestCasePlan> CreatePlan(
+        ApplicationContext context,
+        TestCaseExecutionContext testCaseExecutionContext,
+        CancellationToken cancellationToken)
+    {
+        var testCase = testCaseExecutionContext.TestCase;
+        if (testCase.IsFromTpFile)
+        {
+            InitializeTestCaseStep.PrepareTpTestCase(testCaseExecutionContext);
+        }
+        else
+        {
+            testCaseExecutionContext.RequestsFileContent =
+                await File.ReadAllTextAsync(testCase.RequestsFile.Path, cancellationToken);
+        }
+
+        var plan = new TestCasePlan(testCaseExecutionContext.RequestsFileContent!);
+
+        List<ScriptExecutionContext> scripts = [.. testCase.PreRequestScripts.Concat(testCase.PostResponseScripts)
+            .Select(script => new ScriptExecutionContext(script) { RawContent = script.Content })];
+
+        var steps = scripts
+            .SelectMany(script => ScriptStepsFactory.CreateStepsForScriptCompilation(context.ServiceProvider, script))
+            .ToArray();
+
+        // Compilation runs as a separate branch, so that steps for scripts referenced by '#load' directives are
+        // inserted right after it.
+        await _pipeline.RunInParallel(context, [steps], 1, cancellationToken);
+
+        foreach (var script in scripts.Where(script => script.ScriptObject is not null))
+        {
+            plan.AddCompiledScript(script.Script.File.Path, script.ScriptObject!);
+        }
+
+        return plan;
+    }
+
+    private async Task<int> ExecuteRows(
+        ApplicationContext context,
+        TestCaseExecutionContext testCaseExecutionContext,
+        TestCasePlan plan,
+        StructureExploration.File dataSource,
+        CancellationToken cancellationToken)
+    {
+        // Rows of test case, which is already executed within parallel branch, are executed one by one, so that the
+        // number of concurrently executed requests is still limited by the degree of parallelism.
+        var maxDegreeOfParallelism = PipelineBranch.Current is null ? context.MaxDegreeOfParallelism : 1;
+
+        var numberOfRows = 0;
+        List<DataRow> batch = new(BatchSize);
+
+        await foreach (var row in DataSourceReader.ReadRows(dataSource.Path, cancellationToken))
+        {
+            batch.Add(row);
+            if (batch.Count < BatchSize)
+            {
+                continue;
+            }
+
+            numberOfRows += await ExecuteBatch(
+                context, testCaseExecutionContext, plan, batch, maxDegreeOfParallelism, cancellationToken);
+
+            if (context.PrematureTermination is not null)
+            {
+                return numberOfRows;
+            }
+        }
+
+        return numberOfRows + await ExecuteBatch(
+            context, testCaseExecutionContext, plan, batch, maxDegreeOfParallelism, cancellationToken);
+    }
+
+    private async Task<int> ExecuteBatch(
+        ApplicationContext context,
+        TestCaseExecutionContext testCaseExecutionContext,
+        TestCasePlan plan,
+        List<DataRow> batch,
+        int maxDegreeOfParallelism,
+        CancellationToken cancellationToken)
+    {
+        var branches = batch.Select(row => CreateStepsForRow(context, testCaseExecutionContext, plan, row)).ToList();
+        var numberOfRows = batch.Count;
+        batch.Clear();
+
+        await _pipeline.RunInParallel(context, branches, maxDegreeOfParallelism, cancellationToken);
+
+        return numberOfRows;
+    }
+
+    private IPipelineStep[] CreateStepsForRow(
+        ApplicationContext context,
+        TestCaseExecutionContext testCaseExecutionContext,
+        TestCasePlan plan,
+        DataRow row)
+    {
+        var testCase = testCaseExecutionContext.TestCase;
+        var rowTestCase = new TestCase(testCase.RequestsFile)
+        {
+            Name = $"{testCase.Name} [{row.Number}]",
+            PreRequestScripts = testCase.PreRequestScripts,
+            PostResponseScripts = testCase.PostResponseScripts,
+            DataSource = testCase.DataSource,
+            IsFromTpFile = testCase.IsFromTpFile,
+            TpDefinition = testCase.TpDefinition
+        };
+
+        var rowExecutionContext = new TestCaseExecutionContext(rowTestCase, testCaseExecutionContext.Id)
+        {
+            Plan = plan,
+            DataRow = row,
+            RequestsFileContent = plan.RequestsFileContent
+        };
+
+        return [new InlineStep((_, _) => SetRowVariables(row)),
+            .. TestCaseStepsFactory.CreateStepsForTestsCase(context.ServiceProvider, rowExecutionContext)];
+    }
+
+    /// <summary>
+    /// Test-case variables are local to the branch of the row, so rows never see values of each other.
+    /// </summary>
+    private Task SetRowVariables(DataRow row)
+    {
+        foreach (var (name, value) in row.Values)
+        {
+            _variables.TestCaseVariables.Set(name, value, Constants.NoCacheVariableTag);
+        }
+
+        return Task.CompletedTask;
+    }
+
+    private static void LogStart(
+        ApplicationContext context,
+        TestCaseExecutionContext testCaseExecutionContext,
+        StructureExploration.File dataSource)
+        => context.Logger.LogInformation(
+            "Data-driven test case '{Name}' is going to be executed for each row of '{DataSource}'. ({Progress})",
+            testCaseExecutionContext.TestCase.Name,
+            dataSource.GetDisplayPath(),
+            $"{testCaseExecutionContext.Id}/{context.TestCases.Count}");
+
+    private static void LogEnd(
+        ApplicationContext context,
+        TestCaseExecutionContext testCaseExecutionContext,
+        int numberOfRows,
+        long elapsedTime)
+        => context.Logger.LogInformation(
+            "Data-driven test case '{Name}' was executed for {Count} rows in {Time}. ({Progress})",
+            testCaseExecutionContext.TestCase.Name,
+            numberOfRows,
+            elapsedTime.ToHumanReadableTime(),
+            $"{testCaseExecutionContext.Id}/{context.TestCases.Count}");
+
+    private void ValidateContext(
+        out TestCaseExecutionContext testCaseExecutionContext, out StructureExploration.File dataSource)
+    {
+        const string activityName = "run data-driven test case";
+        ExecutionContextValidator.Validate(
+            _testCaseExecutionContextAccessor, out testCaseExecutionContext, activityName);
+        ExecutionContextValidator.ValidateParameter(
+            testCaseExecutionContext.TestCase.DataSource, out dataSource, activityName, "its data source");
+    }
+}
@@ -4,16 +4,23 @@ using TeaPie.Testing;
 
 namespace TeaPie.TestCases;
 
-internal class TestCaseExecutionContext(TestCase testCase) : IExecutionContextExposer
+/// <param name="testCase">Test case to be executed.</param>
+/// <param name="id">Identifier of the execution. If not specified, new one is assigned. Rows of data-driven test case
+/// share identifier of the test case.</param>
+internal class TestCaseExecutionContext(TestCase testCase, int? id = null) : IExecutionContextExposer
 {
     private static int _testCaseIndexer = 1;
-    public int Id { get; } = _testCaseIndexer++;
+    public int Id { get; } = id ?? Interlocked.Increment(ref _testCaseIndexer) - 1;
 
     public IDisposable? TreeScope { get; set; }
+    public IDisposable? TracingScope { get; set; }
 
     public TestCase TestCase { get; } = testCase;
     public string? RequestsFileContent;
 
+    public TestCasePlan? Plan { get; init; }
+    public DataRow? DataRow { get; init; }
+
     private readonly Dictionary<string, ScriptExecutionContext> _preRequestScripts = [];
     private readonly Dictionary<string, ScriptExecutionContext> _postResponseScripts = [];
     public IReadOnlyDictionary<string, ScriptExecutionContext> PreRequestScripts => _preRequestScripts;
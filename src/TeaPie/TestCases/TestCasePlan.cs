@@ -0,0 +1,22 @@
+﻿using Microsoft.CodeAnalysis.Scripting;
+using System.Diagnostics.CodeAnalysis;
+
+namespace TeaPie.TestCases;
+
+/// <summary>
+/// Parts of the test case, which are prepared only once and then reused by each of its executions (e.g. by each row
+/// of data-driven test case) - content of the requests file and compiled scripts.
+/// </summary>
+/// <param name="requestsFileContent">Content of the requests file.</param>
+internal class TestCasePlan(string requestsFileContent)
+{
+    private readonly Dictionary<string, ScriptRunner<object>> _compiledScripts = [];
+
+    public string RequestsFileContent { get; } = requestsFileContent;
+
+    public void AddCompiledScript(string path, ScriptRunner<object> compiledScript)
+        => _compiledScripts[path] = compiledScript;
+
+    public bool TryGetCompiledScript(string path, [NotNullWhen(true)] out ScriptRunner<object>? compiledScript)
+        => _compiledScripts.TryGetValue(path, out compiledScript);
+}
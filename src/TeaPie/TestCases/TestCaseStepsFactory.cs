@@ -1,6 +1,7 @@
 ﻿using Microsoft.Extensions.DependencyInjection;
 using TeaPie.Http;
 using TeaPie.Pipelines;
+using TeaPie.StructureExploration;
 
 namespace TeaPie.TestCases;
 
@@ -11,11 +12,28 @@ internal static class TestCaseStepsFactory
       TestCaseExecutionContext testCaseExecutionContext)
         => CreateStepsForRequest(serviceProvider, testCaseExecutionContext, CreateStepsForRequestsWithinTestCase);
 
+    /// <summary>
+    /// Creates steps for the execution of given test case. Test case with data source is executed once for each
+    /// row of the data source, any other test case just once.
+    /// </summary>
+    public static IPipelineStep[] CreateStepsForTestCase(IServiceProvider serviceProvider, TestCase testCase)
+    {
+        var testCaseExecutionContext = new TestCaseExecutionContext(testCase);
+        return testCase.DataSource is null
+            ? CreateStepsForTestsCase(serviceProvider, testCaseExecutionContext)
+            : CreateStepsForDataDrivenTestCase(serviceProvider, testCaseExecutionContext);
+    }
+
     public static IPipelineStep[] CreateStepsForTestsCase(
       IServiceProvider serviceProvider,
       TestCaseExecutionContext testCaseExecutionContext)
         => CreateStepsForRequest(serviceProvider, testCaseExecutionContext, CreateStepsForTestsCase);
 
+    public static IPipelineStep[] CreateStepsForDataDrivenTestCase(
+      IServiceProvider serviceProvider,
+      TestCaseExecutionContext testCaseExecutionContext)
+        => CreateStepsForRequest(serviceProvider, testCaseExecutionContext, CreateStepsForDataDrivenTestCase);
+
     private static IPipelineStep[] CreateStepsForRequest(
         IServiceProvider serviceProvider,
         TestCaseExecutionContext testCaseExecutionContext,
@@ -37,4 +55,7 @@ internal static class TestCaseStepsFactory
     private static IPipelineStep[] CreateStepsForTestsCase(IServiceProvider provider)
         => [provider.GetStep<InitializeTestCaseStep>(),
             provider.GetStep<FinishTestCaseStep>()];
+
+    private static IPipelineStep[] CreateStepsForDataDrivenTestCase(IServiceProvider provider)
+        => [provider.GetStep<RunDataDrivenTestCaseStep>()];
 }
@@ -6,5 +6,6 @@ internal static class TpConstants
     public const string InitMarker = "--- INIT";
     public const string HttpMarker = "--- HTTP";
     public const string TestMarker = "--- TEST";
+    public const string DataMarker = "--- DATA";
     public const string EndMarker = "--- END";
 }
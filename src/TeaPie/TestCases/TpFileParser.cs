@@ -73,6 +73,7 @@ internal class TpFileParser
         string? initContent = null;
         string? httpContent = null;
         string? testContent = null;
+        string? dataSourcePath = null;
 
         var i = startIndex;
         while (i < lines.Length)
@@ -105,6 +106,11 @@ internal class TpFileParser
                 i++;
                 (testContent, i) = ExtractSectionContent(lines, i);
             }
+            else if (IsDataMarker(line))
+            {
+                dataSourcePath = ExtractDataSourcePath(line, name);
+                i++;
+            }
             else
             {
                 i++;
@@ -117,7 +123,7 @@ internal class TpFileParser
                 $"Test case '{name}' in .tp file is missing the required '{TpConstants.HttpMarker}' section.");
         }
 
-        return (new TpTestCaseDefinition(name, initContent, httpContent, testContent), i);
+        return (new TpTestCaseDefinition(name, initContent, httpContent, testContent, dataSourcePath), i);
     }
 
     private static (string Content, int NextIndex) ExtractSectionContent(string[] lines, int startIndex)
@@ -154,7 +160,8 @@ internal class TpFileParser
             || IsMarker(line, TpConstants.InitMarker)
             || IsMarker(line, TpConstants.HttpMarker)
             || IsMarker(line, TpConstants.TestMarker)
-            || IsMarker(line, TpConstants.EndMarker);
+            || IsMarker(line, TpConstants.EndMarker)
+            || IsDataMarker(line);
 
     private static bool IsTestCaseMarker(string line)
     {
@@ -163,6 +170,23 @@ internal class TpFileParser
             || normalized.Equals(TpConstants.TestCaseMarker, StringComparison.OrdinalIgnoreCase);
     }
 
+    private static bool IsDataMarker(string line)
+    {
+        var normalized = NormalizeLine(line);
+        return normalized.StartsWith(TpConstants.DataMarker + " ", StringComparison.OrdinalIgnoreCase)
+            || normalized.Equals(TpConstants.DataMarker, StringComparison.OrdinalIgnoreCase);
+    }
+
+    private static string ExtractDataSourcePath(string line, string testCaseName)
+    {
+        var path = ExtractNameOrDefault(line, TpConstants.DataMarker, string.Empty);
+        return string.IsNullOrEmpty(path)
+            ? throw new InvalidOperationException(
+                $"A '{TpConstants.DataMarker}' marker of test case '{testCaseName}' is missing the path. " +
+                $"Expected format: '{TpConstants.DataMarker} <Path>'")
+            : path;
+    }
+
     private static string ExtractNameOrDefault(string line, string marker, string fallbackName)
     {
         var normalized = NormalizeLine(line);
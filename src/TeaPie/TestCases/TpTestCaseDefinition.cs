@@ -4,4 +4,5 @@ internal record TpTestCaseDefinition(
     string Name,
     string? InitContent,
     string HttpContent,
-    string? TestContent);
+    string? TestContent,
+    string? DataSourcePath = null);
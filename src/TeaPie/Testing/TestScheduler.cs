@@ -1,4 +1,6 @@
-﻿namespace TeaPie.Testing;
+﻿using TeaPie.Pipelines;
+
+namespace TeaPie.Testing;
 
 internal interface ITestScheduler
 {
@@ -11,11 +13,11 @@ internal interface ITestScheduler
 
 internal class TestScheduler : ITestScheduler
 {
-    private readonly Queue<Test> _tests = [];
+    private readonly BranchLocal<Queue<Test>> _tests = new(() => []);
 
-    public void Schedule(Test test) => _tests.Enqueue(test);
+    public void Schedule(Test test) => _tests.Value.Enqueue(test);
 
-    public bool HasScheduledTest() => _tests.Count != 0;
+    public bool HasScheduledTest() => _tests.Value.Count != 0;
 
-    public Test Dequeue() => _tests.Dequeue();
+    public Test Dequeue() => _tests.Value.Dequeue();
 }
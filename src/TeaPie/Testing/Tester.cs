@@ -18,33 +18,31 @@ internal partial class Tester(
     ITestResultsSummaryReporter resultsSummaryReporter,
     ILogger<Tester> logger) : ITester
 {
-    private readonly Stopwatch _stopWatch = new();
-
     public async Task<Test> ExecuteOrSkipTest(Test test, TestCase? testCase)
     {
-        _stopWatch.Restart();
+        var stopWatch = Stopwatch.StartNew();
 
         if (test.SkipTest)
         {
-            LogTestSkip(logger, test.Name, _stopWatch.ElapsedMilliseconds.ToHumanReadableTime());
+            LogTestSkip(logger, test.Name, stopWatch.ElapsedMilliseconds.ToHumanReadableTime());
             resultsSummaryReporter.RegisterTestResult(testCase?.Name ?? string.Empty, test.Result);
             return test;
         }
 
         if (test.Result is not TestResult.NotRun)
         {
-            LogTestAlreadyExecuted(logger, test.Name, _stopWatch.ElapsedMilliseconds.ToHumanReadableTime());
+            LogTestAlreadyExecuted(logger, test.Name, stopWatch.ElapsedMilliseconds.ToHumanReadableTime());
             resultsSummaryReporter.RegisterTestResult(testCase?.Name ?? string.Empty, test.Result);
             return test;
         }
 
         try
         {
-            return await ExecuteTestInternal(test, test.Function, testCase);
+            return await ExecuteTestInternal(test, test.Function, testCase, stopWatch);
         }
         catch (Exception ex)
         {
-            return HandleTestFailure(test, ex, testCase);
+            return HandleTestFailure(test, ex, testCase, stopWatch);
         }
     }
 
@@ -56,24 +54,24 @@ internal partial class Tester(
 
         var previousResponse = testCaseExecutionContext.Response;
         testCaseExecutionContext.RegisterResponse(response);
-        _stopWatch.Restart();
+        var stopWatch = Stopwatch.StartNew();
 
         try
         {
             test.Function().GetAwaiter().GetResult();
-            _stopWatch.Stop();
+            stopWatch.Stop();
 
-            var result = CreatePassedResult(test, testCase: testCaseExecutionContext.TestCase);
+            var result = CreatePassedResult(test, testCaseExecutionContext.TestCase, stopWatch);
             testCaseExecutionContext.UpdateTest(test with { Result = result });
 
-            LogTestPassedDuringRetry(logger, testName, _stopWatch.ElapsedMilliseconds.ToHumanReadableTime());
+            LogTestPassedDuringRetry(logger, testName, stopWatch.ElapsedMilliseconds.ToHumanReadableTime());
             return true;
         }
         catch (Exception ex)
         {
-            _stopWatch.Stop();
+            stopWatch.Stop();
 
-            var result = CreateFailedResult(test, ex, testCase: testCaseExecutionContext.TestCase);
+            var result = CreateFailedResult(test, ex, testCaseExecutionContext.TestCase, stopWatch);
             testCaseExecutionContext.UpdateTest(test with { Result = result });
 
             LogTestFailedDuringRetry(logger, testName, ex.Message);
@@ -88,15 +86,15 @@ internal partial class Tester(
         }
     }
 
-    private Test HandleTestFailure(Test test, Exception ex, TestCase? testCase)
+    private Test HandleTestFailure(Test test, Exception ex, TestCase? testCase, Stopwatch stopWatch)
     {
-        _stopWatch.Stop();
+        stopWatch.Stop();
 
-        var result = CreateFailedResult(test, ex, testCase);
+        var result = CreateFailedResult(test, ex, testCase, stopWatch);
         var updatedTest = test with { Result = result };
 
         resultsSummaryReporter.RegisterTestResult(testCase?.Name ?? string.Empty, result);
-        LogTestFailure(test.Name, ex.Message, _stopWatch.ElapsedMilliseconds);
+        LogTestFailure(test.Name, ex.Message, stopWatch.ElapsedMilliseconds);
 
         return updatedTest;
     }
@@ -107,30 +105,31 @@ internal partial class Tester(
         LogTestFailureReason(logger, message);
     }
 
-    private async Task<Test> ExecuteTestInternal(Test test, Func<Task> testFunction, TestCase? testCase)
+    private async Task<Test> ExecuteTestInternal(
+        Test test, Func<Task> testFunction, TestCase? testCase, Stopwatch stopWatch)
     {
-        _stopWatch.Start();
         await testFunction();
-        _stopWatch.Stop();
+        stopWatch.Stop();
 
-        var result = CreatePassedResult(test, testCase);
+        var result = CreatePassedResult(test, testCase, stopWatch);
         var updatedTest = test with { Result = result };
 
         resultsSummaryReporter.RegisterTestResult(testCase?.Name ?? string.Empty, result);
-        LogTestSuccess(logger, test.Name, _stopWatch.ElapsedMilliseconds.ToHumanReadableTime());
+        LogTestSuccess(logger, test.Name, stopWatch.ElapsedMilliseconds.ToHumanReadableTime());
 
         return updatedTest;
     }
 
-    private TestResult.Passed CreatePassedResult(Test test, TestCase? testCase) =>
-        new(_stopWatch.ElapsedMilliseconds)
+    private static TestResult.Passed CreatePassedResult(Test test, TestCase? testCase, Stopwatch stopWatch) =>
+        new(stopWatch.ElapsedMilliseconds)
         {
             TestName = test.Name,
             TestCasePath = testCase?.RequestsFile.RelativePath ?? string.Empty
         };
 
-    private TestResult.Failed CreateFailedResult(Test test, Exception ex, TestCase? testCase) =>
-        new(_stopWatch.ElapsedMilliseconds, ex.Message, ex)
+    private static TestResult.Failed CreateFailedResult(
+        Test test, Exception ex, TestCase? testCase, Stopwatch stopWatch) =>
+        new(stopWatch.ElapsedMilliseconds, ex.Message, ex)
         {
             TestName = test.Name,
             TestCasePath = testCase?.RequestsFile.RelativePath ?? string.Empty
@@ -0,0 +1,66 @@
+﻿using System.Diagnostics;
+
+namespace TeaPie.Tracing;
+
+internal interface IActivityRecorder : IDisposable
+{
+    /// <summary>
+    /// Starts recording of all spans created by TeaPie (and by networking stack of the runtime, if it provides them).
+    /// </summary>
+    void Start();
+
+    /// <summary>
+    /// Gets all recorded spans in the order, in which they were started. Spans which are still running are included.
+    /// </summary>
+    IReadOnlyList<Activity> GetActivities();
+}
+
+internal class ActivityRecorder : IActivityRecorder
+{
+    // Since .NET 9, DNS resolution, connection establishment and TLS handshake are traced by these sources.
+    private const string NetworkingSourcesPrefix = "Experimental.System.Net.";
+
+    private readonly object _lock = new();
+    private readonly List<Activity> _activities = [];
+    private ActivityListener? _listener;
+
+    public void Start()
+    {
+        if (_listener is not null)
+        {
+            return;
+        }
+
+        _listener = new ActivityListener()
+        {
+            ShouldListenTo = source => source.Name.Equals(TeaPieTelemetry.Name)
+                || source.Name.StartsWith(NetworkingSourcesPrefix, StringComparison.Ordinal),
+            Sample = (ref ActivityCreationOptions<ActivityContext> _) => ActivitySamplingResult.AllDataAndRecorded,
+            ActivityStarted = Add
+        };
+
+        ActivitySource.AddActivityListener(_listener);
+    }
+
+    public IReadOnlyList<Activity> GetActivities()
+    {
+        lock (_lock)
+        {
+            return [.. _activities];
+        }
+    }
+
+    private void Add(Activity activity)
+    {
+        lock (_lock)
+        {
+            _activities.Add(activity);
+        }
+    }
+
+    public void Dispose()
+    {
+        _listener?.Dispose();
+        _listener = null;
+    }
+}
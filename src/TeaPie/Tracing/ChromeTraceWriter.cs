@@ -0,0 +1,176 @@
+﻿using System.Diagnostics;
+using System.Globalization;
+using System.Text.Json;
+
+namespace TeaPie.Tracing;
+
+/// <summary>
+/// Writes spans in Chrome trace event format, which can be opened in 'chrome://tracing', Perfetto or speedscope.
+/// Every test case gets its own lane (thread), so test cases executed in parallel don't overlap. Lanes are reused by
+/// the following test cases, once they are free.
+/// </summary>
+internal class ChromeTraceWriter(string traceFilePath)
+{
+    private const int ProcessId = 1;
+    private const int MainLane = 0;
+    private const string TestCaseScope = "Test case";
+
+    private readonly string _traceFilePath = traceFilePath;
+
+    public async Task Write(IReadOnlyList<Activity> activities)
+    {
+        var directory = Path.GetDirectoryName(_traceFilePath);
+        if (!string.IsNullOrEmpty(directory))
+        {
+            Directory.CreateDirectory(directory);
+        }
+
+        await using var stream = new FileStream(_traceFilePath, FileMode.Create, FileAccess.Write);
+        await Write(stream, activities);
+    }
+
+    public static async Task Write(Stream stream, IReadOnlyList<Activity> activities)
+    {
+        await using var writer = new Utf8JsonWriter(stream);
+        var now = DateTime.UtcNow;
+        var ordered = activities
+            .OrderBy(a => a.StartTimeUtc)
+            .ThenByDescending(a => GetDuration(a, now))
+            .ThenByDescending(a => a.GetTagItem(TeaPieTelemetry.ScopeTagName) is not null)
+            .ToList();
+        var origin = ordered.Count > 0 ? ordered[0].StartTimeUtc : now;
+
+        writer.WriteStartObject();
+        writer.WriteString("displayTimeUnit", "ms");
+        writer.WriteStartArray("traceEvents");
+
+        var lanes = new LanesAssigner();
+        foreach (var activity in ordered)
+        {
+            WriteEvent(writer, activity, lanes.Assign(activity, GetEnd(activity, now)), origin, now);
+        }
+
+        WriteMetadata(writer, lanes.NumberOfLanes);
+
+        writer.WriteEndArray();
+        writer.WriteEndObject();
+        await writer.FlushAsync();
+    }
+
+    private static void WriteEvent(Utf8JsonWriter writer, Activity activity, int lane, DateTime origin, DateTime now)
+    {
+        writer.WriteStartObject();
+        writer.WriteString("name", activity.DisplayName);
+        writer.WriteString("cat", GetCategory(activity));
+        writer.WriteString("ph", "X");
+        writer.WriteNumber("ts", Math.Round((activity.StartTimeUtc - origin).TotalMicroseconds, 3));
+        writer.WriteNumber("dur", Math.Round(GetDuration(activity, now).TotalMicroseconds, 3));
+        writer.WriteNumber("pid", ProcessId);
+        writer.WriteNumber("tid", lane);
+
+        writer.WriteStartObject("args");
+        foreach (var tag in activity.TagObjects)
+        {
+            writer.WriteString(tag.Key, Convert.ToString(tag.Value, CultureInfo.InvariantCulture));
+        }
+
+        if (activity.Status == ActivityStatusCode.Error)
+        {
+            writer.WriteString("error", activity.StatusDescription);
+        }
+
+        writer.WriteEndObject();
+        writer.WriteEndObject();
+    }
+
+    private static void WriteMetadata(Utf8JsonWriter writer, int numberOfLanes)
+    {
+        WriteMetadataEvent(writer, "process_name", MainLane, "TeaPie");
+
+        for (var lane = 0; lane < numberOfLanes; lane++)
+        {
+            WriteMetadataEvent(writer, "thread_name", lane, lane == MainLane ? "Pipeline" : $"Test cases #{lane}");
+        }
+    }
+
+    private static void WriteMetadataEvent(Utf8JsonWriter writer, string name, int lane, string value)
+    {
+        writer.WriteStartObject();
+        writer.WriteString("name", name);
+        writer.WriteString("ph", "M");
+        writer.WriteNumber("pid", ProcessId);
+        writer.WriteNumber("tid", lane);
+        writer.WriteStartObject("args");
+        writer.WriteString("name", value);
+        writer.WriteEndObject();
+        writer.WriteEndObject();
+    }
+
+    private static string GetCategory(Activity activity)
+    {
+        if (activity.GetTagItem(TeaPieTelemetry.ScopeTagName) is not null)
+        {
+            return "scope";
+        }
+
+        if (activity.GetTagItem(TeaPieTelemetry.StepTagName) is not null)
+        {
+            return "step";
+        }
+
+        return activity.Source.Name.Equals(TeaPieTelemetry.Name) ? "http" : "network";
+    }
+
+    private static TimeSpan GetDuration(Activity activity, DateTime now)
+        => activity.Duration > TimeSpan.Zero ? activity.Duration : now - activity.StartTimeUtc;
+
+    private static DateTime GetEnd(Activity activity, DateTime now)
+        => activity.StartTimeUtc + GetDuration(activity, now);
+
+    private sealed class LanesAssigner
+    {
+        private readonly Dictionary<ActivitySpanId, int> _lanesOfSpans = [];
+        private readonly Dictionary<(ActivitySpanId Parent, DateTime Start), int> _lanesOfScopes = [];
+        private readonly List<DateTime> _lanesBusyUntil = [DateTime.MaxValue];
+
+        public int NumberOfLanes => _lanesBusyUntil.Count;
+
+        public int Assign(Activity activity, DateTime end)
+        {
+            var lane = activity.GetTagItem(TeaPieTelemetry.ScopeTagName) is TestCaseScope
+                ? AssignFreeLane(activity, end)
+                : ResolveLane(activity);
+
+            _lanesOfSpans[activity.SpanId] = lane;
+            return lane;
+        }
+
+        private int AssignFreeLane(Activity activity, DateTime end)
+        {
+            var lane = _lanesBusyUntil.FindIndex(1, busyUntil => busyUntil <= activity.StartTimeUtc);
+            if (lane < 0)
+            {
+                lane = _lanesBusyUntil.Count;
+                _lanesBusyUntil.Add(end);
+            }
+            else
+            {
+                _lanesBusyUntil[lane] = end;
+            }
+
+            // Step, which opened the scope, started at the same time and belongs to the scope's lane.
+            _lanesOfScopes[(activity.ParentSpanId, activity.StartTimeUtc)] = lane;
+            return lane;
+        }
+
+        private int ResolveLane(Activity activity)
+        {
+            if (_lanesOfScopes.TryGetValue((activity.ParentSpanId, activity.StartTimeUtc), out var lane))
+            {
+                return lane;
+            }
+
+            return _lanesOfSpans.TryGetValue(activity.ParentSpanId, out lane) ? lane : MainLane;
+        }
+    }
+}
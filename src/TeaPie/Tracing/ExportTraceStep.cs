@@ -0,0 +1,20 @@
+﻿using Microsoft.Extensions.Logging;
+using TeaPie.Pipelines;
+
+namespace TeaPie.Tracing;
+
+internal class ExportTraceStep(IActivityRecorder activityRecorder) : IPipelineStep
+{
+    private readonly IActivityRecorder _activityRecorder = activityRecorder;
+
+    public bool ShouldExecute(ApplicationContext context) => !string.IsNullOrEmpty(context.TraceFilePath);
+
+    public async Task Execute(ApplicationContext context, CancellationToken cancellationToken = default)
+    {
+        var activities = _activityRecorder.GetActivities();
+        await new ChromeTraceWriter(context.TraceFilePath).Write(activities);
+
+        context.Logger.LogInformation("Trace with {Count} spans was exported to '{Path}'.",
+            activities.Count, context.TraceFilePath);
+    }
+}
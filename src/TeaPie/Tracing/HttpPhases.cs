@@ -0,0 +1,9 @@
+﻿namespace TeaPie.Tracing;
+
+internal static class HttpPhases
+{
+    public const string Total = "HTTP request";
+    public const string Authentication = "Authentication";
+    public const string WaitingForResponse = "Waiting for response";
+    public const string ReadingResponseBody = "Reading response body";
+}
@@ -0,0 +1,55 @@
+﻿using System.Diagnostics;
+using TeaPie.Http;
+
+namespace TeaPie.Tracing;
+
+/// <summary>
+/// Wraps whole HTTP request (including authentication and reading of the response body) into a span, under which
+/// the spans of particular phases are nested. It should be the outermost handler.
+/// </summary>
+internal class HttpTracingHandler : DelegatingHandler
+{
+    private static readonly HttpRequestOptionsKey<RequestExecutionContext> _contextKey = new("__TeaPie_Context__");
+
+    protected override async Task<HttpResponseMessage> SendAsync(
+        HttpRequestMessage request, CancellationToken cancellationToken)
+    {
+        var startTimestamp = Stopwatch.GetTimestamp();
+        using var activity = TeaPieTelemetry.ActivitySource.StartActivity($"HTTP {request.Method.Method}");
+        SetRequestTags(activity, request);
+
+        try
+        {
+            var response = await base.SendAsync(request, cancellationToken);
+            activity?.SetTag("http.response.status_code", (int)response.StatusCode);
+            return response;
+        }
+        catch (Exception ex)
+        {
+            activity?.SetStatus(ActivityStatusCode.Error, ex.Message);
+            throw;
+        }
+        finally
+        {
+            TeaPieTelemetry.RecordHttpPhase(HttpPhases.Total, Stopwatch.GetElapsedTime(startTimestamp));
+        }
+    }
+
+    private static void SetRequestTags(Activity? activity, HttpRequestMessage request)
+    {
+        if (activity is null)
+        {
+            return;
+        }
+
+        activity.SetTag(TeaPieTelemetry.HttpPhaseTagName, HttpPhases.Total);
+        activity.SetTag("http.request.method", request.Method.Method);
+        activity.SetTag("url.full", request.RequestUri?.ToString());
+
+        if (request.Options.TryGetValue(_contextKey, out var requestContext))
+        {
+            activity.SetTag("teapie.request.name", requestContext.Name);
+            activity.SetTag("teapie.request.file", requestContext.RequestFile.RelativePath);
+        }
+    }
+}
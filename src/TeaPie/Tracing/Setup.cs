@@ -0,0 +1,15 @@
+﻿using Microsoft.Extensions.DependencyInjection;
+
+namespace TeaPie.Tracing;
+
+internal static class Setup
+{
+    public static IServiceCollection AddTracing(this IServiceCollection services)
+    {
+        services.AddSingleton<IStepsTracer, StepsTracer>();
+        services.AddSingleton<IActivityRecorder, ActivityRecorder>();
+        services.AddTransient<HttpTracingHandler>();
+
+        return services;
+    }
+}
@@ -0,0 +1,10 @@
+﻿namespace TeaPie.Tracing;
+
+/// <summary>
+/// Aggregated timings of all executions of the same pipeline step. Times are exclusive - time spent by steps
+/// executed within the step (e.g. test cases executed in parallel) is not included.
+/// </summary>
+internal record StepTimings(string StepName, int NumberOfExecutions, double TotalMs, double MaxMs)
+{
+    public double MeanMs => NumberOfExecutions > 0 ? TotalMs / NumberOfExecutions : 0.0;
+}
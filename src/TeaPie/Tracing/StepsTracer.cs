@@ -0,0 +1,204 @@
+﻿using System.Collections.Concurrent;
+using System.Diagnostics;
+using TeaPie.Pipelines;
+
+namespace TeaPie.Tracing;
+
+internal interface IStepsTracer
+{
+    /// <summary>
+    /// Executes the <paramref name="step"/> within its own span, which is nested in the innermost open scope, and
+    /// measures its duration.
+    /// </summary>
+    Task Trace(IPipelineStep step, Func<Task> execution);
+
+    /// <summary>
+    /// Opens scope (e.g. test case or request), under which all following steps of the current pipeline branch are
+    /// grouped, until the scope is disposed. If the scope is opened (or disposed) by a step, the scope covers that
+    /// whole step.
+    /// </summary>
+    /// <param name="kind">Kind of the scope, e.g. 'Test case'.</param>
+    /// <param name="name">Name of the scoped object.</param>
+    IDisposable BeginScope(string kind, string name);
+
+    IReadOnlyList<StepTimings> GetSlowestSteps(int count);
+}
+
+internal class StepsTracer : IStepsTracer
+{
+    private static readonly AsyncLocal<StepFrame?> _currentFrame = new();
+
+    private readonly BranchLocal<List<TracingScope>> _scopes = new(() => []);
+    private readonly ConcurrentDictionary<string, StepTimingsAccumulator> _timings = new();
+
+    public async Task Trace(IPipelineStep step, Func<Task> execution)
+    {
+        var stepName = step.GetType().Name;
+        var parentFrame = _currentFrame.Value;
+        var parentContext = GetInnermostScope()?.Activity?.Context ?? Activity.Current?.Context ?? default;
+
+        var startTimestamp = Stopwatch.GetTimestamp();
+        var activity = TeaPieTelemetry.ActivitySource.StartActivity(stepName, ActivityKind.Internal, parentContext);
+        activity?.SetTag(TeaPieTelemetry.StepTagName, stepName);
+
+        var frame = new StepFrame(activity?.StartTimeUtc ?? DateTime.UtcNow, parentContext);
+        _currentFrame.Value = frame;
+
+        try
+        {
+            await execution();
+        }
+        finally
+        {
+            var elapsed = Stopwatch.GetElapsedTime(startTimestamp);
+            activity?.Dispose();
+            frame.StopPendingScopes();
+
+            parentFrame?.AddNestedStepsTime(elapsed);
+            Record(stepName, elapsed, frame.NestedStepsTime);
+        }
+    }
+
+    public IDisposable BeginScope(string kind, string name)
+    {
+        var frame = _currentFrame.Value;
+        var parentContext = GetInnermostScope()?.Activity?.Context ?? frame?.ParentContext ?? default;
+
+        // Scope mustn't become child of the step, within which it is opened.
+        var previousActivity = Activity.Current;
+        Activity.Current = null;
+        var activity = TeaPieTelemetry.ActivitySource.StartActivity(
+            kind,
+            ActivityKind.Internal,
+            parentContext,
+            [new(TeaPieTelemetry.ScopeTagName, kind)],
+            startTime: frame?.StartTime ?? default);
+        Activity.Current = previousActivity;
+
+        if (activity is not null)
+        {
+            activity.DisplayName = $"{kind}: {name}";
+        }
+
+        var scope = new TracingScope(this, _scopes.Value, activity);
+        _scopes.Value.Add(scope);
+        return scope;
+    }
+
+    public IReadOnlyList<StepTimings> GetSlowestSteps(int count)
+        => [.. _timings
+            .Select(t => t.Value.ToTimings(t.Key))
+            .OrderByDescending(t => t.TotalMs)
+            .Take(count)];
+
+    private TracingScope? GetInnermostScope()
+    {
+        var scopes = _scopes.Value;
+        return scopes.Count > 0 ? scopes[^1] : null;
+    }
+
+    private void EndScope(List<TracingScope> scopes, TracingScope scope)
+    {
+        var index = scopes.LastIndexOf(scope);
+        if (index < 0)
+        {
+            return;
+        }
+
+        // Scopes opened within the ending scope and not closed yet (e.g. due to failure) are closed as well.
+        for (var i = scopes.Count - 1; i >= index; i--)
+        {
+            StopScope(scopes[i]);
+            scopes.RemoveAt(i);
+        }
+    }
+
+    private static void StopScope(TracingScope scope)
+    {
+        if (_currentFrame.Value is { } frame)
+        {
+            frame.AddPendingScope(scope);
+        }
+        else
+        {
+            Stop(scope.Activity);
+        }
+    }
+
+    private static void Stop(Activity? activity)
+    {
+        var previousActivity = Activity.Current;
+        activity?.Stop();
+        Activity.Current = previousActivity;
+    }
+
+    private void Record(string stepName, TimeSpan elapsed, TimeSpan nestedStepsTime)
+    {
+        TeaPieTelemetry.StepDuration.Record(
+            elapsed.TotalMilliseconds, new KeyValuePair<string, object?>("step", stepName));
+
+        var exclusiveTime = elapsed > nestedStepsTime ? elapsed - nestedStepsTime : TimeSpan.Zero;
+        _timings.GetOrAdd(stepName, _ => new StepTimingsAccumulator()).Add(exclusiveTime);
+    }
+
+    private sealed class TracingScope(StepsTracer tracer, List<TracingScope> scopes, Activity? activity) : IDisposable
+    {
+        public Activity? Activity { get; } = activity;
+
+        public void Dispose() => tracer.EndScope(scopes, this);
+    }
+
+    /// <summary>
+    /// Step which is currently executed within the asynchronous control flow. Scopes, which are closed during the
+    /// step, are stopped only after the step, so that they enclose it.
+    /// </summary>
+    private sealed class StepFrame(DateTimeOffset startTime, ActivityContext parentContext)
+    {
+        private readonly List<TracingScope> _pendingScopes = [];
+        private long _nestedStepsTicks;
+
+        public DateTimeOffset StartTime { get; } = startTime;
+        public ActivityContext ParentContext { get; } = parentContext;
+        public TimeSpan NestedStepsTime => TimeSpan.FromTicks(Interlocked.Read(ref _nestedStepsTicks));
+
+        public void AddNestedStepsTime(TimeSpan elapsed) => Interlocked.Add(ref _nestedStepsTicks, elapsed.Ticks);
+
+        public void AddPendingScope(TracingScope scope) => _pendingScopes.Add(scope);
+
+        public void StopPendingScopes()
+        {
+            foreach (var scope in _pendingScopes)
+            {
+                Stop(scope.Activity);
+            }
+
+            _pendingScopes.Clear();
+        }
+    }
+
+    private sealed class StepTimingsAccumulator
+    {
+        private readonly object _lock = new();
+        private int _count;
+        private double _totalMs;
+        private double _maxMs;
+
+        public void Add(TimeSpan elapsed)
+        {
+            lock (_lock)
+            {
+                _count++;
+                _totalMs += elapsed.TotalMilliseconds;
+                _maxMs = Math.Max(_maxMs, elapsed.TotalMilliseconds);
+            }
+        }
+
+        public StepTimings ToTimings(string stepName)
+        {
+            lock (_lock)
+            {
+                return new StepTimings(stepName, _count, _totalMs, _maxMs);
+            }
+        }
+    }
+}
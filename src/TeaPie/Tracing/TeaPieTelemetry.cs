@@ -0,0 +1,54 @@
+﻿using System.Diagnostics;
+using System.Diagnostics.Metrics;
+
+namespace TeaPie.Tracing;
+
+/// <summary>
+/// Source of all spans and metrics emitted by TeaPie. Spans are created only if somebody listens to the
+/// <see cref="Name"/> source (e.g. trace file exporter, OpenTelemetry or <c>dotnet-trace</c>).
+/// </summary>
+internal static class TeaPieTelemetry
+{
+    public const string Name = "TeaPie";
+
+    public const string ScopeTagName = "teapie.scope";
+    public const string StepTagName = "teapie.step";
+    public const string HttpPhaseTagName = "teapie.http.phase";
+
+    public static readonly ActivitySource ActivitySource =
+        new(Name, typeof(TeaPieTelemetry).Assembly.GetName().Version?.ToString());
+
+    public static readonly Meter Meter = new(Name, typeof(TeaPieTelemetry).Assembly.GetName().Version?.ToString());
+
+    public static readonly Histogram<double> StepDuration = Meter.CreateHistogram<double>(
+        "teapie.pipeline.step.duration", "ms", "Duration of a single pipeline step.");
+
+    public static readonly Histogram<double> HttpPhaseDuration = Meter.CreateHistogram<double>(
+        "teapie.http.phase.duration", "ms", "Duration of a single phase of an HTTP request.");
+
+    public static async Task<TResult> TraceHttpPhase<TResult>(string phase, Func<Task<TResult>> action)
+    {
+        var startTimestamp = Stopwatch.GetTimestamp();
+        using var activity = ActivitySource.StartActivity(phase);
+        activity?.SetTag(HttpPhaseTagName, phase);
+
+        try
+        {
+            return await action();
+        }
+        finally
+        {
+            RecordHttpPhase(phase, Stopwatch.GetElapsedTime(startTimestamp));
+        }
+    }
+
+    public static async Task TraceHttpPhase(string phase, Func<Task> action)
+        => await TraceHttpPhase(phase, async () =>
+        {
+            await action();
+            return true;
+        });
+
+    public static void RecordHttpPhase(string phase, TimeSpan duration)
+        => HttpPhaseDuration.Record(duration.TotalMilliseconds, new KeyValuePair<string, object?>("phase", phase));
+}
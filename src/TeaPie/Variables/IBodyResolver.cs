@@ -1,8 +1,10 @@
-﻿namespace TeaPie.Variables;
+﻿using TeaPie.Http.Bodies;
+
+namespace TeaPie.Variables;
 
 internal interface IBodyResolver
 {
     bool CanResolve(string mediaType);
 
-    string Resolve(string body, string query, string defaultValue = "");
+    string Resolve(BufferedContent body, string query, string defaultValue = "");
 }
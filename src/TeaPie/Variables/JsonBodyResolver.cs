@@ -1,4 +1,6 @@
-﻿using Newtonsoft.Json.Linq;
+﻿using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
+using TeaPie.Http.Bodies;
 
 namespace TeaPie.Variables;
 
@@ -6,9 +8,9 @@ internal class JsonBodyResolver : IBodyResolver
 {
     public bool CanResolve(string mediaType) => mediaType.Equals("application/json", StringComparison.OrdinalIgnoreCase);
 
-    public string Resolve(string body, string query, string defaultValue = "")
+    public string Resolve(BufferedContent body, string query, string defaultValue = "")
     {
-        var json = JObject.Parse(body);
+        var json = body.GetParsed(Parse);
         var token = json.SelectToken(query);
 
         if (token is null)
@@ -18,4 +20,10 @@ internal class JsonBodyResolver : IBodyResolver
 
         return token.ToString();
     }
+
+    private static JObject Parse(Stream stream)
+    {
+        using var reader = new JsonTextReader(new StreamReader(stream));
+        return JObject.Load(reader);
+    }
 }
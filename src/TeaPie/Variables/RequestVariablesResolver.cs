@@ -2,6 +2,7 @@
 using System.Diagnostics.CodeAnalysis;
 using System.Text.RegularExpressions;
 using TeaPie.Http;
+using TeaPie.Http.Bodies;
 using TeaPie.Http.Headers;
 using TeaPie.Http.Parsing;
 
@@ -27,17 +28,17 @@ internal partial class RequestVariablesResolver(RequestVariableDescription reque
 
         if (IsRequest() && TryGetHttpRequestMessage(executionContext, out var request))
         {
-            return await Resolve(request, request.Content);
+            return await Resolve(request);
         }
         else if (IsResponse() && TryGetHttpResponseMessage(executionContext, out var response))
         {
-            return await Resolve(response, response.Content);
+            return await Resolve(response);
         }
 
         return _requestVariable.ToString();
     }
 
-    private async Task<string> Resolve<TMessage>(TMessage message, HttpContent? content)
+    private async Task<string> Resolve<TMessage>(TMessage message)
         where TMessage : class
     {
         if (IsHeaders())
@@ -46,7 +47,7 @@ internal partial class RequestVariablesResolver(RequestVariableDescription reque
         }
         else if (IsBody())
         {
-            return await ResolveBody(content);
+            return ResolveBody(await BufferContent(message));
         }
 
         return _requestVariable.ToString();
@@ -67,13 +68,21 @@ internal partial class RequestVariablesResolver(RequestVariableDescription reque
         return _requestVariable.ToString();
     }
 
-    private async Task<string> ResolveBody(HttpContent? content)
+    private static async Task<BufferedContent?> BufferContent<TMessage>(TMessage message)
+        where TMessage : class
+        => message switch
+        {
+            HttpRequestMessage requestMessage => await requestMessage.BufferContent(),
+            HttpResponseMessage responseMessage => await responseMessage.BufferContent(),
+            _ => null
+        };
+
+    private string ResolveBody(BufferedContent? content)
     {
         if (content is not null)
         {
-            var body = await content.ReadAsStringAsync();
             var contentType = content.Headers.ContentType?.MediaType;
-            return ResolveBody(body, contentType);
+            return ResolveBody(content, contentType);
         }
 
         return string.Empty;
@@ -85,11 +94,11 @@ internal partial class RequestVariablesResolver(RequestVariableDescription reque
     private string ResolveHeaders(HttpResponseMessage responseMessage)
         => _headersHandler.GetHeader(_requestVariable.Query, responseMessage);
 
-    private string ResolveBody(string body, string? contentType)
+    private string ResolveBody(BufferedContent body, string? contentType)
     {
         if (_requestVariable.Query.Equals("*") || contentType is null)
         {
-            return body;
+            return body.ReadAsText();
         }
 
         foreach (var resolver in _bodyResolvers)
@@ -100,7 +109,7 @@ internal partial class RequestVariablesResolver(RequestVariableDescription reque
             }
         }
 
-        return body;
+        return body.ReadAsText();
     }
 
     private bool TryGetHttpRequestMessage(
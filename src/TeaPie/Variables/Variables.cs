@@ -1,4 +1,6 @@
-﻿namespace TeaPie.Variables;
+﻿using TeaPie.Pipelines;
+
+namespace TeaPie.Variables;
 
 internal interface IVariables : IVariablesOperations, IVariablesExposer;
 
@@ -7,7 +9,9 @@ internal class Variables : IVariables
     public VariablesCollection GlobalVariables { get; } = [];
     public VariablesCollection EnvironmentVariables { get; } = [];
     public VariablesCollection CollectionVariables { get; } = [];
-    public VariablesCollection TestCaseVariables { get; } = [];
+    public VariablesCollection TestCaseVariables => _testCaseVariables.Value;
+
+    private readonly BranchLocal<VariablesCollection> _testCaseVariables = new(() => []);
 
     private IEnumerable<VariablesCollection> GetAllVariables()
         => [TestCaseVariables, CollectionVariables, EnvironmentVariables, GlobalVariables];
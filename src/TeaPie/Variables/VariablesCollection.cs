@@ -1,4 +1,5 @@
 ﻿using System.Collections;
+using System.Collections.Concurrent;
 using System.Diagnostics;
 
 namespace TeaPie.Variables;
@@ -6,7 +7,7 @@ namespace TeaPie.Variables;
 [DebuggerDisplay("{_variables}")]
 public class VariablesCollection : IEnumerable<Variable>
 {
-    private readonly Dictionary<string, Variable> _variables = [];
+    private readonly ConcurrentDictionary<string, Variable> _variables = new();
 
     public int Count => _variables.Count;
 
@@ -41,7 +42,7 @@ public class VariablesCollection : IEnumerable<Variable>
 
     public bool Contains(string variableName) => _variables.ContainsKey(variableName);
 
-    public bool Remove(string variableName) => _variables.Remove(variableName);
+    public bool Remove(string variableName) => _variables.TryRemove(variableName, out _);
 
     /// <summary>
     /// Attempts to remove all variables with given <paramref name="tag"/>. If removal of any of them fails,
@@ -56,7 +57,7 @@ public class VariablesCollection : IEnumerable<Variable>
         var deleted = variablesToDelete.Any();
         foreach (var item in variablesToDelete)
         {
-            deleted = deleted && _variables.Remove(item.Key);
+            deleted = deleted && _variables.TryRemove(item.Key, out _);
         }
         return deleted;
     }
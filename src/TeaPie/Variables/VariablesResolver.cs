@@ -1,4 +1,5 @@
-﻿using System.Text.RegularExpressions;
+﻿using System.Text;
+using System.Text.RegularExpressions;
 using TeaPie.Http;
 using TeaPie.Http.Parsing;
 
@@ -6,7 +7,9 @@ namespace TeaPie.Variables;
 
 internal interface IVariablesResolver
 {
-    string ResolveVariablesInLine(string line, RequestExecutionContext requestExecutionContext);
+    Task<string> ResolveVariablesInLine(string line, RequestExecutionContext requestExecutionContext);
+
+    Task<string> ResolveVariable(string variableName, RequestExecutionContext requestExecutionContext);
 }
 
 internal partial class VariablesResolver(IVariables variables, IServiceProvider serviceProvider) : IVariablesResolver
@@ -14,24 +17,41 @@ internal partial class VariablesResolver(IVariables variables, IServiceProvider
     private readonly IVariables _variables = variables;
     private readonly IServiceProvider _serviceProvider = serviceProvider;
 
-    public string ResolveVariablesInLine(string line, RequestExecutionContext requestExecutionContext)
-        => VariableNotationPatternRegex().Replace(line, match =>
+    public async Task<string> ResolveVariablesInLine(string line, RequestExecutionContext requestExecutionContext)
+    {
+        var matches = VariableNotationPatternRegex().Matches(line);
+        if (matches.Count == 0)
         {
-            var variableName = match.Groups[1].Value;
+            return line;
+        }
+
+        var builder = new StringBuilder();
+        var position = 0;
+        foreach (Match match in matches)
+        {
+            builder.Append(line, position, match.Index - position);
+            builder.Append(await ResolveVariable(match.Groups[1].Value, requestExecutionContext));
+            position = match.Index + match.Length;
+        }
+
+        return builder.Append(line, position, line.Length - position).ToString();
+    }
 
-            if (RequestVariablesResolver.IsRequestVariable(variableName))
-            {
-                return ResolveRequestVariable(variableName, requestExecutionContext).Result;
-            }
+    public async Task<string> ResolveVariable(string variableName, RequestExecutionContext requestExecutionContext)
+    {
+        if (RequestVariablesResolver.IsRequestVariable(variableName))
+        {
+            return await ResolveRequestVariable(variableName, requestExecutionContext);
+        }
 
-            if (_variables.ContainsVariable(variableName))
-            {
-                var variableValue = _variables.GetVariable<object>(variableName, default);
-                return variableValue?.ToString() ?? "null";
-            }
+        if (_variables.ContainsVariable(variableName))
+        {
+            var variableValue = _variables.GetVariable<object>(variableName, default);
+            return variableValue?.ToString() ?? "null";
+        }
 
-            throw new InvalidOperationException($"Variable '{variableName}' was not found.");
-        });
+        throw new InvalidOperationException($"Variable '{variableName}' was not found.");
+    }
 
     private async Task<string> ResolveRequestVariable(string variableName, RequestExecutionContext requestExecutionContext)
     {
@@ -1,4 +1,5 @@
 ﻿using System.Xml;
+using TeaPie.Http.Bodies;
 
 namespace TeaPie.Variables;
 
@@ -8,10 +9,9 @@ internal class XmlBodyResolver : IBodyResolver
         => mediaType.Equals("application/xml", StringComparison.OrdinalIgnoreCase) ||
             mediaType.Equals("text/xml", StringComparison.OrdinalIgnoreCase);
 
-    public string Resolve(string body, string query, string defaultValue = "")
+    public string Resolve(BufferedContent body, string query, string defaultValue = "")
     {
-        var xmlDocument = new XmlDocument();
-        xmlDocument.LoadXml(body);
+        var xmlDocument = body.GetParsed(Parse);
         var navigator = xmlDocument.CreateNavigator();
         var node = navigator?.SelectSingleNode(query);
 
@@ -22,4 +22,11 @@ internal class XmlBodyResolver : IBodyResolver
 
         return node.Value;
     }
+
+    private static XmlDocument Parse(Stream stream)
+    {
+        var xmlDocument = new XmlDocument();
+        xmlDocument.Load(stream);
+        return xmlDocument;
+    }
 }
@@ -0,0 +1,131 @@
+﻿using TeaPie.StructureExploration;
+using TeaPie.StructureExploration.Paths;
+
+namespace TeaPie.Watching;
+
+/// <summary>
+/// Determines which test cases have to be executed again after files of the structure changed. Test case is affected,
+/// if its <c>.http</c> (or <c>.tp</c>) file, any of its scripts, its data source or any script (transitively)
+/// referenced by them via <c>#load</c> directive changed.
+/// </summary>
+internal class AffectedTestCasesResolver(IStructureIndex structureIndex)
+{
+    private static readonly string[] _relatedFilesSuffixes =
+        [Constants.PreRequestSuffix, Constants.PostResponseSuffix, Constants.DataSourceSuffix];
+
+    private readonly IStructureIndex _structureIndex = structureIndex;
+
+    /// <summary>
+    /// Resolves files of the test cases affected by the <paramref name="changedFiles"/>.
+    /// </summary>
+    /// <param name="structureFiles">All files of the structure.</param>
+    /// <param name="sharedFiles">Files, change of which (or of their dependencies) affects all test cases - e.g.
+    /// environment file or initialization script.</param>
+    /// <param name="changedFiles">Files, which changed.</param>
+    /// <param name="testCasesFiles">Files of the affected test cases.</param>
+    /// <returns><c>false</c> if all test cases are affected, <c>true</c> otherwise.</returns>
+    public bool TryResolve(
+        IEnumerable<string> structureFiles,
+        IEnumerable<string> sharedFiles,
+        IEnumerable<string> changedFiles,
+        out IReadOnlyCollection<string> testCasesFiles)
+    {
+        var affectedFiles = GetAffectedFiles(structureFiles, changedFiles);
+
+        if (affectedFiles.Overlaps(sharedFiles.Where(path => !string.IsNullOrEmpty(path)).Select(Path.GetFullPath)))
+        {
+            testCasesFiles = [];
+            return false;
+        }
+
+        testCasesFiles = [.. affectedFiles.SelectMany(GetTestCasesFiles).Distinct().Order()];
+        return true;
+    }
+
+    private HashSet<string> GetAffectedFiles(IEnumerable<string> structureFiles, IEnumerable<string> changedFiles)
+    {
+        var dependents = GetDependents(structureFiles);
+        var affectedFiles = new HashSet<string>(changedFiles.Select(Path.GetFullPath));
+        var queue = new Queue<string>(affectedFiles);
+
+        while (queue.TryDequeue(out var file))
+        {
+            if (dependents.TryGetValue(file, out var dependentFiles))
+            {
+                foreach (var dependentFile in dependentFiles.Where(affectedFiles.Add))
+                {
+                    queue.Enqueue(dependentFile);
+                }
+            }
+        }
+
+        return affectedFiles;
+    }
+
+    private Dictionary<string, List<string>> GetDependents(IEnumerable<string> structureFiles)
+    {
+        var dependents = new Dictionary<string, List<string>>();
+
+        foreach (var file in structureFiles.Where(CanReferenceScripts).Select(Path.GetFullPath))
+        {
+            foreach (var dependency in _structureIndex.GetDependencies(file))
+            {
+                if (!dependents.TryGetValue(dependency, out var dependentFiles))
+                {
+                    dependentFiles = [];
+                    dependents.Add(dependency, dependentFiles);
+                }
+
+                dependentFiles.Add(file);
+            }
+        }
+
+        return dependents;
+    }
+
+    private static IEnumerable<string> GetTestCasesFiles(string file)
+    {
+        if (file.EndsWith(Constants.RequestFileExtension) || file.IsTpFile())
+        {
+            // Deleted test case has nothing to be executed.
+            return new[] { file }.Where(System.IO.File.Exists);
+        }
+
+        if (file.EndsWith(Constants.ScriptFileExtension) || IsDataSource(file))
+        {
+            return GetRelatedRequestFiles(file);
+        }
+
+        return [];
+    }
+
+    /// <summary>
+    /// Gets request files of the test case, to which the script (<c>-init.csx</c> or <c>-test.csx</c>) or data source
+    /// (<c>-data.csv</c> or <c>-data.jsonl</c>) belongs.
+    /// </summary>
+    private static IEnumerable<string> GetRelatedRequestFiles(string filePath)
+    {
+        var fileName = Path.GetFileNameWithoutExtension(filePath);
+        var suffix = _relatedFilesSuffixes.FirstOrDefault(candidate => fileName.EndsWith(candidate));
+
+        if (suffix is null)
+        {
+            return [];
+        }
+
+        var testCaseName = fileName.TrimSuffix(suffix);
+        var folderPath = Path.GetDirectoryName(filePath)!;
+        return new[]
+        {
+            Path.Combine(folderPath, testCaseName + Constants.RequestSuffix + Constants.RequestFileExtension),
+            Path.Combine(folderPath, testCaseName + Constants.RequestFileExtension)
+        }.Where(System.IO.File.Exists);
+    }
+
+    private static bool IsDataSource(string file)
+        => file.EndsWith(Constants.CsvDataSourceFileExtension) ||
+            file.EndsWith(Constants.JsonLinesDataSourceFileExtension);
+
+    private static bool CanReferenceScripts(string file)
+        => file.EndsWith(Constants.ScriptFileExtension) || file.IsTpFile();
+}
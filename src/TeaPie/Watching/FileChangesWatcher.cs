@@ -0,0 +1,95 @@
+﻿namespace TeaPie.Watching;
+
+/// <summary>
+/// Watches given folders (including their sub-folders) for changes of files. Changes, which come shortly after each
+/// other (e.g. while the editor saves multiple files), are reported together.
+/// </summary>
+internal sealed class FileChangesWatcher : IDisposable
+{
+    private static readonly TimeSpan _debounceInterval = TimeSpan.FromMilliseconds(300);
+
+    private readonly List<FileSystemWatcher> _watchers;
+    private readonly SemaphoreSlim _signal = new(0);
+    private readonly object _lock = new();
+    private HashSet<string> _changedFiles = [];
+    private bool _overflowed;
+
+    public FileChangesWatcher(IEnumerable<string> folderPaths)
+    {
+        _watchers = [.. folderPaths.Select(CreateWatcher)];
+    }
+
+    /// <summary>
+    /// Waits for the first change and then until no other change comes within the debounce interval.
+    /// </summary>
+    public async Task<FileChanges> WaitForChanges(CancellationToken cancellationToken)
+    {
+        await _signal.WaitAsync(cancellationToken);
+        while (await _signal.WaitAsync(_debounceInterval, cancellationToken))
+        {
+        }
+
+        lock (_lock)
+        {
+            var changes = new FileChanges(_changedFiles, _overflowed);
+            _changedFiles = [];
+            _overflowed = false;
+
+            return changes;
+        }
+    }
+
+    private FileSystemWatcher CreateWatcher(string folderPath)
+    {
+        var watcher = new FileSystemWatcher(folderPath)
+        {
+            IncludeSubdirectories = true,
+            NotifyFilter = NotifyFilters.FileName | NotifyFilters.DirectoryName | NotifyFilters.LastWrite |
+                NotifyFilters.Size
+        };
+
+        watcher.Changed += (_, e) => OnChange(e.FullPath);
+        watcher.Created += (_, e) => OnChange(e.FullPath);
+        watcher.Deleted += (_, e) => OnChange(e.FullPath);
+        watcher.Renamed += (_, e) => OnChange(e.OldFullPath, e.FullPath);
+        watcher.Error += (_, _) => OnOverflow();
+
+        watcher.EnableRaisingEvents = true;
+        return watcher;
+    }
+
+    private void OnChange(params string[] paths)
+    {
+        lock (_lock)
+        {
+            _changedFiles.UnionWith(paths.Select(Path.GetFullPath));
+        }
+
+        _signal.Release();
+    }
+
+    private void OnOverflow()
+    {
+        lock (_lock)
+        {
+            _overflowed = true;
+        }
+
+        _signal.Release();
+    }
+
+    public void Dispose()
+    {
+        foreach (var watcher in _watchers)
+        {
+            watcher.Dispose();
+        }
+
+        _signal.Dispose();
+    }
+}
+
+/// <param name="Files">Full paths of all changed (created, modified, deleted or renamed) files.</param>
+/// <param name="Overflowed">Whether some changes were lost (e.g. too many changes at once), so any file could have
+/// changed.</param>
+internal record FileChanges(IReadOnlyCollection<string> Files, bool Overflowed);
@@ -0,0 +1,216 @@
+﻿using Microsoft.Extensions.DependencyInjection;
+using Microsoft.Extensions.Logging;
+using TeaPie.StructureExploration;
+using TeaPie.StructureExploration.Paths;
+using File = TeaPie.StructureExploration.File;
+
+namespace TeaPie.Watching;
+
+/// <summary>
+/// Executes the collection (or test case) and then keeps watching its files. After every change, only the affected
+/// test cases are executed again. Every execution uses newly built application, so it starts with clean state, while
+/// the exploration of the unchanged structure is served by the persisted structure index. Previous application is
+/// disposed before the next one is built.
+/// </summary>
+/// <param name="applicationFactory">Builds application, which executes only test cases from given files
+/// (all of them, if no file is given).</param>
+internal partial class WatchModeRunner(Func<IReadOnlyCollection<string>, Application> applicationFactory)
+{
+    private static readonly string[] _watchedExtensions =
+    [
+        Constants.RequestFileExtension,
+        Constants.TestCaseFileExtension,
+        Constants.ScriptFileExtension,
+        Constants.CsvDataSourceFileExtension,
+        Constants.JsonLinesDataSourceFileExtension
+    ];
+
+    private readonly Func<IReadOnlyCollection<string>, Application> _applicationFactory = applicationFactory;
+
+    public async Task<int> Run(CancellationToken cancellationToken = default)
+    {
+        var application = _applicationFactory([]);
+        try
+        {
+            var exitCode = await application.Run(cancellationToken);
+
+            var pathProvider = application.Context.ServiceProvider.GetRequiredService<IPathProvider>();
+            if (string.IsNullOrEmpty(pathProvider.RootPath))
+            {
+                // Run failed before the structure was resolved, so there is nothing to watch.
+                return exitCode;
+            }
+
+            var watchedFolders = GetWatchedFolders(application.Context, pathProvider);
+            var ignoredFolders = GetIgnoredFolders(pathProvider);
+
+            using var watcher = new FileChangesWatcher(watchedFolders);
+
+            try
+            {
+                while (true)
+                {
+                    var provider = application.Context.ServiceProvider;
+                    var structureIndex = provider.GetRequiredService<IStructureIndex>();
+                    var logger = provider.GetRequiredService<ILogger<WatchModeRunner>>();
+
+                    RefreshIndex(structureIndex, application.Context, watchedFolders, ignoredFolders);
+
+                    LogWaitingForChanges(logger);
+                    var changes = await watcher.WaitForChanges(cancellationToken);
+
+                    var changedFiles = changes.Files
+                        .Where(file => IsWatched(file, application.Context, ignoredFolders))
+                        .Where(structureIndex.HasContentChanged)
+                        .ToList();
+
+                    if (!changes.Overflowed && changedFiles.Count == 0)
+                    {
+                        continue;
+                    }
+
+                    var structureFiles = GetStructureFiles(structureIndex, watchedFolders, ignoredFolders);
+                    var sharedFiles = new[]
+                    {
+                        application.Context.EnvironmentFilePath,
+                        application.Context.InitializationScriptPath
+                    };
+
+                    IReadOnlyCollection<string> testCasesFiles = [];
+                    if (!changes.Overflowed &&
+                        new AffectedTestCasesResolver(structureIndex)
+                            .TryResolve(structureFiles, sharedFiles, changedFiles, out testCasesFiles))
+                    {
+                        if (testCasesFiles.Count == 0)
+                        {
+                            continue;
+                        }
+
+                        LogAffectedTestCases(logger, changedFiles.Count, testCasesFiles.Count);
+                    }
+                    else
+                    {
+                        LogAllTestCasesAffected(logger, changedFiles.Count);
+                    }
+
+                    // Previous application has to release its services (log files, activity listeners) before
+                    // the next one is built. Its index is persisted, so that the next one continues from it.
+                    structureIndex.Save();
+                    await application.DisposeAsync();
+
+                    application = _applicationFactory(testCasesFiles);
+                    exitCode = await application.Run(cancellationToken);
+                }
+            }
+            catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
+            {
+                return exitCode;
+            }
+        }
+        finally
+        {
+            await application.DisposeAsync();
+        }
+    }
+
+    private static List<string> GetWatchedFolders(ApplicationContext context, IPathProvider pathProvider)
+    {
+        var rootFolder = Path.GetFullPath(
+            context.Path.IsCollectionPath() ? pathProvider.RootPath : Path.GetDirectoryName(pathProvider.RootPath)!);
+        List<string> folders = [rootFolder];
+
+        if (!string.IsNullOrEmpty(context.TeaPieFolderPath) && Directory.Exists(context.TeaPieFolderPath))
+        {
+            var teaPieFolder = Path.GetFullPath(context.TeaPieFolderPath);
+            if (!File.BelongsTo(teaPieFolder, rootFolder))
+            {
+                folders.Add(teaPieFolder);
+            }
+        }
+
+        return folders;
+    }
+
+    /// <summary>
+    /// Folders, into which TeaPie writes during the run (cache, reports and runs), mustn't trigger new run.
+    /// </summary>
+    private static string[] GetIgnoredFolders(IPathProvider pathProvider)
+        => [.. new[] { pathProvider.CacheFolderPath, pathProvider.ReportsFolderPath, pathProvider.RunsFolderPath }
+            .Select(path => Path.GetFullPath(path) + Path.DirectorySeparatorChar)];
+
+    /// <summary>
+    /// Hashes of all files are refreshed, so that following changes can be compared with the current content.
+    /// </summary>
+    private static void RefreshIndex(
+        IStructureIndex structureIndex,
+        ApplicationContext context,
+        IEnumerable<string> watchedFolders,
+        string[] ignoredFolders)
+    {
+        foreach (var file in GetStructureFiles(structureIndex, watchedFolders, ignoredFolders))
+        {
+            structureIndex.GetContentHash(file);
+        }
+
+        if (!string.IsNullOrEmpty(context.EnvironmentFilePath))
+        {
+            structureIndex.GetContentHash(Path.GetFullPath(context.EnvironmentFilePath));
+        }
+
+        structureIndex.Save();
+    }
+
+    private static List<string> GetStructureFiles(
+        IStructureIndex structureIndex, IEnumerable<string> watchedFolders, string[] ignoredFolders)
+    {
+        List<string> files = [];
+        foreach (var folder in watchedFolders)
+        {
+            CollectFiles(structureIndex, folder, ignoredFolders, files);
+        }
+
+        return files;
+    }
+
+    private static void CollectFiles(
+        IStructureIndex structureIndex, string folderPath, string[] ignoredFolders, List<string> files)
+    {
+        if (IsIgnored(folderPath + Path.DirectorySeparatorChar, ignoredFolders) || !Directory.Exists(folderPath))
+        {
+            return;
+        }
+
+        files.AddRange(structureIndex.GetFiles(folderPath).Where(HasWatchedExtension));
+
+        foreach (var subFolderPath in structureIndex.GetFolders(folderPath))
+        {
+            CollectFiles(structureIndex, subFolderPath, ignoredFolders, files);
+        }
+    }
+
+    private static bool IsWatched(string filePath, ApplicationContext context, string[] ignoredFolders)
+        => !IsIgnored(filePath, ignoredFolders) &&
+            (HasWatchedExtension(filePath) || IsSameFile(filePath, context.EnvironmentFilePath));
+
+    private static bool HasWatchedExtension(string filePath)
+        => _watchedExtensions.Contains(Path.GetExtension(filePath), StringComparer.OrdinalIgnoreCase);
+
+    private static bool IsIgnored(string path, string[] ignoredFolders)
+        => ignoredFolders.Any(folder => path.StartsWith(folder, StringComparison.Ordinal));
+
+    private static bool IsSameFile(string filePath, string otherFilePath)
+        => !string.IsNullOrEmpty(otherFilePath) &&
+            Path.GetFullPath(filePath).Equals(Path.GetFullPath(otherFilePath), StringComparison.Ordinal);
+
+    [LoggerMessage("Watching for changes. Press Ctrl+C to stop.", Level = LogLevel.Information)]
+    private static partial void LogWaitingForChanges(ILogger logger);
+
+    [LoggerMessage(
+        "{changedFiles} file(s) changed, {countOfTestCases} affected test case file(s) will be executed again.",
+        Level = LogLevel.Information)]
+    private static partial void LogAffectedTestCases(ILogger logger, int changedFiles, int countOfTestCases);
+
+    [LoggerMessage("{changedFiles} file(s) changed, all test cases will be executed again.",
+        Level = LogLevel.Information)]
+    private static partial void LogAllTestCasesAffected(ILogger logger, int changedFiles);
+}
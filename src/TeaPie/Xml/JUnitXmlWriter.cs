@@ -58,7 +58,8 @@ internal class JUnitXmlWriter : IDisposable
         bool skipped,
         string? failureMessage = null,
         string failureType = "AssertionError",
-        string? stackTrace = null)
+        string? stackTrace = null,
+        IReadOnlyDictionary<string, string>? properties = null)
     {
         EnsureTestSuiteWritten();
 
@@ -66,6 +67,11 @@ internal class JUnitXmlWriter : IDisposable
         WriteNameAndTimeAttributes(testName, timeMs);
         _writer.WriteAttributeString("classname", className);
 
+        if (properties?.Count > 0)
+        {
+            WritePropertiesElement(properties);
+        }
+
         if (skipped)
         {
             _writer.WriteElementString("skipped", string.Empty);
@@ -118,6 +124,21 @@ internal class JUnitXmlWriter : IDisposable
         WriteTimeAttribute(timeMs);
     }
 
+    private void WritePropertiesElement(IReadOnlyDictionary<string, string> properties)
+    {
+        _writer.WriteStartElement("properties");
+
+        foreach (var (name, value) in properties)
+        {
+            _writer.WriteStartElement("property");
+            _writer.WriteAttributeString("name", name);
+            _writer.WriteAttributeString("value", value);
+            _writer.WriteEndElement();
+        }
+
+        _writer.WriteEndElement();
+    }
+
     private void WriteFailureElement(string message, string type, string? stackTrace)
     {
         _writer.WriteStartElement("failure");
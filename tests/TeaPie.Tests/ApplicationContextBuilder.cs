@@ -2,6 +2,7 @@
 using Microsoft.Extensions.DependencyInjection.Extensions;
 using Microsoft.Extensions.Logging;
 using NSubstitute;
+using TeaPie.Benchmarking;
 using TeaPie.Reporting;
 using TeaPie.TestCases;
 
@@ -78,6 +79,12 @@ internal class ApplicationContextBuilder
         return this;
     }
 
+    public ApplicationContextBuilder WithBenchmark(BenchmarkOptions benchmark)
+    {
+        _optionsBuilder.SetBenchmark(benchmark);
+        return this;
+    }
+
     public ApplicationContext Build()
     {
         _serviceCollection.TryAddSingleton(_ =>
@@ -102,6 +102,48 @@ public class ApplicationPipelineShould
         await pipeline.Run(context);
     }
 
+    [Fact]
+    public async Task ExecuteAllBranchesWhenRunningInParallel()
+    {
+        var pipeline = new ApplicationPipeline();
+        var context = CreateApplicationContext(string.Empty);
+        var registers = new List<int>[4];
+        var branches = new IPipelineStep[registers.Length][];
+
+        for (var i = 0; i < registers.Length; i++)
+        {
+            registers[i] = [];
+            branches[i] = [new IdentifyingStep(registers[i], 0), new IdentifyingStep(registers[i], 1)];
+        }
+
+        await pipeline.RunInParallel(context, branches, 2);
+
+        registers.Should().AllSatisfy(register => register.Should().Equal(0, 1));
+    }
+
+    [Fact]
+    public async Task KeepInsertedStepsWithinTheirBranchWhenRunningInParallel()
+    {
+        var pipeline = new ApplicationPipeline();
+        var context = CreateApplicationContext(string.Empty);
+        var registers = new List<int>[3];
+        var branches = new IPipelineStep[registers.Length][];
+
+        for (var i = 0; i < registers.Length; i++)
+        {
+            registers[i] = [];
+            branches[i] =
+            [
+                new InsertingStep(pipeline, new IdentifyingStep(registers[i], 1)),
+                new IdentifyingStep(registers[i], 2)
+            ];
+        }
+
+        await pipeline.RunInParallel(context, branches, registers.Length);
+
+        registers.Should().AllSatisfy(register => register.Should().Equal(1, 2));
+    }
+
     [Fact]
     public async Task ExecuteScheduledTestsBeforeRegisteredTests()
     {
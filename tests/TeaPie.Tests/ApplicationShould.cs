@@ -0,0 +1,31 @@
+﻿using FluentAssertions;
+using Microsoft.Extensions.Logging;
+
+namespace TeaPie.Tests;
+
+[Collection(nameof(NonParallelCollection))]
+public class ApplicationShould
+{
+    private readonly string _folderPath =
+        Path.Combine(Path.GetTempPath(), Constants.TeaPieFolderName, "tests", Guid.NewGuid().ToString());
+
+    [Fact]
+    public async Task ReleaseLogFilesWhenDisposed()
+    {
+        Directory.CreateDirectory(_folderPath);
+        var logFilePath = Path.Combine(_folderPath, "log.txt");
+        var requestsLogFilePath = Path.Combine(_folderPath, "requests.json");
+
+        var app = ApplicationBuilder.Create()
+            .WithLogging(LogLevel.Debug, logFilePath, LogLevel.Debug, requestsLogFilePath)
+            .Build();
+
+        await app.DisposeAsync();
+
+        OpenExclusively(logFilePath).Should().NotThrow();
+        OpenExclusively(requestsLogFilePath).Should().NotThrow();
+    }
+
+    private static Action OpenExclusively(string path)
+        => () => new FileStream(path, FileMode.Open, FileAccess.ReadWrite, FileShare.None).Dispose();
+}
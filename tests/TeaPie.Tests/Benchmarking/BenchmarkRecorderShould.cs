@@ -0,0 +1,61 @@
+﻿using FluentAssertions;
+using TeaPie.Benchmarking;
+
+namespace TeaPie.Tests.Benchmarking;
+
+public class BenchmarkRecorderShould
+{
+    private const string TestCasePath = "Customers/AddCustomer-req.http";
+
+    [Fact]
+    public void IgnoreRequestsWhenRecordingWasNotStarted()
+    {
+        var recorder = new BenchmarkRecorder();
+
+        recorder.Record(TestCasePath, "AddCustomer", TimeSpan.FromMilliseconds(10), true);
+
+        recorder.GetSummary("Demo").Requests.Should().BeEmpty();
+    }
+
+    [Fact]
+    public void AggregateRecordsOfTheSameRequest()
+    {
+        var recorder = new BenchmarkRecorder();
+        recorder.Start(new BenchmarkOptions(2, TimeSpan.Zero, 4));
+
+        recorder.RegisterIteration();
+        recorder.Record(TestCasePath, "AddCustomer", TimeSpan.FromMilliseconds(10), true);
+        recorder.Record(TestCasePath, "#2", TimeSpan.FromMilliseconds(5), true);
+        recorder.RegisterIteration();
+        recorder.Record(TestCasePath, "AddCustomer", TimeSpan.FromMilliseconds(30), false);
+        recorder.Stop();
+
+        var summary = recorder.GetSummary("Demo");
+
+        summary.Name.Should().Be("Demo");
+        summary.Iterations.Should().Be(2);
+        summary.Concurrency.Should().Be(4);
+        summary.NumberOfRequests.Should().Be(3);
+        summary.NumberOfFailedRequests.Should().Be(1);
+
+        var request = summary.Requests.Single(r => r.RequestName == "AddCustomer");
+        request.TestCasePath.Should().Be(TestCasePath);
+        request.NumberOfRequests.Should().Be(2);
+        request.NumberOfFailedRequests.Should().Be(1);
+        request.MeanMs.Should().Be(20);
+        request.MaxMs.Should().Be(30);
+    }
+
+    [Fact]
+    public void StopRecordingWhenStopped()
+    {
+        var recorder = new BenchmarkRecorder();
+        recorder.Start(new BenchmarkOptions(1, TimeSpan.Zero, 1));
+        recorder.Stop();
+
+        recorder.Record(TestCasePath, "AddCustomer", TimeSpan.FromMilliseconds(10), true);
+
+        recorder.IsRecording.Should().BeFalse();
+        recorder.GetSummary("Demo").NumberOfRequests.Should().Be(0);
+    }
+}
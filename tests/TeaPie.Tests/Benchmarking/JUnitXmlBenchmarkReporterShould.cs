@@ -0,0 +1,80 @@
+﻿using System.Xml.Linq;
+using TeaPie.Benchmarking;
+using static Xunit.Assert;
+
+namespace TeaPie.Tests.Benchmarking;
+
+public class JUnitXmlBenchmarkReporterShould
+{
+    private const string TestFilePath = "BenchmarkResults.xml";
+
+    public JUnitXmlBenchmarkReporterShould()
+    {
+        if (File.Exists(TestFilePath))
+        {
+            File.Delete(TestFilePath);
+        }
+    }
+
+    [Fact]
+    public async Task WriteTestSuitePerTestCaseAndTestCasePerRequest()
+    {
+        var reporter = new JUnitXmlBenchmarkReporter(TestFilePath);
+
+        await reporter.Report(CreateSummary());
+
+        var doc = XDocument.Load(TestFilePath);
+        var suites = doc.Descendants("testsuite").ToList();
+
+        Equal(2, suites.Count);
+        Equal("Customers/AddCustomer-req.http", suites[0].Attribute("name")?.Value);
+        Equal(2, suites[0].Elements("testcase").Count());
+        Single(suites[1].Elements("testcase"));
+    }
+
+    [Fact]
+    public async Task WriteLatencyPercentilesAsProperties()
+    {
+        var reporter = new JUnitXmlBenchmarkReporter(TestFilePath);
+
+        await reporter.Report(CreateSummary());
+
+        var doc = XDocument.Load(TestFilePath);
+        var testCase = doc.Descendants("testcase").First(tc => tc.Attribute("name")?.Value == "AddCustomer");
+        var properties = testCase.Descendants("property")
+            .ToDictionary(p => p.Attribute("name")!.Value, p => p.Attribute("value")!.Value);
+
+        Equal("0.012", testCase.Attribute("time")?.Value);
+        Equal("100", properties["requests"]);
+        Equal("50", properties["requestsPerSecond"]);
+        Equal("11.5", properties["p50Ms"]);
+        Equal("20.25", properties["p99Ms"]);
+    }
+
+    [Fact]
+    public async Task ReportRequestsWithoutResponseAsFailures()
+    {
+        var reporter = new JUnitXmlBenchmarkReporter(TestFilePath);
+
+        await reporter.Report(CreateSummary());
+
+        var doc = XDocument.Load(TestFilePath);
+        var failure = Single(doc.Descendants("failure"));
+
+        Equal("3 of 100 requests didn't receive any response.", failure.Attribute("message")?.Value);
+        Equal("1", doc.Root?.Attribute("failures")?.Value);
+    }
+
+    private static BenchmarkSummary CreateSummary()
+        => new(
+            "Demo",
+            DateTime.Now,
+            TimeSpan.FromSeconds(2),
+            100,
+            1,
+            [
+                new("Customers/AddCustomer-req.http", "AddCustomer", 100, 0, 50, 10, 12, 11.5, 15, 20.25, 25),
+                new("Customers/AddCustomer-req.http", "#2", 100, 3, 50, 1, 2, 2, 3, 4, 5),
+                new("Cars/AddCar-req.http", "AddCar", 100, 0, 50, 5, 6, 6, 7, 8, 9)
+            ]);
+}
@@ -0,0 +1,58 @@
+﻿using FluentAssertions;
+using TeaPie.Benchmarking;
+
+namespace TeaPie.Tests.Benchmarking;
+
+public class LatencyHistogramShould
+{
+    [Fact]
+    public void ReturnZeroForEmptyHistogram()
+    {
+        var histogram = new LatencyHistogram();
+
+        histogram.Count.Should().Be(0);
+        histogram.MeanMs.Should().Be(0);
+        histogram.GetPercentile(99).Should().Be(0);
+    }
+
+    [Fact]
+    public void ComputePercentilesWithinOnePercentPrecision()
+    {
+        var histogram = new LatencyHistogram();
+        for (var latency = 1; latency <= 1000; latency++)
+        {
+            histogram.Record(TimeSpan.FromMilliseconds(latency));
+        }
+
+        histogram.Count.Should().Be(1000);
+        histogram.GetPercentile(50).Should().BeApproximately(500, 5);
+        histogram.GetPercentile(90).Should().BeApproximately(900, 9);
+        histogram.GetPercentile(99).Should().BeApproximately(990, 10);
+        histogram.GetPercentile(100).Should().BeApproximately(1000, 10);
+    }
+
+    [Fact]
+    public void TrackMinimalMaximalAndMeanLatencyExactly()
+    {
+        var histogram = new LatencyHistogram();
+
+        histogram.Record(TimeSpan.FromMilliseconds(10));
+        histogram.Record(TimeSpan.FromMilliseconds(20));
+        histogram.Record(TimeSpan.FromMilliseconds(60));
+
+        histogram.MinMs.Should().Be(10);
+        histogram.MaxMs.Should().Be(60);
+        histogram.MeanMs.Should().Be(30);
+    }
+
+    [Fact]
+    public void NeverReturnPercentileOutsideOfRecordedRange()
+    {
+        var histogram = new LatencyHistogram();
+
+        histogram.Record(TimeSpan.FromMilliseconds(42));
+
+        histogram.GetPercentile(1).Should().Be(42);
+        histogram.GetPercentile(99).Should().Be(42);
+    }
+}
@@ -0,0 +1,83 @@
+﻿using FluentAssertions;
+using Microsoft.Extensions.DependencyInjection;
+using System.Collections.Concurrent;
+using System.Net;
+using TeaPie.Benchmarking;
+using TeaPie.Http;
+using TeaPie.StructureExploration;
+using TeaPie.TestCases;
+using File = System.IO.File;
+
+namespace TeaPie.Tests.Benchmarking;
+
+public class RunBenchmarkStepShould
+{
+    private const string TestCaseName = "users";
+
+    private readonly string _folderPath =
+        Path.Combine(Path.GetTempPath(), Constants.TeaPieFolderName, "tests", Guid.NewGuid().ToString());
+
+    private readonly ConcurrentQueue<Uri> _requestedUris = new();
+
+    [Fact]
+    public async Task ExecuteDataDrivenTestCaseOnceForEachRowInEveryIteration()
+    {
+        var collectionStructure = new CollectionStructure();
+        collectionStructure.TryAddTestCase(CreateTestCase("Id,Name\n1,John\n2,Jane\n"));
+        var provider = CreateServiceProvider();
+        var appContext = new ApplicationContextBuilder()
+            .WithPath(_folderPath)
+            .WithServiceProvider(provider)
+            .WithBenchmark(new BenchmarkOptions(2, TimeSpan.Zero, 2))
+            .Build();
+        appContext.CollectionStructure = collectionStructure;
+
+        await provider.GetStep<RunBenchmarkStep>().Execute(appContext);
+
+        _requestedUris.Select(uri => uri.PathAndQuery).Should().BeEquivalentTo(
+            "/users/1?name=John", "/users/2?name=Jane", "/users/1?name=John", "/users/2?name=Jane");
+
+        provider.GetRequiredService<IBenchmarkRecorder>().GetSummary("Demo").NumberOfRequests.Should().Be(4);
+    }
+
+    private ServiceProvider CreateServiceProvider()
+    {
+        var services = new ServiceCollection();
+        services.AddTeaPie(true, () => { });
+        services.AddHttpClient(nameof(ExecuteRequestStep))
+            .ConfigurePrimaryHttpMessageHandler(() => new RecordingHttpMessageHandler(_requestedUris));
+
+        return services.BuildServiceProvider();
+    }
+
+    private TestCase CreateTestCase(string dataSourceContent)
+    {
+        Directory.CreateDirectory(_folderPath);
+        var folder = new Folder(_folderPath, string.Empty, Path.GetFileName(_folderPath));
+
+        var requestsFilePath = Path.Combine(
+            _folderPath, TestCaseName + Constants.RequestSuffix + Constants.RequestFileExtension);
+        File.WriteAllText(requestsFilePath, "GET https://example.com/users/{{Id}}?name={{Name}}\n");
+
+        var dataSourcePath = Path.Combine(
+            _folderPath, TestCaseName + Constants.DataSourceSuffix + Constants.CsvDataSourceFileExtension);
+        File.WriteAllText(dataSourcePath, dataSourceContent);
+
+        return new TestCase(InternalFile.Create(requestsFilePath, folder))
+        {
+            DataSource = new global::TeaPie.StructureExploration.File(dataSourcePath, Path.GetFileName(dataSourcePath))
+        };
+    }
+
+    private class RecordingHttpMessageHandler(ConcurrentQueue<Uri> requestedUris) : HttpMessageHandler
+    {
+        private readonly ConcurrentQueue<Uri> _requestedUris = requestedUris;
+
+        protected override Task<HttpResponseMessage> SendAsync(
+            HttpRequestMessage request, CancellationToken cancellationToken)
+        {
+            _requestedUris.Enqueue(request.RequestUri!);
+            return Task.FromResult(new HttpResponseMessage(HttpStatusCode.OK) { RequestMessage = request });
+        }
+    }
+}
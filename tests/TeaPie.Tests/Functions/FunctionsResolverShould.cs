@@ -105,7 +105,7 @@ public class FunctionsResolverShould
     }
 
     [Fact]
-    public void ResolveFunctionWithVariableAsParamterCorrectly()
+    public async Task ResolveFunctionWithVariableAsParamterCorrectly()
     {
         string variableName = "MyVariable";
         int value = 42;
@@ -120,7 +120,7 @@ public class FunctionsResolverShould
 
         variables.SetVariable(variableName, value);
         functions.Register(FunctionName, (int val) => val);
-        line = varResolver.ResolveVariablesInLine(line, new(null!, null));
+        line = await varResolver.ResolveVariablesInLine(line, new(null!, null));
         funResolver.ResolveFunctionsInLine(line).Should().BeEquivalentTo(resolvedLine);
     }
 
@@ -0,0 +1,156 @@
+﻿using FluentAssertions;
+using Microsoft.Extensions.Logging;
+using NSubstitute;
+using TeaPie.Http.Auth.OAuth2;
+
+namespace TeaPie.Tests.Http.Authentication;
+
+public class OAuth2TokenCacheShould
+{
+    private readonly ManualTimeProvider _timeProvider = new();
+    private readonly IOAuth2TokenStore _tokenStore = Substitute.For<IOAuth2TokenStore>();
+
+    [Fact]
+    public async Task ShareTokenBetweenProvidersWithSameConfiguration()
+    {
+        var cache = CreateCache();
+        var fetcher = new TokenFetcher();
+
+        var first = await cache.GetToken(CreateOptions(), fetcher.Fetch);
+        var second = await cache.GetToken(CreateOptions(), fetcher.Fetch);
+
+        second.AccessToken.Should().Be(first.AccessToken);
+        fetcher.NumberOfFetches.Should().Be(1);
+    }
+
+    [Fact]
+    public async Task FetchTokenSeparatelyForDifferentScopes()
+    {
+        var cache = CreateCache();
+        var fetcher = new TokenFetcher();
+
+        await cache.GetToken(CreateOptions("read"), fetcher.Fetch);
+        await cache.GetToken(CreateOptions("write"), fetcher.Fetch);
+
+        fetcher.NumberOfFetches.Should().Be(2);
+    }
+
+    [Fact]
+    public async Task FetchTokenOnlyOnceForConcurrentCallers()
+    {
+        var cache = CreateCache();
+        var release = new TaskCompletionSource();
+        var fetcher = new TokenFetcher(release.Task);
+
+        var tasks = Enumerable.Range(0, 10).Select(_ => cache.GetToken(CreateOptions(), fetcher.Fetch)).ToList();
+        release.SetResult();
+        var tokens = await Task.WhenAll(tasks);
+
+        tokens.Select(t => t.AccessToken).Distinct().Should().ContainSingle();
+        fetcher.NumberOfFetches.Should().Be(1);
+    }
+
+    [Fact]
+    public async Task ReturnCurrentTokenWhileRefreshingItInBackground()
+    {
+        var cache = CreateCache();
+        var fetcher = new TokenFetcher();
+        var first = await cache.GetToken(CreateOptions(), fetcher.Fetch);
+
+        _timeProvider.Advance(TimeSpan.FromMinutes(50));
+        var second = await cache.GetToken(CreateOptions(), fetcher.Fetch);
+
+        second.AccessToken.Should().Be(first.AccessToken);
+        await fetcher.WaitForFetches(2);
+
+        var third = await cache.GetToken(CreateOptions(), fetcher.Fetch);
+        third.AccessToken.Should().NotBe(first.AccessToken);
+    }
+
+    [Fact]
+    public async Task FetchNewTokenWhenTokenExpired()
+    {
+        var cache = CreateCache();
+        var fetcher = new TokenFetcher();
+        var first = await cache.GetToken(CreateOptions(), fetcher.Fetch);
+
+        _timeProvider.Advance(TimeSpan.FromHours(2));
+        var second = await cache.GetToken(CreateOptions(), fetcher.Fetch);
+
+        second.AccessToken.Should().NotBe(first.AccessToken);
+        fetcher.NumberOfFetches.Should().Be(2);
+    }
+
+    [Fact]
+    public async Task UsePersistedTokenOnlyIfPersistenceIsEnabled()
+    {
+        var now = _timeProvider.GetUtcNow();
+        var persistedToken = new OAuth2Token("persisted", now, now.AddHours(1));
+        _tokenStore.TryLoad(Arg.Any<string>(), out Arg.Any<OAuth2Token?>())
+            .Returns(call =>
+            {
+                call[1] = persistedToken;
+                return true;
+            });
+
+        var fetcher = new TokenFetcher();
+
+        var persisted = await CreateCache().GetToken(CreateOptions(persist: true), fetcher.Fetch);
+        var fetched = await CreateCache().GetToken(CreateOptions(), fetcher.Fetch);
+
+        persisted.AccessToken.Should().Be("persisted");
+        fetched.AccessToken.Should().NotBe("persisted");
+        fetcher.NumberOfFetches.Should().Be(1);
+    }
+
+    private OAuth2TokenCache CreateCache()
+        => new(_tokenStore, _timeProvider, Substitute.For<ILogger<OAuth2TokenCache>>());
+
+    private static OAuth2Options CreateOptions(string scope = "api", bool persist = false)
+        => OAuth2OptionsBuilder.Create()
+            .WithAuthUrl("https://auth.example.com/token")
+            .WithGrantType("client_credentials")
+            .WithClientId("client")
+            .WithClientSecret("secret")
+            .AddParameter("scope", scope)
+            .WithAccessTokenPersistence(persist)
+            .Build();
+
+    private sealed class TokenFetcher(Task? release = null)
+    {
+        private int _numberOfFetches;
+
+        public int NumberOfFetches => _numberOfFetches;
+
+        public async Task<OAuth2TokenResponse> Fetch(OAuth2Options options)
+        {
+            var number = Interlocked.Increment(ref _numberOfFetches);
+            if (release is not null)
+            {
+                await release;
+            }
+
+            return new OAuth2TokenResponse { AccessToken = $"token-{number}", ExpiresIn = 3600 };
+        }
+
+        public async Task WaitForFetches(int count)
+        {
+            while (Volatile.Read(ref _numberOfFetches) < count)
+            {
+                await Task.Delay(10);
+            }
+
+            // Give the cache chance to store the fetched token.
+            await Task.Delay(50);
+        }
+    }
+
+    private sealed class ManualTimeProvider : TimeProvider
+    {
+        private DateTimeOffset _now = new(2025, 1, 1, 0, 0, 0, TimeSpan.Zero);
+
+        public override DateTimeOffset GetUtcNow() => _now;
+
+        public void Advance(TimeSpan time) => _now += time;
+    }
+}
@@ -0,0 +1,76 @@
+﻿using FluentAssertions;
+using TeaPie.Http.Auth.OAuth2;
+using TeaPie.StructureExploration.Paths;
+
+namespace TeaPie.Tests.Http.Authentication;
+
+public class OAuth2TokenStoreShould
+{
+    private const string Key = "0123456789abcdef";
+
+    private readonly string _basePath =
+        Path.Combine(Path.GetTempPath(), Constants.TeaPieFolderName, "tests", Guid.NewGuid().ToString());
+
+    private readonly OAuth2Token _token = new(
+        "secret-token",
+        new DateTimeOffset(2025, 1, 1, 0, 0, 0, TimeSpan.Zero),
+        new DateTimeOffset(2025, 1, 1, 1, 0, 0, TimeSpan.Zero));
+
+    [Fact]
+    public void LoadSavedToken()
+    {
+        var pathProvider = CreatePathProvider();
+
+        CreateStore(pathProvider, "first.key").Save(Key, _token);
+
+        CreateStore(pathProvider, "first.key").TryLoad(Key, out var token).Should().BeTrue();
+        token.Should().Be(_token);
+    }
+
+    [Fact]
+    public void NotStoreTokenInPlainText()
+    {
+        var pathProvider = CreatePathProvider();
+
+        CreateStore(pathProvider, "first.key").Save(Key, _token);
+
+        var tokenFile = Directory.GetFiles(pathProvider.AccessTokensFolderPath).Should().ContainSingle().Subject;
+        File.ReadAllText(tokenFile).Should().NotContain(_token.AccessToken);
+    }
+
+    [Fact]
+    public void NotLoadTokenEncryptedByDifferentKey()
+    {
+        var pathProvider = CreatePathProvider();
+
+        CreateStore(pathProvider, "first.key").Save(Key, _token);
+
+        CreateStore(pathProvider, "second.key").TryLoad(Key, out _).Should().BeFalse();
+    }
+
+    [Fact]
+    public void NotDeriveNameOfTokenFileFromKeyAlone()
+    {
+        var firstPathProvider = CreatePathProvider();
+        var secondPathProvider = CreatePathProvider("second");
+
+        CreateStore(firstPathProvider, "first.key").Save(Key, _token);
+        CreateStore(secondPathProvider, "second.key").Save(Key, _token);
+
+        var firstTokenFile = Path.GetFileName(Directory.GetFiles(firstPathProvider.AccessTokensFolderPath).Single());
+        var secondTokenFile = Path.GetFileName(Directory.GetFiles(secondPathProvider.AccessTokensFolderPath).Single());
+        firstTokenFile.Should().NotBe(secondTokenFile).And.NotContain(Key);
+    }
+
+    private PathProvider CreatePathProvider(string collectionName = "")
+    {
+        var pathProvider = new PathProvider();
+        var rootPath = Path.Combine(_basePath, collectionName);
+        var teaPieFolderPath = Path.Combine(rootPath, Constants.TeaPieFolderName);
+        pathProvider.UpdatePaths(rootPath, Path.Combine(rootPath, "temp"), teaPieFolderPath);
+        return pathProvider;
+    }
+
+    private OAuth2TokenStore CreateStore(IPathProvider pathProvider, string keyFileName)
+        => new(pathProvider, Path.Combine(_basePath, keyFileName));
+}
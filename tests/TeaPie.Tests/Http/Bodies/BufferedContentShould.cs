@@ -0,0 +1,101 @@
+﻿using FluentAssertions;
+using System.Net.Http.Headers;
+using TeaPie.Http.Bodies;
+
+namespace TeaPie.Tests.Http.Bodies;
+
+public class BufferedContentShould
+{
+    [Fact]
+    public async Task PreserveBinaryBodyAndHeadersOfOriginalContent()
+    {
+        var body = CreateBody(1000);
+        var original = new ByteArrayContent(body);
+        original.Headers.ContentType = new MediaTypeHeaderValue("application/octet-stream");
+        original.Headers.ContentDisposition = new ContentDispositionHeaderValue("attachment") { FileName = "data.bin" };
+
+        using var content = await BufferedContent.From(original);
+
+        (await content.ReadAsByteArrayAsync()).Should().Equal(body);
+        content.Headers.ContentType!.MediaType.Should().Be("application/octet-stream");
+        content.Headers.ContentDisposition!.FileName.Should().Be("data.bin");
+        content.Headers.ContentLength.Should().Be(body.Length);
+    }
+
+    [Fact]
+    public async Task BeSendableRepeatedlyThroughSharedContents()
+    {
+        var body = CreateBody(200_000);
+        using var content = await BufferedContent.From(new ByteArrayContent(body));
+
+        var shared = content.Share();
+        var firstRead = await shared.ReadAsByteArrayAsync();
+        shared.Dispose();
+
+        firstRead.Should().Equal(body);
+        (await content.ReadAsByteArrayAsync()).Should().Equal(body);
+    }
+
+    [Fact]
+    public async Task BufferPartOfBodyExceedingMemoryLimitOutsideOfMemory()
+    {
+        var body = CreateBody(10_000);
+        var buffer = await PooledBodyBuffer.Create(new MemoryStream(body), memoryLimit: 1_000);
+
+        using var stream = new PooledBodyBufferStream(buffer);
+        using var copy = new MemoryStream();
+        await stream.CopyToAsync(copy);
+
+        buffer.IsInMemory.Should().BeFalse();
+        buffer.Length.Should().Be(body.Length);
+        copy.ToArray().Should().Equal(body);
+    }
+
+    [Fact]
+    public async Task ReadOnlyRequestedBeginningOfText()
+    {
+        using var content = await BufferedContent.From(new StringContent("Hello World!"));
+
+        var text = content.ReadAsText(5, out var isTruncated);
+
+        text.Should().Be("Hello");
+        isTruncated.Should().BeTrue();
+    }
+
+    [Fact]
+    public async Task TruncateLongBodyForLogging()
+    {
+        var body = new string('a', BodyConstants.LoggedBodyLimit + 1);
+        using var content = await BufferedContent.From(new StringContent(body));
+
+        var text = await content.ReadAsLoggableText();
+
+        text.Should().StartWith(new string('a', BodyConstants.LoggedBodyLimit));
+        text.Should().EndWith($"(truncated, total length: {body.Length})");
+    }
+
+    [Fact]
+    public async Task ParseBodyOnlyOnce()
+    {
+        using var content = await BufferedContent.From(new StringContent("{ \"id\": 1 }"));
+        var numberOfParsings = 0;
+
+        for (var i = 0; i < 3; i++)
+        {
+            content.GetParsed(stream =>
+            {
+                numberOfParsings++;
+                return new StreamReader(stream).ReadToEnd();
+            });
+        }
+
+        numberOfParsings.Should().Be(1);
+    }
+
+    private static byte[] CreateBody(int length)
+    {
+        var body = new byte[length];
+        new Random(42).NextBytes(body);
+        return body;
+    }
+}
@@ -3,6 +3,7 @@ using Microsoft.Extensions.DependencyInjection;
 using Microsoft.Extensions.Logging;
 using NSubstitute;
 using System.Net;
+using TeaPie.Benchmarking;
 using TeaPie.Functions;
 using TeaPie.Http;
 using TeaPie.Http.Auth;
@@ -56,7 +57,7 @@ public class ExecuteRequestStepShould
         var accessor = new RequestExecutionContextAccessor() { Context = context };
 
         var parser = CreateParser(serviceProvider);
-        parser.Parse(context);
+        await parser.Parse(context);
 
         var step = GetExecuteRequestStep(serviceProvider, accessor);
 
@@ -93,7 +94,7 @@ public class ExecuteRequestStepShould
         var accessor = new RequestExecutionContextAccessor() { Context = context };
 
         var parser = CreateParser(serviceProvider);
-        parser.Parse(context);
+        await parser.Parse(context);
         var step = GetExecuteRequestStep(serviceProvider, accessor);
 
         await step.Execute(appContext);
@@ -110,6 +111,7 @@ public class ExecuteRequestStepShould
             Substitute.For<IHeadersHandler>(),
             Substitute.For<IAuthProviderAccessor>(),
             Substitute.For<ITestScheduler>(),
+            Substitute.For<IBenchmarkRecorder>(),
             Substitute.For<IPipeline>());
 
     private static CustomHttpMessageHandler CreateAndConfigureMessageHandler()
@@ -9,6 +9,7 @@ using TeaPie.Http.Parsing;
 using TeaPie.Http.Retrying;
 using TeaPie.TestCases;
 using TeaPie.Testing;
+using TeaPie.Tracing;
 using TeaPie.Variables;
 
 namespace TeaPie.Tests.Http;
@@ -27,7 +28,7 @@ public class ParseHttpRequestStepShould
         var accessor = new RequestExecutionContextAccessor() { Context = context };
 
         var parser = CreateParser();
-        var step = new ParseHttpRequestStep(accessor, parser);
+        var step = new ParseHttpRequestStep(accessor, parser, new StepsTracer());
 
         await step.Invoking(async step => await step.Execute(appContext)).Should().ThrowAsync<InvalidOperationException>();
     }
@@ -44,7 +45,7 @@ public class ParseHttpRequestStepShould
         var accessor = new RequestExecutionContextAccessor() { Context = context };
 
         var parser = CreateParser();
-        var step = new ParseHttpRequestStep(accessor, parser);
+        var step = new ParseHttpRequestStep(accessor, parser, new StepsTracer());
 
         await step.Execute(appContext);
 
@@ -66,11 +67,11 @@ public class ParseHttpRequestStepShould
         var accessor = new RequestExecutionContextAccessor() { Context = context };
 
         var parser = Substitute.For<IHttpRequestParser>();
-        var step = new ParseHttpRequestStep(accessor, parser);
+        var step = new ParseHttpRequestStep(accessor, parser, new StepsTracer());
 
         await step.Execute(appContext);
 
-        parser.Received(1).Parse(context);
+        await parser.Received(1).Parse(context);
     }
 
     [Fact]
@@ -89,7 +90,7 @@ public class ParseHttpRequestStepShould
 
         var accessor = new RequestExecutionContextAccessor() { Context = context };
 
-        var step = new ParseHttpRequestStep(accessor, parser);
+        var step = new ParseHttpRequestStep(accessor, parser, new StepsTracer());
 
         await step.Execute(appContext);
 
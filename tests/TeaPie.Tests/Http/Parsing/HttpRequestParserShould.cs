@@ -199,7 +199,61 @@ public class HttpRequestParserShould
         CheckMethodUriAndExistenceOfContent(parsed, HttpMethod.Trace, _traceRequestUri, false);
     }
 
+    [Fact]
+    public async Task ResolveVariablesAgainWhenParsingSameRequestRepeatedly()
+    {
+        const string rawContent = "POST {{BaseUrl}}/posts\nX-Attempt: {{Attempt}}\n\n{ \"attempt\": {{Attempt}} }";
+        var variables = new global::TeaPie.Variables.Variables();
+        variables.SetVariable("BaseUrl", "https://jsonplaceholder.typicode.com");
+        var parser = CreateParser(variables);
+
+        for (var attempt = 1; attempt <= 2; attempt++)
+        {
+            variables.SetVariable("Attempt", attempt);
+            var requestContext = new RequestExecutionContext(null!) { RawContent = rawContent };
+
+            await parser.Parse(requestContext);
+
+            CheckMethodUriAndExistenceOfContent(requestContext, HttpMethod.Post, _baseRequestUri, true);
+            requestContext.Request!.Headers.GetValues("X-Attempt").Should().ContainSingle().Which.Should().Be(attempt.ToString());
+            await CheckBody(requestContext, $"\"attempt\": {attempt}");
+        }
+    }
+
+    [Fact]
+    public async Task ResolveFunctionsInRequestWithoutVariables()
+    {
+        const string rawContent = "GET https://jsonplaceholder.typicode.com/posts/{{$id}}";
+        var functions = new global::TeaPie.Functions.Functions();
+        functions.Register("$id", () => 1);
+        var parser = CreateParser(new global::TeaPie.Variables.Variables(), functions);
+        var requestContext = new RequestExecutionContext(null!) { RawContent = rawContent };
+
+        await parser.Parse(requestContext);
+
+        CheckMethodUriAndExistenceOfContent(requestContext, HttpMethod.Get, _specificRequestUri, false);
+    }
+
     private static async Task<RequestExecutionContext> GetParsedContext(string path)
+    {
+        var parser = CreateParser(new global::TeaPie.Variables.Variables());
+
+        var folder =
+            new Folder(RequestsIndex.RootFolderFullPath, RequestsIndex.RootFolderName, RequestsIndex.RootFolderName, null);
+        var file = InternalFile.Create(path, folder);
+
+        var requestContext = new RequestExecutionContext(file)
+        {
+            RawContent = await System.IO.File.ReadAllTextAsync(path)
+        };
+
+        await parser.Parse(requestContext);
+        return requestContext;
+    }
+
+    private static HttpRequestParser CreateParser(
+        global::TeaPie.Variables.Variables variables,
+        global::TeaPie.Functions.Functions? functions = null)
     {
         var services = new ServiceCollection();
         services.AddHttpClient();
@@ -209,13 +263,11 @@ public class HttpRequestParserShould
         var clientFactory = serviceProvider.GetRequiredService<IHttpClientFactory>();
         var headersProvider = new HttpRequestHeadersProvider(clientFactory);
 
-        var variables = new global::TeaPie.Variables.Variables();
         var variablesResolver = new VariablesResolver(variables, serviceProvider);
-        var functions = new global::TeaPie.Functions.Functions();
-        var functionsResolver = new FunctionsResolver(functions);
+        var functionsResolver = new FunctionsResolver(functions ?? new global::TeaPie.Functions.Functions());
         var headersResolver = new HeadersHandler();
 
-        var parser = new HttpRequestParser(
+        return new HttpRequestParser(
             headersProvider,
             variablesResolver,
             functionsResolver,
@@ -224,18 +276,6 @@ public class HttpRequestParserShould
             Substitute.For<IAuthProviderRegistry>(),
             Substitute.For<ITestFactory>(),
             Substitute.For<ITestScheduler>());
-
-        var folder =
-            new Folder(RequestsIndex.RootFolderFullPath, RequestsIndex.RootFolderName, RequestsIndex.RootFolderName, null);
-        var file = InternalFile.Create(path, folder);
-
-        var requestContext = new RequestExecutionContext(file)
-        {
-            RawContent = await System.IO.File.ReadAllTextAsync(path)
-        };
-
-        parser.Parse(requestContext);
-        return requestContext;
     }
 
     private static void CheckMethodUriAndExistenceOfContent(
@@ -0,0 +1,77 @@
+﻿using FluentAssertions;
+using TeaPie.Http.Parsing;
+
+namespace TeaPie.Tests.Http.Parsing;
+
+public class HttpRequestTemplateShould
+{
+    private readonly IReadOnlyList<ILineParser> _lineParsers =
+    [
+        new CommentLineParser(),
+        new DirectivesLineParser(),
+        new EmptyLineParser(),
+        new MethodAndUriParser(),
+        new HeaderParser(),
+        new BodyParser()
+    ];
+
+    [Fact]
+    public void TokenizeLineIntoLiteralsAndVariableSlots()
+    {
+        var template = HttpRequestTemplate.Compile("GET {{BaseUrl}}/posts/{{Id}}", _lineParsers);
+
+        template.Lines.Should().ContainSingle();
+        template.Lines[0].Segments.Should().Equal(
+            new HttpTemplateSegment.Literal("GET "),
+            new HttpTemplateSegment.Variable("BaseUrl"),
+            new HttpTemplateSegment.Literal("/posts/"),
+            new HttpTemplateSegment.Variable("Id"));
+    }
+
+    [Fact]
+    public void TokenizeFunctionSlotsInLineWithoutVariables()
+    {
+        var template = HttpRequestTemplate.Compile("X-Request-Id: {{$guid}}", _lineParsers);
+
+        template.Lines[0].Segments.Should().Equal(
+            new HttpTemplateSegment.Literal("X-Request-Id: "),
+            new HttpTemplateSegment.Function("$guid"));
+    }
+
+    [Fact]
+    public void NotTokenizeFunctionsWhichMayTakeVariablesAsParameters()
+    {
+        var template = HttpRequestTemplate.Compile("X-Number: {{$rand {{Max}}}}", _lineParsers);
+
+        template.Lines[0].HasVariables.Should().BeTrue();
+        template.Lines[0].Segments.Should().NotContain(s => s is HttpTemplateSegment.Function);
+    }
+
+    [Fact]
+    public void ClassifyLinesOfRequestAheadOfTime()
+    {
+        const string content = "# @name CreatePost\n## TEST-SUCCESSFUL-STATUS: True\nPOST {{BaseUrl}}/posts\n" +
+            "Content-Type: application/json\n\n{\n  \"title\": \"{{Title}}\"\n}";
+
+        var template = HttpRequestTemplate.Compile(content, _lineParsers);
+
+        template.Lines.Select(l => l.Parser?.GetType()).Should().Equal(
+            typeof(CommentLineParser),
+            typeof(DirectivesLineParser),
+            typeof(MethodAndUriParser),
+            typeof(HeaderParser),
+            typeof(EmptyLineParser),
+            typeof(BodyParser),
+            typeof(BodyParser),
+            typeof(BodyParser));
+    }
+
+    [Fact]
+    public void MarkLinesWhichKindDependsOnValuesOfVariables()
+    {
+        var template = HttpRequestTemplate.Compile("GET https://example.com\n{{Header}}", _lineParsers);
+
+        template.Lines[0].IsShapeDependent.Should().BeFalse();
+        template.Lines[1].IsShapeDependent.Should().BeTrue();
+    }
+}
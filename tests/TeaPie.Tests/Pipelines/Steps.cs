@@ -39,3 +39,17 @@ internal class GenerativeStep(IPipeline pipeline) : IPipelineStep
         await Task.CompletedTask;
     }
 }
+
+internal class InsertingStep(IPipeline pipeline, IPipelineStep stepToInsert) : IPipelineStep
+{
+    private readonly IPipeline _pipeline = pipeline;
+    private readonly IPipelineStep _stepToInsert = stepToInsert;
+
+    public async Task Execute(
+        ApplicationContext context,
+        CancellationToken cancellationToken = default)
+    {
+        _pipeline.InsertSteps(null, _stepToInsert);
+        await Task.CompletedTask;
+    }
+}
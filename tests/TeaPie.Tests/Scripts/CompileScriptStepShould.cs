@@ -35,7 +35,8 @@ public class CompileScriptStepShould
         var accessor = new ScriptExecutionContextAccessor() { Context = context };
         await ScriptHelper.PrepareScriptForCompilation(context);
 
-        var compiler = new ScriptCompiler(Substitute.For<ILogger<ScriptCompiler>>());
+        var compiler = new ScriptCompiler(
+            Substitute.For<ICompiledScriptsCache>(), Substitute.For<ILogger<ScriptCompiler>>());
 
         var appContext = new ApplicationContextBuilder().Build();
 
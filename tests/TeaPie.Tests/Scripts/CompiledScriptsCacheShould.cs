@@ -0,0 +1,101 @@
+﻿using FluentAssertions;
+using Microsoft.CodeAnalysis.CSharp.Scripting;
+using Microsoft.CodeAnalysis.Scripting;
+using Microsoft.Extensions.Logging;
+using NSubstitute;
+using TeaPie.Scripts;
+using TeaPie.StructureExploration.Paths;
+
+namespace TeaPie.Tests.Scripts;
+
+public class CompiledScriptsCacheShould
+{
+    private const string ScriptContent = "return 40 + 2;";
+
+    private readonly string _folderPath =
+        Path.Combine(Path.GetTempPath(), Constants.TeaPieFolderName, "tests", Guid.NewGuid().ToString());
+
+    [Fact]
+    public void ComputeSameKeyForSameContent()
+    {
+        var cache = CreateCache();
+
+        cache.GetKey(ScriptContent).Should().Be(cache.GetKey(ScriptContent));
+    }
+
+    [Fact]
+    public void ComputeDifferentKeyWhenReferencedNuGetPackagesDiffer()
+    {
+        var cache = CreateCache();
+
+        var firstKey = cache.GetKey(
+            $"{ScriptContent}{Environment.NewLine}{ScriptPreProcessorConstants.NuGetPackageComment} Bogus, 35.6.1");
+        var secondKey = cache.GetKey(
+            $"{ScriptContent}{Environment.NewLine}{ScriptPreProcessorConstants.NuGetPackageComment} Bogus, 35.6.2");
+
+        firstKey.Should().NotBe(secondKey);
+    }
+
+    [Fact]
+    public void NotFindScriptWhichWasNotStored()
+    {
+        var cache = CreateCache();
+
+        cache.TryGet(cache.GetKey("return 0;"), out var scriptRunner, out _).Should().BeFalse();
+        scriptRunner.Should().BeNull();
+    }
+
+    [Fact]
+    public async Task LoadStoredScriptWhichCanBeExecuted()
+    {
+        var cache = CreateCache();
+        var key = cache.GetKey(ScriptContent);
+        var script = CSharpScript.Create(ScriptContent, ScriptOptions.Default, typeof(Globals));
+
+        cache.Store(key, script, []);
+
+        cache.TryGet(key, out var scriptRunner, out _).Should().BeTrue();
+        var result = await scriptRunner!(new Globals());
+        result.Should().Be(42);
+    }
+
+    [Fact]
+    public void LoadWarningsTogetherWithStoredScript()
+    {
+        var cache = CreateCache();
+        var key = cache.GetKey(ScriptContent);
+        var script = CSharpScript.Create(ScriptContent, ScriptOptions.Default, typeof(Globals));
+
+        cache.Store(key, script, ["First warning", "Second warning"]);
+
+        cache.TryGet(key, out _, out var warnings).Should().BeTrue();
+        warnings.Should().Equal("First warning", "Second warning");
+    }
+
+    [Fact]
+    public void RemoveUnusedCompiledScriptsWhenStoringNewOne()
+    {
+        Directory.CreateDirectory(_folderPath);
+        var unusedScriptPath = Path.Combine(_folderPath, "unused" + ScriptsConstants.LibraryFileExtension);
+        var recentScriptPath = Path.Combine(_folderPath, "recent" + ScriptsConstants.LibraryFileExtension);
+        File.WriteAllText(unusedScriptPath, string.Empty);
+        File.WriteAllText(recentScriptPath, string.Empty);
+        File.SetLastWriteTimeUtc(
+            unusedScriptPath, DateTime.UtcNow - CompiledScriptsCache.MaxCompiledScriptAge - TimeSpan.FromDays(1));
+
+        var cache = CreateCache();
+        var script = CSharpScript.Create(ScriptContent, ScriptOptions.Default, typeof(Globals));
+        cache.Store(cache.GetKey(ScriptContent), script, []);
+
+        File.Exists(unusedScriptPath).Should().BeFalse();
+        File.Exists(recentScriptPath).Should().BeTrue();
+    }
+
+    private CompiledScriptsCache CreateCache()
+    {
+        var pathProvider = Substitute.For<IPathProvider>();
+        pathProvider.CompiledScriptsFolderPath.Returns(_folderPath);
+
+        return new CompiledScriptsCache(pathProvider, Substitute.For<ILogger<CompiledScriptsCache>>());
+    }
+}
@@ -0,0 +1,44 @@
+﻿using FluentAssertions;
+using TeaPie.Scripts;
+
+namespace TeaPie.Tests.Scripts;
+
+public class NuGetLockFileShould
+{
+    private static readonly NuGetPackageDescription _package = new("Bogus", "35.6.1");
+
+    [Fact]
+    public void NotFindPackageWhichWasNotLocked()
+    {
+        var lockFile = new NuGetLockFile(GetLockFilePath());
+
+        lockFile.TryGet(_package, out var packages).Should().BeFalse();
+        packages.Should().BeEmpty();
+    }
+
+    [Fact]
+    public void PersistLockedPackagesBetweenInstances()
+    {
+        var path = GetLockFilePath();
+        LockedNuGetPackage[] graph = [new("Bogus", "35.6.1"), new("System.Memory", "4.5.5")];
+
+        new NuGetLockFile(path).Set(_package, graph);
+
+        new NuGetLockFile(path).TryGet(_package, out var packages).Should().BeTrue();
+        packages.Should().Equal(graph);
+    }
+
+    [Fact]
+    public void IgnoreCorruptedLockFile()
+    {
+        var path = GetLockFilePath();
+        Directory.CreateDirectory(Path.GetDirectoryName(path)!);
+        File.WriteAllText(path, "{ not a json");
+
+        new NuGetLockFile(path).TryGet(_package, out _).Should().BeFalse();
+    }
+
+    private static string GetLockFilePath()
+        => Path.Combine(
+            Path.GetTempPath(), Constants.TeaPieFolderName, "tests", Guid.NewGuid().ToString(), "nuget.lock.json");
+}
@@ -0,0 +1,94 @@
+﻿using FluentAssertions;
+using Microsoft.CodeAnalysis;
+using Microsoft.CodeAnalysis.CSharp;
+using Microsoft.Extensions.Logging;
+using NSubstitute;
+using NuGet.Packaging;
+using NuGet.Versioning;
+using TeaPie.Scripts;
+using TeaPie.StructureExploration.Paths;
+
+namespace TeaPie.Tests.Scripts;
+
+public class NuGetPackageHandlerShould
+{
+    private const string LocalPackageName = "TeaPie.Tests.LocalPackage";
+    private const string LocalPackageVersion = "1.0.0";
+
+    private readonly string _cacheFolderPath =
+        Path.Combine(Path.GetTempPath(), Constants.TeaPieFolderName, "tests", Guid.NewGuid().ToString());
+
+    [Fact]
+    public async Task FailImmediatelyInOfflineModeWhenPackageIsNotAvailable()
+    {
+        var handler = CreateHandler(new NuGetOptions(offline: true));
+
+        await handler.Invoking(async h => await h.HandleNuGetPackage(new("Bogus", "35.6.1")))
+            .Should().ThrowAsync<NuGetPackageNotFoundException>();
+
+        handler.LoadedPackages.Should().BeEmpty();
+    }
+
+    [Fact]
+    public async Task RestorePackageFromLocalFeedInOfflineMode()
+    {
+        var localFeedPath = Path.Combine(_cacheFolderPath, "feed");
+        CreateLocalPackage(localFeedPath);
+        var handler = CreateHandler(new NuGetOptions(offline: true, localFeedPath: localFeedPath));
+
+        await handler.HandleNuGetPackage(new(LocalPackageName, LocalPackageVersion));
+
+        var packagePath = Path.Combine(
+            _cacheFolderPath, "packages", LocalPackageName.ToLower(), LocalPackageVersion, "lib", "netstandard2.0");
+        File.Exists(Path.Combine(packagePath, $"{LocalPackageName}.dll")).Should().BeTrue();
+        handler.LoadedPackages.Should().ContainSingle().Which.PackageName.Should().Be(LocalPackageName);
+    }
+
+    private NuGetPackageHandler CreateHandler(NuGetOptions options)
+    {
+        var pathProvider = Substitute.For<IPathProvider>();
+        pathProvider.NuGetPackagesFolderPath.Returns(Path.Combine(_cacheFolderPath, "packages"));
+        pathProvider.NuGetLockFilePath.Returns(Path.Combine(_cacheFolderPath, "nuget.lock.json"));
+
+        var handler = new NuGetPackageHandler(
+            pathProvider, Substitute.For<ILogger<NuGetPackageHandler>>(), NuGet.Common.NullLogger.Instance);
+        handler.UseOptions(options);
+
+        return handler;
+    }
+
+    private static void CreateLocalPackage(string feedPath)
+    {
+        Directory.CreateDirectory(feedPath);
+        var libraryPath = Path.Combine(feedPath, $"{LocalPackageName}.dll");
+        EmitLibrary(libraryPath);
+
+        var builder = new PackageBuilder()
+        {
+            Id = LocalPackageName,
+            Version = NuGetVersion.Parse(LocalPackageVersion),
+            Description = "Package used for testing of restore from local feed."
+        };
+
+        builder.Authors.Add("TeaPie");
+        builder.Files.Add(new PhysicalPackageFile()
+        {
+            SourcePath = libraryPath,
+            TargetPath = $"lib/netstandard2.0/{LocalPackageName}.dll"
+        });
+
+        using var stream = File.Create(Path.Combine(feedPath, $"{LocalPackageName}.{LocalPackageVersion}.nupkg"));
+        builder.Save(stream);
+    }
+
+    private static void EmitLibrary(string path)
+    {
+        var compilation = CSharpCompilation.Create(
+            LocalPackageName,
+            [CSharpSyntaxTree.ParseText("public static class LocalPackage { public const int Value = 42; }")],
+            [MetadataReference.CreateFromFile(typeof(object).Assembly.Location)],
+            new CSharpCompilationOptions(OutputKind.DynamicallyLinkedLibrary));
+
+        compilation.Emit(path).Success.Should().BeTrue();
+    }
+}
@@ -1,4 +1,5 @@
 ﻿using FluentAssertions;
+using Microsoft.CodeAnalysis.Scripting;
 using Microsoft.Extensions.Logging;
 using Microsoft.Extensions.Logging.Abstractions;
 using NSubstitute;
@@ -16,7 +17,8 @@ public class ScriptCompilerShould
         var context = ScriptHelper.GetScriptExecutionContext(ScriptIndex.ScriptWithSyntaxErrorPath);
         await ScriptHelper.PrepareScriptForCompilation(context);
 
-        var compiler = new ScriptCompiler(Substitute.For<ILogger<ScriptCompiler>>());
+        var compiler = new ScriptCompiler(
+            Substitute.For<ICompiledScriptsCache>(), Substitute.For<ILogger<ScriptCompiler>>());
 
         compiler.Invoking(c => c.CompileScript(context.ProcessedContent!, context.Script.File.RelativePath))
             .Should().Throw<SyntaxErrorException>();
@@ -28,7 +30,8 @@ public class ScriptCompilerShould
         var context = ScriptHelper.GetScriptExecutionContext(ScriptIndex.PlainScriptPath);
         await ScriptHelper.PrepareScriptForCompilation(context);
 
-        var compiler = new ScriptCompiler(Substitute.For<ILogger<ScriptCompiler>>());
+        var compiler = new ScriptCompiler(
+            Substitute.For<ICompiledScriptsCache>(), Substitute.For<ILogger<ScriptCompiler>>());
 
         var compiledScript = compiler.CompileScript(context.ProcessedContent!, context.Script.File.RelativePath);
         compiledScript.Should().NotBe(null);
@@ -40,9 +43,68 @@ public class ScriptCompilerShould
         var context = ScriptHelper.GetScriptExecutionContext(ScriptIndex.ScriptWithOneNuGetDirectivePath);
         await ScriptHelper.PrepareScriptForCompilation(context);
 
-        var compiler = new ScriptCompiler(Substitute.For<ILogger<ScriptCompiler>>());
+        var compiler = new ScriptCompiler(
+            Substitute.For<ICompiledScriptsCache>(), Substitute.For<ILogger<ScriptCompiler>>());
 
         var compiledScript = compiler.CompileScript(context.ProcessedContent!, context.Script.File.RelativePath);
         compiledScript.Should().NotBe(null);
     }
+
+    [Fact]
+    public async Task StoreCompiledScriptToCache()
+    {
+        var context = ScriptHelper.GetScriptExecutionContext(ScriptIndex.PlainScriptPath);
+        await ScriptHelper.PrepareScriptForCompilation(context);
+
+        var cache = Substitute.For<ICompiledScriptsCache>();
+        cache.GetKey(context.ProcessedContent!).Returns("key");
+        var compiler = new ScriptCompiler(cache, Substitute.For<ILogger<ScriptCompiler>>());
+
+        compiler.CompileScript(context.ProcessedContent!, context.Script.File.RelativePath);
+
+        cache.Received(1).Store("key", Arg.Any<Script<object>>(), Arg.Any<IReadOnlyList<string>>());
+    }
+
+    [Fact]
+    public async Task UseCachedScriptInsteadOfCompilingItAgain()
+    {
+        var context = ScriptHelper.GetScriptExecutionContext(ScriptIndex.ScriptWithSyntaxErrorPath);
+        await ScriptHelper.PrepareScriptForCompilation(context);
+
+        var cache = Substitute.For<ICompiledScriptsCache>();
+        ScriptRunner<object> cachedScript = (_, _) => Task.FromResult<object>(null!);
+        cache.GetKey(context.ProcessedContent!).Returns("key");
+        cache.TryGet("key", out Arg.Any<ScriptRunner<object>?>(), out Arg.Any<IReadOnlyList<string>>())
+            .Returns(call =>
+            {
+                call[1] = cachedScript;
+                call[2] = new List<string>();
+                return true;
+            });
+
+        var compiler = new ScriptCompiler(cache, Substitute.For<ILogger<ScriptCompiler>>());
+
+        var compiledScript = compiler.CompileScript(context.ProcessedContent!, context.Script.File.RelativePath);
+
+        compiledScript.Should().BeSameAs(cachedScript);
+        cache.DidNotReceive()
+            .Store(Arg.Any<string>(), Arg.Any<Script<object>>(), Arg.Any<IReadOnlyList<string>>());
+    }
+
+    [Fact]
+    public async Task ReuseScriptCompiledDuringTheSameRun()
+    {
+        var context = ScriptHelper.GetScriptExecutionContext(ScriptIndex.PlainScriptPath);
+        await ScriptHelper.PrepareScriptForCompilation(context);
+
+        var cache = Substitute.For<ICompiledScriptsCache>();
+        cache.GetKey(context.ProcessedContent!).Returns("key");
+        var compiler = new ScriptCompiler(cache, Substitute.For<ILogger<ScriptCompiler>>());
+
+        var firstScript = compiler.CompileScript(context.ProcessedContent!, context.Script.File.RelativePath);
+        var secondScript = compiler.CompileScript(context.ProcessedContent!, context.Script.File.RelativePath);
+
+        secondScript.Should().BeSameAs(firstScript);
+        cache.Received(1).TryGet("key", out Arg.Any<ScriptRunner<object>?>(), out Arg.Any<IReadOnlyList<string>>());
+    }
 }
@@ -52,7 +52,8 @@ internal static class ScriptHelper
 
     private static void CompileScriptAndSaveMetadata(ScriptExecutionContext context)
     {
-        var compiler = new ScriptCompiler(Substitute.For<ILogger<ScriptCompiler>>());
+        var compiler = new ScriptCompiler(
+            Substitute.For<ICompiledScriptsCache>(), Substitute.For<ILogger<ScriptCompiler>>());
         context.ScriptObject = compiler.CompileScript(context.ProcessedContent!, context.Script.File.Path);
     }
 
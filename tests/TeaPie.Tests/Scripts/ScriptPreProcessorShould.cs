@@ -146,6 +146,8 @@ public sealed class ScriptPreProcessorShould
 
         await nugetHandler.Received(1).HandleNuGetPackage(new NuGetPackageDescription("Newtonsoft.Json", "13.0.3"));
         processedContent.Should().NotContain(ScriptPreProcessorConstants.NuGetDirective);
+        processedContent.Should()
+            .EndWith($"{ScriptPreProcessorConstants.NuGetPackageComment} Newtonsoft.Json, 13.0.3");
     }
 
     [Fact]
@@ -174,6 +176,8 @@ public sealed class ScriptPreProcessorShould
 
         await nugetHandler.Received(2).HandleNuGetPackage(new NuGetPackageDescription("Newtonsoft.Json", "13.0.3"));
         processedContent.Should().NotContain(ScriptPreProcessorConstants.NuGetDirective);
+        processedContent.Split(Environment.NewLine).Should()
+            .ContainSingle(line => line.StartsWith(ScriptPreProcessorConstants.NuGetPackageComment));
     }
 
     [Fact]
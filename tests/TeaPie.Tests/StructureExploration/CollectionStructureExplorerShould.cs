@@ -223,5 +223,12 @@ public class CollectionStructureExplorerShould
     }
 
     private static CollectionStructureExplorer GetStructureExplorer(IPathProvider? pathProvider = null)
-        => new(pathProvider ?? Substitute.For<IPathProvider>(), Substitute.For<ILogger<CollectionStructureExplorer>>(), new TpFileParser());
+    {
+        pathProvider ??= Substitute.For<IPathProvider>();
+        return new(
+            pathProvider,
+            new StructureIndex(pathProvider, new PathResolver(pathProvider)),
+            Substitute.For<ILogger<CollectionStructureExplorer>>(),
+            new TpFileParser());
+    }
 }
@@ -0,0 +1,102 @@
+﻿using FluentAssertions;
+using TeaPie.StructureExploration;
+using TeaPie.StructureExploration.Paths;
+
+namespace TeaPie.Tests.StructureExploration;
+
+public class StructureIndexShould
+{
+    private readonly string _rootPath;
+    private readonly PathProvider _pathProvider = new();
+
+    public StructureIndexShould()
+    {
+        var basePath = Path.Combine(Path.GetTempPath(), Constants.TeaPieFolderName, "tests", Guid.NewGuid().ToString());
+        _rootPath = Path.Combine(basePath, "Collection");
+        Directory.CreateDirectory(_rootPath);
+
+        var teaPieFolderPath = Path.Combine(basePath, Constants.TeaPieFolderName);
+        _pathProvider.UpdatePaths(_rootPath, teaPieFolderPath, teaPieFolderPath);
+    }
+
+    [Fact]
+    public void ListFilesAndFoldersOrderedByName()
+    {
+        CreateFile("b-req.http");
+        CreateFile("a-req.http");
+        Directory.CreateDirectory(Path.Combine(_rootPath, "Sub"));
+
+        var index = CreateIndex();
+
+        index.GetFiles(_rootPath).Should().Equal(GetPath("a-req.http"), GetPath("b-req.http"));
+        index.GetFolders(_rootPath).Should().Equal(GetPath("Sub"));
+    }
+
+    [Fact]
+    public void ServeListingOfUnmodifiedFolderFromPersistedIndex()
+    {
+        CreateFile("a-req.http");
+        var lastWriteTime = Directory.GetLastWriteTimeUtc(_rootPath);
+
+        var index = CreateIndex();
+        index.GetFiles(_rootPath);
+        index.Save();
+
+        // Folder looks unmodified, so it is not listed again.
+        CreateFile("b-req.http");
+        Directory.SetLastWriteTimeUtc(_rootPath, lastWriteTime);
+
+        CreateIndex().GetFiles(_rootPath).Should().Equal(GetPath("a-req.http"));
+    }
+
+    [Fact]
+    public void ListModifiedFolderAgain()
+    {
+        CreateFile("a-req.http");
+        var lastWriteTime = Directory.GetLastWriteTimeUtc(_rootPath);
+
+        var index = CreateIndex();
+        index.GetFiles(_rootPath);
+        index.Save();
+
+        CreateFile("b-req.http");
+        Directory.SetLastWriteTimeUtc(_rootPath, lastWriteTime.AddSeconds(1));
+
+        CreateIndex().GetFiles(_rootPath).Should().Equal(GetPath("a-req.http"), GetPath("b-req.http"));
+    }
+
+    [Fact]
+    public void DetectChangeOfFileContent()
+    {
+        var path = CreateFile("a-init.csx", "var a = 1;");
+        var index = CreateIndex();
+        index.GetContentHash(path);
+
+        index.HasContentChanged(path).Should().BeFalse();
+
+        File.WriteAllText(path, "var a = 12;");
+
+        index.HasContentChanged(path).Should().BeTrue();
+        index.HasContentChanged(path).Should().BeFalse();
+    }
+
+    [Fact]
+    public void ResolveScriptsReferencedByLoadDirectives()
+    {
+        var helperPath = CreateFile("helper.csx");
+        var scriptPath = CreateFile("a-init.csx", $"#load \"./helper.csx\"{Environment.NewLine}var a = 1;");
+
+        CreateIndex().GetDependencies(scriptPath).Should().Equal(helperPath);
+    }
+
+    private StructureIndex CreateIndex() => new(_pathProvider, new PathResolver(_pathProvider));
+
+    private string CreateFile(string name, string content = "")
+    {
+        var path = GetPath(name);
+        File.WriteAllText(path, content);
+        return path;
+    }
+
+    private string GetPath(string name) => Path.Combine(_rootPath, name);
+}
@@ -154,5 +154,12 @@ public class TestCaseStructureExplorerShould
     }
 
     private static TestCaseStructureExplorer GetStructureExplorer(IPathProvider? pathProvider = null)
-        => new(pathProvider ?? Substitute.For<IPathProvider>(), Substitute.For<ILogger<TestCaseStructureExplorer>>(), new TpFileParser());
+    {
+        pathProvider ??= Substitute.For<IPathProvider>();
+        return new(
+            pathProvider,
+            new StructureIndex(pathProvider, new PathResolver(pathProvider)),
+            Substitute.For<ILogger<TestCaseStructureExplorer>>(),
+            new TpFileParser());
+    }
 }
@@ -0,0 +1,150 @@
+﻿using FluentAssertions;
+using TeaPie.TestCases;
+
+namespace TeaPie.Tests.TestCases;
+
+public class DataSourceReaderShould
+{
+    private readonly string _folderPath =
+        Path.Combine(Path.GetTempPath(), Constants.TeaPieFolderName, "tests", Guid.NewGuid().ToString());
+
+    public DataSourceReaderShould() => Directory.CreateDirectory(_folderPath);
+
+    [Fact]
+    public async Task ReadRowsOfCsvFileByItsHeader()
+    {
+        var path = CreateFile("data.csv", "Name, Age\nJohn,30\n\nJane,25\n");
+
+        var rows = await ReadRows(path);
+
+        rows.Should().HaveCount(2);
+        rows[0].Number.Should().Be(1);
+        rows[0].Values.Should().BeEquivalentTo(new Dictionary<string, object?> { ["Name"] = "John", ["Age"] = "30" });
+        rows[1].Number.Should().Be(2);
+        rows[1].Values.Should().BeEquivalentTo(new Dictionary<string, object?> { ["Name"] = "Jane", ["Age"] = "25" });
+    }
+
+    [Fact]
+    public async Task ReadQuotedCsvValues()
+    {
+        var path = CreateFile("data.csv", "Name,Note\n\"Doe, John\",\"Says \"\"hi\"\"\nand leaves\"\n");
+
+        var rows = await ReadRows(path);
+
+        rows.Should().ContainSingle();
+        rows[0].Values["Name"].Should().Be("Doe, John");
+        rows[0].Values["Note"].Should().Be("Says \"hi\"\nand leaves");
+    }
+
+    [Fact]
+    public async Task ThrowWhenCsvRowDoesNotMatchHeader()
+    {
+        var path = CreateFile("data.csv", "Name,Age\nJohn\n");
+
+        var reading = async () => await ReadRows(path);
+
+        await reading.Should().ThrowAsync<InvalidOperationException>().WithMessage("Row 1 *");
+    }
+
+    [Theory]
+    [InlineData("Name,Age,Name\nJohn,30,Doe\n")]
+    [InlineData("Name,,Age\nJohn,x,30\n")]
+    public async Task ThrowWhenCsvHeaderContainsDuplicatedOrEmptyColumn(string content)
+    {
+        var path = CreateFile("data.csv", content);
+
+        var reading = async () => await ReadRows(path);
+
+        await reading.Should().ThrowAsync<InvalidOperationException>().WithMessage("Header of the data source *");
+    }
+
+    [Fact]
+    public async Task ThrowWhenCsvColumnNameIsNotValidVariableName()
+    {
+        var path = CreateFile("data.csv", "Name,First Name\nJohn,Doe\n");
+
+        var reading = async () => await ReadRows(path);
+
+        await reading.Should().ThrowAsync<InvalidOperationException>()
+            .WithMessage($"Header of the data source '{path}' contains column with invalid name 'First Name'*");
+    }
+
+    [Fact]
+    public async Task ReadRowsOfJsonLinesFileWithTypedValues()
+    {
+        var path = CreateFile(
+            "data.jsonl",
+            "{\"Name\":\"John\",\"Age\":30,\"Score\":1.5,\"Active\":true,\"Manager\":null,\"Tags\":[\"a\"]}\n" +
+            "\n{\"Name\":\"Jane\"}");
+
+        var rows = await ReadRows(path);
+
+        rows.Should().HaveCount(2);
+        rows[0].Values["Name"].Should().Be("John");
+        rows[0].Values["Age"].Should().Be(30L);
+        rows[0].Values["Score"].Should().Be(1.5m);
+        rows[0].Values["Active"].Should().Be(true);
+        rows[0].Values["Manager"].Should().BeNull();
+        rows[0].Values["Tags"].Should().Be("[\"a\"]");
+        rows[1].Number.Should().Be(2);
+    }
+
+    [Fact]
+    public async Task ThrowWhenJsonLineIsNotObject()
+    {
+        var path = CreateFile("data.jsonl", "{\"Name\":\"John\"}\n[1, 2]\n");
+
+        var reading = async () => await ReadRows(path);
+
+        await reading.Should().ThrowAsync<InvalidOperationException>().WithMessage("Row 2 *");
+    }
+
+    [Fact]
+    public async Task ThrowWhenJsonLineContainsDuplicatedProperty()
+    {
+        var path = CreateFile("data.jsonl", "{\"Name\":\"John\"}\n{\"Name\":\"Jane\",\"Name\":\"Doe\"}\n");
+
+        var reading = async () => await ReadRows(path);
+
+        await reading.Should().ThrowAsync<InvalidOperationException>().WithMessage("Row 2 *'Name' more than once.");
+    }
+
+    [Fact]
+    public async Task ThrowWhenJsonPropertyNameIsNotValidVariableName()
+    {
+        var path = CreateFile("data.jsonl", "{\"Name\":\"John\"}\n{\"Name\":\"Jane\",\"$id\":1}\n");
+
+        var reading = async () => await ReadRows(path);
+
+        await reading.Should().ThrowAsync<InvalidOperationException>()
+            .WithMessage($"Row 2 of the data source '{path}' contains property with invalid name '$id'*");
+    }
+
+    [Fact]
+    public void ThrowWhenFormatIsNotSupported()
+    {
+        var path = CreateFile("data.txt", string.Empty);
+
+        var reading = () => DataSourceReader.ReadRows(path);
+
+        reading.Should().Throw<InvalidOperationException>();
+    }
+
+    private static async Task<List<DataRow>> ReadRows(string path)
+    {
+        List<DataRow> rows = [];
+        await foreach (var row in DataSourceReader.ReadRows(path))
+        {
+            rows.Add(row);
+        }
+
+        return rows;
+    }
+
+    private string CreateFile(string name, string content)
+    {
+        var path = Path.Combine(_folderPath, name);
+        File.WriteAllText(path, content);
+        return path;
+    }
+}
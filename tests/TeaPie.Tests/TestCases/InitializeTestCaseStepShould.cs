@@ -4,6 +4,7 @@ using TeaPie.StructureExploration;
 using TeaPie.TestCases;
 using TeaPie.Tests.Http;
 using TeaPie.Tests.Scripts;
+using TeaPie.Tracing;
 
 namespace TeaPie.Tests.TestCases;
 
@@ -39,7 +40,7 @@ public class InitializeTestCaseStepShould
             .Build();
 
         var pipeline = new ApplicationPipeline();
-        var step = new InitializeTestCaseStep(accessor, pipeline);
+        var step = new InitializeTestCaseStep(accessor, pipeline, new StepsTracer());
 
         pipeline.AddSteps(step);
         await step.Execute(appContext);
@@ -0,0 +1,150 @@
+﻿using FluentAssertions;
+using Microsoft.Extensions.DependencyInjection;
+using NSubstitute;
+using System.Collections.Concurrent;
+using System.Net;
+using TeaPie.Http;
+using TeaPie.Pipelines;
+using TeaPie.Reporting;
+using TeaPie.StructureExploration;
+using TeaPie.TestCases;
+using TeaPie.Testing;
+using File = System.IO.File;
+
+namespace TeaPie.Tests.TestCases;
+
+public class RunDataDrivenTestCaseStepShould
+{
+    private const string TestCaseName = "users";
+    private const string RequestsFileContent =
+        "## TEST-EXPECT-STATUS: [200]\nGET https://example.com/users/{{Id}}?name={{Name}}\n";
+
+    private readonly string _folderPath =
+        Path.Combine(Path.GetTempPath(), Constants.TeaPieFolderName, "tests", Guid.NewGuid().ToString());
+
+    private readonly ConcurrentQueue<Uri> _requestedUris = new();
+    private readonly ITestResultsSummaryReporter _reporter = Substitute.For<ITestResultsSummaryReporter>();
+    private Action? _onRequest;
+
+    [Fact]
+    public async Task ExecuteTestCaseOnceForEachRowWithItsValues()
+    {
+        var testCase = CreateTestCase("Id,Name\n1,John\n2,Jane\n3,Jack\n");
+        var appContext = CreateApplicationContext(out var pipeline);
+
+        await Run(pipeline, appContext, testCase);
+
+        _requestedUris.Select(uri => uri.PathAndQuery).Should().BeEquivalentTo(
+            "/users/1?name=John", "/users/2?name=Jane", "/users/3?name=Jack");
+
+        _reporter.Received(1).RegisterTestResult($"{TestCaseName} [1]", Arg.Any<TestResult>());
+        _reporter.Received(1).RegisterTestResult($"{TestCaseName} [2]", Arg.Any<TestResult>());
+        _reporter.Received(1).RegisterTestResult($"{TestCaseName} [3]", Arg.Any<TestResult>());
+        _reporter.DidNotReceive().RegisterTestResult(TestCaseName, Arg.Any<TestResult>());
+    }
+
+    [Fact]
+    public async Task ShareOnePlanByAllRows()
+    {
+        var testCase = CreateTestCase("Id,Name\n1,John\n2,Jane\n");
+        var appContext = CreateApplicationContext(out var pipeline);
+        var plans = new ConcurrentBag<TestCasePlan?>();
+        _onRequest = () => plans.Add(appContext.CurrentTestCase?.Plan);
+
+        await Run(pipeline, appContext, testCase);
+
+        plans.Should().HaveCount(2).And.NotContainNulls();
+        plans.Distinct().Should().ContainSingle()
+            .Which!.RequestsFileContent.Should().Be(RequestsFileContent);
+    }
+
+    [Fact]
+    public async Task ExecuteAllRowsOfDataSourceLargerThanOneBatch()
+    {
+        const int numberOfRows = RunDataDrivenTestCaseStep.BatchSize + 1;
+        var testCase = CreateTestCase(CreateCsvContent(numberOfRows));
+        var appContext = CreateApplicationContext(out var pipeline);
+
+        await Run(pipeline, appContext, testCase);
+
+        _requestedUris.Should().HaveCount(numberOfRows);
+        _reporter.Received(1).RegisterTestResult($"{TestCaseName} [{numberOfRows}]", Arg.Any<TestResult>());
+    }
+
+    [Fact]
+    public async Task NotExecuteNextBatchAfterPrematureTermination()
+    {
+        var testCase = CreateTestCase(CreateCsvContent(RunDataDrivenTestCaseStep.BatchSize + 1));
+        var appContext = CreateApplicationContext(out var pipeline);
+        var termination = new PrematureTermination("Test", TerminationType.UserAction);
+        _onRequest = () => appContext.PrematureTermination = termination;
+
+        await Run(pipeline, appContext, testCase);
+
+        _requestedUris.Should().HaveCountLessThanOrEqualTo(RunDataDrivenTestCaseStep.BatchSize);
+    }
+
+    private static async Task Run(IPipeline pipeline, ApplicationContext appContext, TestCase testCase)
+    {
+        var testCaseExecutionContext = new TestCaseExecutionContext(testCase);
+        pipeline.AddSteps(TestCaseStepsFactory.CreateStepsForDataDrivenTestCase(
+            appContext.ServiceProvider, testCaseExecutionContext));
+
+        await pipeline.Run(appContext);
+    }
+
+    private ApplicationContext CreateApplicationContext(out IPipeline pipeline)
+    {
+        var services = new ServiceCollection();
+        services.AddTeaPie(true, () => { });
+        services.AddSingleton(_reporter);
+        services.AddHttpClient(nameof(ExecuteRequestStep))
+            .ConfigurePrimaryHttpMessageHandler(() => new RecordingHttpMessageHandler(request =>
+            {
+                _requestedUris.Enqueue(request.RequestUri!);
+                _onRequest?.Invoke();
+            }));
+
+        var provider = services.BuildServiceProvider();
+        pipeline = provider.GetRequiredService<IPipeline>();
+
+        return new ApplicationContextBuilder()
+            .WithPath(_folderPath)
+            .WithServiceProvider(provider)
+            .Build();
+    }
+
+    private TestCase CreateTestCase(string dataSourceContent)
+    {
+        Directory.CreateDirectory(_folderPath);
+        var folder = new Folder(_folderPath, string.Empty, Path.GetFileName(_folderPath));
+
+        var requestsFilePath = Path.Combine(
+            _folderPath, TestCaseName + Constants.RequestSuffix + Constants.RequestFileExtension);
+        File.WriteAllText(requestsFilePath, RequestsFileContent);
+
+        var dataSourcePath = Path.Combine(
+            _folderPath, TestCaseName + Constants.DataSourceSuffix + Constants.CsvDataSourceFileExtension);
+        File.WriteAllText(dataSourcePath, dataSourceContent);
+
+        return new TestCase(InternalFile.Create(requestsFilePath, folder))
+        {
+            DataSource = new global::TeaPie.StructureExploration.File(dataSourcePath, Path.GetFileName(dataSourcePath))
+        };
+    }
+
+    private static string CreateCsvContent(int numberOfRows)
+        => "Id,Name\n" + string.Join('\n', Enumerable.Range(1, numberOfRows).Select(i => $"{i},Name{i}"));
+
+    private class RecordingHttpMessageHandler(Action<HttpRequestMessage> onRequest) : HttpMessageHandler
+    {
+        private readonly Action<HttpRequestMessage> _onRequest = onRequest;
+
+        protected override Task<HttpResponseMessage> SendAsync(
+            HttpRequestMessage request, CancellationToken cancellationToken)
+        {
+            _onRequest(request);
+            return Task.FromResult(new HttpResponseMessage(HttpStatusCode.OK) { RequestMessage = request });
+        }
+    }
+}
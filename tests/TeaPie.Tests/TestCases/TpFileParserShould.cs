@@ -416,4 +416,48 @@ public class TpFileParserShould
         Contains("SecondRequest", result[0].HttpContent);
         Contains("###", result[0].HttpContent);
     }
+
+    [Fact]
+    public void ParseDataSourceOfTestCase()
+    {
+        var content = """
+            --- TESTCASE With Data
+            --- DATA ./data/customers.csv
+
+            --- HTTP
+            POST {{ApiBaseUrl}}/customers
+
+            --- END
+
+            --- TESTCASE Without Data
+
+            --- HTTP
+            GET {{ApiBaseUrl}}/customers
+
+            --- END
+            """;
+
+        var context = new TpParsingContext(content, "fallback");
+        _parser.Parse(context);
+        var result = context.Definitions;
+
+        Equal(2, result.Count);
+        Equal("./data/customers.csv", result[0].DataSourcePath);
+        DoesNotContain("DATA", result[0].HttpContent);
+        Null(result[1].DataSourcePath);
+    }
+
+    [Fact]
+    public void ThrowWhenDataSourcePathIsMissing()
+    {
+        var content = """
+            --- DATA
+
+            --- HTTP
+            GET {{ApiBaseUrl}}/customers
+            """;
+
+        var ex = Throws<InvalidOperationException>(() => _parser.Parse(new TpParsingContext(content, "fallback")));
+        Contains(TpConstants.DataMarker, ex.Message);
+    }
 }
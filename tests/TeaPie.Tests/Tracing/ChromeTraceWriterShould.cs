@@ -0,0 +1,74 @@
+﻿using FluentAssertions;
+using System.Diagnostics;
+using System.Text.Json;
+using TeaPie.Tracing;
+
+namespace TeaPie.Tests.Tracing;
+
+public class ChromeTraceWriterShould
+{
+    [Fact]
+    public async Task WriteCompleteEventForEveryActivity()
+    {
+        var start = new DateTime(2025, 1, 1, 12, 0, 0, DateTimeKind.Utc);
+        var run = CreateActivity("Run", start, TimeSpan.FromMilliseconds(100));
+        var step = CreateActivity("ExecuteRequestStep", start.AddMilliseconds(10), TimeSpan.FromMilliseconds(20));
+        step.SetTag(TeaPieTelemetry.StepTagName, "ExecuteRequestStep");
+
+        var events = await Write(run, step);
+
+        var completeEvents = events.Where(e => e.GetProperty("ph").GetString() == "X").ToList();
+        completeEvents.Should().HaveCount(2);
+        completeEvents[0].GetProperty("name").GetString().Should().Be("Run");
+        completeEvents[0].GetProperty("ts").GetDouble().Should().Be(0);
+        completeEvents[0].GetProperty("dur").GetDouble().Should().Be(100_000);
+        completeEvents[1].GetProperty("cat").GetString().Should().Be("step");
+        completeEvents[1].GetProperty("ts").GetDouble().Should().Be(10_000);
+        completeEvents[1].GetProperty("args").GetProperty(TeaPieTelemetry.StepTagName).GetString()
+            .Should().Be("ExecuteRequestStep");
+    }
+
+    [Fact]
+    public async Task PutOverlappingTestCasesToDifferentLanes()
+    {
+        var start = new DateTime(2025, 1, 1, 12, 0, 0, DateTimeKind.Utc);
+        var first = CreateTestCase("First", start, TimeSpan.FromMilliseconds(50));
+        var second = CreateTestCase("Second", start.AddMilliseconds(10), TimeSpan.FromMilliseconds(50));
+        var third = CreateTestCase("Third", start.AddMilliseconds(70), TimeSpan.FromMilliseconds(50));
+
+        var events = await Write(first, second, third);
+
+        var lanes = events
+            .Where(e => e.GetProperty("ph").GetString() == "X")
+            .ToDictionary(e => e.GetProperty("name").GetString()!, e => e.GetProperty("tid").GetInt32());
+
+        lanes["First"].Should().NotBe(lanes["Second"]);
+        lanes["Third"].Should().Be(lanes["First"]);
+    }
+
+    private static async Task<List<JsonElement>> Write(params Activity[] activities)
+    {
+        using var stream = new MemoryStream();
+        await ChromeTraceWriter.Write(stream, activities);
+
+        using var document = JsonDocument.Parse(stream.ToArray());
+        return [.. document.RootElement.GetProperty("traceEvents").EnumerateArray().Select(e => e.Clone())];
+    }
+
+    private static Activity CreateTestCase(string name, DateTime start, TimeSpan duration)
+    {
+        var activity = CreateActivity(name, start, duration);
+        activity.SetTag(TeaPieTelemetry.ScopeTagName, "Test case");
+        return activity;
+    }
+
+    private static Activity CreateActivity(string name, DateTime start, TimeSpan duration)
+    {
+        var activity = new Activity(name);
+        activity.SetStartTime(start);
+        activity.Start();
+        activity.SetEndTime(start + duration);
+        activity.Stop();
+        return activity;
+    }
+}
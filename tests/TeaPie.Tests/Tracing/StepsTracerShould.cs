@@ -0,0 +1,103 @@
+﻿using FluentAssertions;
+using NSubstitute;
+using System.Diagnostics;
+using TeaPie.Pipelines;
+using TeaPie.Tracing;
+
+namespace TeaPie.Tests.Tracing;
+
+[Collection(nameof(NonParallelCollection))]
+public class StepsTracerShould
+{
+    [Fact]
+    public async Task MeasureExclusiveTimeOfSteps()
+    {
+        var tracer = new StepsTracer();
+        var outerStep = Substitute.For<IPipelineStep>();
+        var innerStep = new InlineStep((_, _) => Task.CompletedTask);
+
+        await tracer.Trace(outerStep, async () =>
+        {
+            await tracer.Trace(innerStep, async () => await Task.Delay(100));
+        });
+
+        var timings = tracer.GetSlowestSteps(10);
+
+        timings.Should().HaveCount(2);
+        var inner = timings.Single(t => t.StepName == nameof(InlineStep));
+        var outer = timings.Single(t => t.StepName != nameof(InlineStep));
+        inner.NumberOfExecutions.Should().Be(1);
+        inner.TotalMs.Should().BeGreaterThanOrEqualTo(90);
+        outer.TotalMs.Should().BeLessThan(inner.TotalMs);
+    }
+
+    [Fact]
+    public async Task OrderStepsFromTheSlowest()
+    {
+        var tracer = new StepsTracer();
+        var fastStep = Substitute.For<IPipelineStep>();
+        var slowStep = new InlineStep((_, _) => Task.CompletedTask);
+
+        await tracer.Trace(fastStep, () => Task.CompletedTask);
+        await tracer.Trace(slowStep, async () => await Task.Delay(50));
+        await tracer.Trace(slowStep, async () => await Task.Delay(50));
+
+        var timings = tracer.GetSlowestSteps(1);
+
+        timings.Should().ContainSingle();
+        timings[0].StepName.Should().Be(nameof(InlineStep));
+        timings[0].NumberOfExecutions.Should().Be(2);
+    }
+
+    [Fact]
+    public async Task NestStepsUnderScopeWhichIsOpenedWithinStep()
+    {
+        var activities = new List<Activity>();
+        using var listener = CreateListener(activities);
+
+        var tracer = new StepsTracer();
+        var step = new InlineStep((_, _) => Task.CompletedTask);
+        IDisposable? scope = null;
+
+        await tracer.Trace(step, () =>
+        {
+            scope = tracer.BeginScope("Test case", "AddCustomer");
+            return Task.CompletedTask;
+        });
+        await tracer.Trace(step, () => Task.CompletedTask);
+        await tracer.Trace(step, () =>
+        {
+            scope!.Dispose();
+            return Task.CompletedTask;
+        });
+
+        var scopeActivity = activities.Single(a => a.DisplayName == "Test case: AddCustomer");
+        var steps = activities.Where(a => a.OperationName == nameof(InlineStep)).ToList();
+
+        steps.Should().HaveCount(3);
+        steps[1].ParentSpanId.Should().Be(scopeActivity.SpanId);
+        steps[2].ParentSpanId.Should().Be(scopeActivity.SpanId);
+        scopeActivity.StartTimeUtc.Should().Be(steps[0].StartTimeUtc);
+        (scopeActivity.StartTimeUtc + scopeActivity.Duration).Should()
+            .BeOnOrAfter(steps[2].StartTimeUtc + steps[2].Duration);
+    }
+
+    private static ActivityListener CreateListener(List<Activity> activities)
+    {
+        var listener = new ActivityListener()
+        {
+            ShouldListenTo = source => source.Name == TeaPieTelemetry.Name,
+            Sample = (ref ActivityCreationOptions<ActivityContext> _) => ActivitySamplingResult.AllDataAndRecorded,
+            ActivityStopped = activity =>
+            {
+                lock (activities)
+                {
+                    activities.Add(activity);
+                }
+            }
+        };
+
+        ActivitySource.AddActivityListener(listener);
+        return listener;
+    }
+}
@@ -11,17 +11,17 @@ public class VariablesResolverShould
     private const string VariableName = "MyVariable";
 
     [Fact]
-    public void ReturnSameLineIfLineDoesntContainAnyVariableNotation()
+    public async Task ReturnSameLineIfLineDoesntContainAnyVariableNotation()
     {
         const string line = "Console.Writeline(\"Hello World!\");";
         var resolver = new VariablesResolver(Substitute.For<IVariables>(), Substitute.For<IServiceProvider>());
         var context = GetRequestExecutionContextMock();
 
-        resolver.ResolveVariablesInLine(line, context).Should().BeEquivalentTo(line);
+        (await resolver.ResolveVariablesInLine(line, context)).Should().BeEquivalentTo(line);
     }
 
     [Fact]
-    public void ReturnSameLineIfVariableNameViolatesNamingConventions()
+    public async Task ReturnSameLineIfVariableNameViolatesNamingConventions()
     {
         const string invalidVariableName = "My<Variable>";
         var line = "Console.Writeline(" + GetVariableNotation(invalidVariableName) + ");";
@@ -29,22 +29,22 @@ public class VariablesResolverShould
 
         var resolver = new VariablesResolver(Substitute.For<IVariables>(), Substitute.For<IServiceProvider>());
 
-        resolver.ResolveVariablesInLine(line, context).Should().BeEquivalentTo(line);
+        (await resolver.ResolveVariablesInLine(line, context)).Should().BeEquivalentTo(line);
     }
 
     [Fact]
-    public void ThrowProperExceptionWhenAttemptingToResolveNonExistingVariable()
+    public async Task ThrowProperExceptionWhenAttemptingToResolveNonExistingVariable()
     {
         var line = "Console.Writeline(" + GetVariableNotation(VariableName) + ");";
         var context = GetRequestExecutionContextMock();
 
         var resolver = new VariablesResolver(Substitute.For<IVariables>(), Substitute.For<IServiceProvider>());
 
-        resolver.Invoking(r => r.ResolveVariablesInLine(line, context)).Should().Throw<InvalidOperationException>();
+        await resolver.Awaiting(r => r.ResolveVariablesInLine(line, context)).Should().ThrowAsync<InvalidOperationException>();
     }
 
     [Fact]
-    public void ResolveSingleVariableInSingleLineCorrectly()
+    public async Task ResolveSingleVariableInSingleLineCorrectly()
     {
         const string variableValue = "Hello World!";
         var line = "Console.Writeline(" + GetVariableNotation(VariableName) + ");";
@@ -55,11 +55,11 @@ public class VariablesResolverShould
         var context = GetRequestExecutionContextMock();
 
         variables.SetVariable(VariableName, variableValue);
-        resolver.ResolveVariablesInLine(line, context).Should().BeEquivalentTo(resolvedLine);
+        (await resolver.ResolveVariablesInLine(line, context)).Should().BeEquivalentTo(resolvedLine);
     }
 
     [Fact]
-    public void ResolveClassVariableAsItsStringRepresentation()
+    public async Task ResolveClassVariableAsItsStringRepresentation()
     {
         DummyPerson variableValue = new(0, "Joseph Carrot");
         var line = "Console.Writeline(" + GetVariableNotation(VariableName) + ");";
@@ -70,11 +70,11 @@ public class VariablesResolverShould
         var context = GetRequestExecutionContextMock();
 
         variables.SetVariable(VariableName, variableValue);
-        resolver.ResolveVariablesInLine(line, context).Should().BeEquivalentTo(resolvedLine);
+        (await resolver.ResolveVariablesInLine(line, context)).Should().BeEquivalentTo(resolvedLine);
     }
 
     [Fact]
-    public void ResolveVariableWithNullValueAsNullString()
+    public async Task ResolveVariableWithNullValueAsNullString()
     {
         DummyPerson? variableValue = null;
         var line = "Console.Writeline(" + GetVariableNotation(VariableName) + ");";
@@ -85,11 +85,11 @@ public class VariablesResolverShould
         var context = GetRequestExecutionContextMock();
 
         variables.SetVariable(VariableName, variableValue);
-        resolver.ResolveVariablesInLine(line, context).Should().BeEquivalentTo(resolvedLine);
+        (await resolver.ResolveVariablesInLine(line, context)).Should().BeEquivalentTo(resolvedLine);
     }
 
     [Fact]
-    public void ResolveMultipleVariablesInSingleLineCorrectly()
+    public async Task ResolveMultipleVariablesInSingleLineCorrectly()
     {
         const int count = 10;
         var lineBuilder = new StringBuilder();
@@ -114,7 +114,7 @@ public class VariablesResolverShould
             variables.SetVariable(variablesNames[i], variablesValues[i]);
         }
 
-        resolver.ResolveVariablesInLine(lineBuilder.ToString(), context).Should().BeEquivalentTo(resolvedLineBuilder.ToString());
+        (await resolver.ResolveVariablesInLine(lineBuilder.ToString(), context)).Should().BeEquivalentTo(resolvedLineBuilder.ToString());
     }
 
     private static RequestExecutionContext GetRequestExecutionContextMock() => new(null!, null);
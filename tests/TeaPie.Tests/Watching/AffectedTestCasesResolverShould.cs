@@ -0,0 +1,94 @@
+﻿using FluentAssertions;
+using TeaPie.StructureExploration;
+using TeaPie.StructureExploration.Paths;
+using TeaPie.Watching;
+
+namespace TeaPie.Tests.Watching;
+
+public class AffectedTestCasesResolverShould
+{
+    private readonly string _rootPath;
+    private readonly AffectedTestCasesResolver _resolver;
+
+    public AffectedTestCasesResolverShould()
+    {
+        _rootPath = Path.Combine(Path.GetTempPath(), Constants.TeaPieFolderName, "tests", Guid.NewGuid().ToString());
+        Directory.CreateDirectory(_rootPath);
+
+        var pathProvider = new PathProvider();
+        pathProvider.UpdatePaths(_rootPath, _rootPath);
+        _resolver = new AffectedTestCasesResolver(new StructureIndex(pathProvider, new PathResolver(pathProvider)));
+    }
+
+    [Fact]
+    public void ResolveTestCaseOfChangedScript()
+    {
+        var files = CreateFiles(("a-req.http", ""), ("a-init.csx", ""), ("b-req.http", ""));
+
+        _resolver.TryResolve(files, [], [GetPath("a-init.csx")], out var testCasesFiles).Should().BeTrue();
+
+        testCasesFiles.Should().Equal(GetPath("a-req.http"));
+    }
+
+    [Fact]
+    public void ResolveTestCasesDependingTransitivelyOnChangedScript()
+    {
+        var files = CreateFiles(
+            ("a-req.http", ""),
+            ("a-test.csx", "#load \"./common.csx\""),
+            ("b-req.http", ""),
+            ("b-test.csx", ""),
+            ("common.csx", "#load \"./helper.csx\""),
+            ("helper.csx", ""));
+
+        _resolver.TryResolve(files, [], [GetPath("helper.csx")], out var testCasesFiles).Should().BeTrue();
+
+        testCasesFiles.Should().Equal(GetPath("a-req.http"));
+    }
+
+    [Fact]
+    public void ResolveNoTestCaseWhenUnreferencedScriptChanged()
+    {
+        var files = CreateFiles(("a-req.http", ""), ("unused.csx", ""));
+
+        _resolver.TryResolve(files, [], [GetPath("unused.csx")], out var testCasesFiles).Should().BeTrue();
+
+        testCasesFiles.Should().BeEmpty();
+    }
+
+    [Fact]
+    public void ResolveTestCasesOfChangedDataSource()
+    {
+        var files = CreateFiles(
+            ("a-req.http", ""),
+            ("a-data.csv", ""),
+            ("b.tp", "--- DATA ./shared.jsonl\n--- HTTP\nGET https://example.com"),
+            ("c-req.http", ""),
+            ("shared.jsonl", ""));
+
+        _resolver.TryResolve(files, [], [GetPath("a-data.csv"), GetPath("shared.jsonl")], out var testCasesFiles)
+            .Should().BeTrue();
+
+        testCasesFiles.Should().Equal(GetPath("a-req.http"), GetPath("b.tp"));
+    }
+
+    [Fact]
+    public void AffectAllTestCasesWhenSharedFileDependencyChanged()
+    {
+        var files = CreateFiles(("a-req.http", ""), ("init.csx", "#load \"./helper.csx\""), ("helper.csx", ""));
+
+        _resolver.TryResolve(files, [GetPath("init.csx")], [GetPath("helper.csx")], out _).Should().BeFalse();
+    }
+
+    private List<string> CreateFiles(params (string Name, string Content)[] files)
+    {
+        foreach (var (name, content) in files)
+        {
+            File.WriteAllText(GetPath(name), content);
+        }
+
+        return [.. files.Select(file => GetPath(file.Name))];
+    }
+
+    private string GetPath(string name) => Path.Combine(_rootPath, name);
+}
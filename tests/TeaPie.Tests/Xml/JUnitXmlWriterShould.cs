@@ -122,6 +122,27 @@ public class JUnitXmlWriterShould
         NotNull(skippedElement);
     }
 
+    [Fact]
+    public void WritePropertiesOfTestCase()
+    {
+        using (var writer = new JUnitXmlWriter(TestFilePath))
+        {
+            writer.WriteTestSuitesRoot();
+            writer.WriteTestSuite("SuiteF", totalTests: 1);
+            writer.WriteTestCase("Tests", "MeasuredTest", 10, skipped: false,
+                properties: new Dictionary<string, string>() { ["p99"] = "12.5" });
+            writer.EndTestSuite();
+            writer.EndTestSuitesRoot();
+        }
+
+        var doc = XDocument.Load(TestFilePath);
+        var property = doc.Descendants("testcase").Elements("properties").Elements("property").SingleOrDefault();
+
+        NotNull(property);
+        Equal("p99", property.Attribute("name")?.Value);
+        Equal("12.5", property.Attribute("value")?.Value);
+    }
+
     [Fact]
     public void EnsureTimeFormatUsesDotAsDecimalSeparator()
     {